@@ -0,0 +1,54 @@
+"""Ripple Pulse: per-contact fact table.
+
+New table: pulse_contact_facts, backfilled for every existing contact so
+the first Pulse requests after the upgrade don't rebuild it.
+
+Revision ID: 011_pulse_facts
+Revises: 010_rep_bias
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "011_pulse_facts"
+down_revision = "010_rep_bias"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pulse_contact_facts",
+        sa.Column("contact_id", UUID(as_uuid=True), sa.ForeignKey("contacts.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("last_interaction_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("open_deal_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("open_deal_value", sa.Float, nullable=False, server_default="0"),
+        sa.Column("last_won_value", sa.Float, nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_pulse_contact_facts_last_interaction_at", "pulse_contact_facts", ["last_interaction_at"])
+    # Same figures as app.services.pulse_facts._build_facts
+    op.execute("""
+        INSERT INTO pulse_contact_facts
+            (contact_id, last_interaction_at, open_deal_count, open_deal_value, last_won_value, refreshed_at)
+        SELECT
+            c.id,
+            (SELECT max(i.occurred_at) FROM interactions i WHERE i.contact_id = c.id),
+            coalesce(o.n, 0),
+            coalesce(o.value, 0),
+            (SELECT d.value FROM deals d
+              WHERE d.contact_id = c.id AND d.stage = 'closed_won'
+              ORDER BY d.actual_close_date DESC NULLS LAST LIMIT 1),
+            now()
+        FROM contacts c
+        LEFT JOIN (
+            SELECT contact_id, count(*) AS n, sum(value) AS value FROM deals
+             WHERE is_deleted = false AND stage NOT IN ('closed_won', 'closed_lost')
+             GROUP BY contact_id
+        ) o ON o.contact_id = c.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("pulse_contact_facts")
@@ -0,0 +1,39 @@
+"""Indexes for CSV import duplicate detection.
+
+Expression indexes on the normalised keys the contact import dedupes
+against (lower/trimmed email, first + last name, company name), so each
+import chunk is checked with index lookups instead of loading every contact.
+
+Revision ID: 012_import_dedupe
+Revises: 011_pulse_facts
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "012_import_dedupe"
+down_revision = "011_pulse_facts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_contacts_email_norm", "contacts", [sa.text("lower(trim(email))")],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.create_index(
+        "ix_contacts_name_norm", "contacts",
+        [sa.text("lower(trim(first_name))"), sa.text("lower(trim(last_name))")],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.create_index(
+        "ix_companies_name_lower", "companies", [sa.text("lower(name)")],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_companies_name_lower", table_name="companies")
+    op.drop_index("ix_contacts_name_norm", table_name="contacts")
+    op.drop_index("ix_contacts_email_norm", table_name="contacts")
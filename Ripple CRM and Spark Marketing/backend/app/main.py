@@ -27,6 +27,7 @@ from app.routers import (
     health,
     import_export,
     interactions,
+    jobs,
     lead_scoring,
     meetings,
     notes,
@@ -83,6 +84,7 @@ app.include_router(validation.router, prefix="/api")
 app.include_router(audit.router, prefix="/api")
 # Phase 2: Intelligence
 app.include_router(tags.router, prefix="/api")
+app.include_router(jobs.router, prefix="/api")
 app.include_router(lead_scoring.router, prefix="/api")
 app.include_router(lead_scoring.contact_router, prefix="/api")
 app.include_router(channel_dna.router, prefix="/api")
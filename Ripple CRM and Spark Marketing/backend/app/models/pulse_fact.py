@@ -0,0 +1,29 @@
+"""Ripple CRM — Pulse contact fact model.
+
+One row per contact holding the figures Pulse would otherwise recompute
+per deal and per customer on every compile. Rows are dropped whenever an
+interaction or deal for the contact changes and rebuilt on the next
+refresh (see app.services.pulse_facts).
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class PulseContactFact(Base):
+    __tablename__ = "pulse_contact_facts"
+
+    contact_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="CASCADE"), primary_key=True)
+    last_interaction_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
+    open_deal_count: Mapped[int] = mapped_column(Integer, default=0)
+    open_deal_value: Mapped[float] = mapped_column(Float, default=0)
+    last_won_value: Mapped[float | None] = mapped_column(Float)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -1,26 +1,53 @@
 """Ripple CRM — Import/Export API routes.
 
 CSV import (with duplicate detection) and export for contacts, companies, and deals.
+
+Contact imports stream the upload: rows are parsed incrementally, checked
+for duplicates a chunk at a time against indexed lookups on normalised
+email and name, and written with one bulk INSERT and commit per chunk, so
+memory stays flat however large the file is. Large imports can run in the
+background (background=true) and report progress through /api/jobs.
+
+Exports stream too: rows are selected column-wise through a server-side
+cursor and sent as CSV or NDJSON (optionally gzipped) chunk by chunk, so a
+download starts at once and memory stays constant.
 """
 
+import codecs
 import csv
 import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
 import uuid
-from datetime import datetime, timezone
+import zlib
+from datetime import date, datetime, timezone
+from itertools import chain, islice
+from typing import AsyncIterator, BinaryIO, Iterable, Iterator
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.database import async_session, get_db
 from app.models.company import Company
 from app.models.contact import Contact
 from app.models.deal import Deal
-from app.services.audit import log_action
+from app.services.audit import log_actions
+from app.services.jobs import list_jobs, start_job
+
+log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/import-export", tags=["import-export"])
 
+IMPORT_CHUNK = 1000  # rows deduped, inserted and committed together
+PREVIEW_ROWS = 500  # row details returned in the response; counts cover every row
+READ_BLOCK = 64 * 1024
+
 # ---------------------------------------------------------------------------
 # Header mapping — normalise common CSV column names to model field names
 # ---------------------------------------------------------------------------
@@ -65,59 +92,225 @@ def _normalise_headers(raw_headers: list[str], mapping: dict[str, str]) -> dict[
     return result
 
 
-def _parse_csv_bytes(raw: bytes) -> list[dict[str, str]]:
-    """Decode uploaded bytes and return a list of row dicts (keys are raw headers)."""
-    # Try UTF-8 first, fall back to latin-1 (handles most Windows CSVs)
-    try:
-        text = raw.decode("utf-8-sig")
-    except UnicodeDecodeError:
-        text = raw.decode("latin-1")
-
-    reader = csv.reader(io.StringIO(text))
-    rows = list(reader)
-    if len(rows) < 2:
-        return []
-
-    headers = rows[0]
-    result = []
-    for row in rows[1:]:
-        if not any(cell.strip() for cell in row):
-            continue  # skip blank rows
-        entry: dict[str, str] = {}
-        for idx, value in enumerate(row):
-            if idx < len(headers):
-                entry[headers[idx]] = value.strip()
-        result.append(entry)
-    return result
+def _sniff_upload(f: BinaryIO) -> tuple[str, int]:
+    """Return (encoding, line count) for an upload, reading it once in blocks.
+
+    UTF-8 when the whole file decodes as UTF-8, otherwise latin-1 (handles
+    most Windows CSVs). Rewinds the file afterwards.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    encoding, lines = "utf-8-sig", 0
+    f.seek(0)
+    for block in iter(lambda: f.read(READ_BLOCK), b""):
+        lines += block.count(b"\n")
+        if encoding != "latin-1":
+            try:
+                decoder.decode(block)
+            except UnicodeDecodeError:
+                encoding = "latin-1"
+    if encoding != "latin-1":
+        try:
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            encoding = "latin-1"
+    f.seek(0)
+    return encoding, lines
+
+
+def _iter_csv(
+    f: BinaryIO, mapping: dict[str, str], encoding: str | None = None
+) -> tuple[set[str], Iterator[dict[str, str]]] | None:
+    """Stream an upload as normalised row dicts (keys are model field names).
+
+    Returns (mapped_fields, rows), or None when the file has no data rows.
+    Blank rows are skipped and values are stripped.
+    """
+    if encoding is None:
+        encoding, _ = _sniff_upload(f)
+    decoder = codecs.getincrementaldecoder(encoding)()
+    reader = csv.reader(decoder.decode(line) for line in f)
+    headers = next(reader, None)
+    rows = (row for row in reader if any(cell.strip() for cell in row))
+    first = next(rows, None)
+    if headers is None or first is None:
+        return None
+
+    col_map = _normalise_headers(headers, mapping)
+
+    def mapped() -> Iterator[dict[str, str]]:
+        for row in chain([first], rows):
+            yield {field: row[idx].strip() if idx < len(row) else "" for idx, field in col_map.items()}
+
+    return set(col_map.values()), mapped()
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
 
 
 # ---------------------------------------------------------------------------
 # Contact import
 # ---------------------------------------------------------------------------
 
+_EMAIL_KEY = func.lower(func.trim(Contact.email))
+_FIRST_KEY = func.lower(func.trim(Contact.first_name))
+_LAST_KEY = func.lower(func.trim(Contact.last_name))
+
+
+async def _existing_contact_keys(db: AsyncSession, chunk: list[dict]) -> tuple[set[str], set[tuple[str, str]]]:
+    """Normalised emails and names among a chunk that non-deleted contacts already use."""
+    emails = {row.get("email", "").lower() for row in chunk} - {""}
+    names = {(row.get("first_name", "").lower(), row.get("last_name", "").lower()) for row in chunk}
+    found_emails: set[str] = set()
+    if emails:
+        result = await db.execute(
+            select(_EMAIL_KEY).where(Contact.is_deleted == False, _EMAIL_KEY.in_(emails))  # noqa: E712
+        )
+        found_emails = set(result.scalars().all())
+    # Two IN lists keep the (first, last) index usable; exact pairs are checked here
+    result = await db.execute(
+        select(_FIRST_KEY, _LAST_KEY).where(
+            Contact.is_deleted == False,  # noqa: E712
+            _FIRST_KEY.in_({first for first, _ in names}),
+            _LAST_KEY.in_({last for _, last in names}),
+        )
+    )
+    return found_emails, names.intersection(tuple(r) for r in result.all())
+
+
+async def _company_ids(db: AsyncSession, chunk: list[dict]) -> dict[str, uuid.UUID]:
+    """Lower-cased company name → id for the company names in a chunk."""
+    names = {row.get("company_name", "").lower() for row in chunk} - {""}
+    if not names:
+        return {}
+    result = await db.execute(
+        select(func.lower(Company.name), Company.id).where(
+            func.lower(Company.name).in_(names),
+            Company.is_deleted == False,  # noqa: E712
+        )
+    )
+    ids: dict[str, uuid.UUID] = {}
+    for name, company_id in result.all():
+        ids.setdefault(name, company_id)
+    return ids
+
+
+async def _import_contact_rows(
+    db: AsyncSession, rows: Iterable[dict], commit: bool, job=None
+) -> tuple[dict, list[dict]]:
+    """Dedupe (and with commit, insert) contact rows a chunk at a time.
+
+    Returns the summary counts and the first PREVIEW_ROWS row details.
+    """
+    started = time.perf_counter()
+    preview: list[dict] = []
+    total = imported_count = duplicate_count = 0
+
+    for chunk in _chunks(rows, IMPORT_CHUNK):
+        email_set, name_set = await _existing_contact_keys(db, chunk)
+        companies = await _company_ids(db, chunk) if commit else {}
+        new_contacts: list[dict] = []
+
+        for row in chunk:
+            first = row.get("first_name", "")
+            last = row.get("last_name", "")
+            email = row.get("email", "")
+            name_key = (first.lower(), last.lower())
+
+            is_duplicate = False
+            duplicate_reason = None
+
+            # Case-insensitive exact email match
+            if email and email.lower() in email_set:
+                is_duplicate = True
+                duplicate_reason = f"Email '{email}' already exists"
+            # First + last name match
+            elif name_key in name_set:
+                is_duplicate = True
+                duplicate_reason = f"Name '{first} {last}' already exists"
+
+            if is_duplicate:
+                duplicate_count += 1
+
+            if commit and not is_duplicate:
+                # Company is linked only if it already exists — we don't auto-create companies here
+                new_contacts.append({
+                    "id": uuid.uuid4(),
+                    "first_name": first,
+                    "last_name": last,
+                    "email": email or None,
+                    "phone": row.get("phone") or None,
+                    "role": row.get("role") or None,
+                    "type": row.get("type") or "lead",
+                    "source": row.get("source") or "csv_import",
+                    "company_id": companies.get(row.get("company_name", "").lower()),
+                })
+                # Later rows in the same chunk must see this one; later chunks find it in the database
+                if email:
+                    email_set.add(email.lower())
+                name_set.add(name_key)
+
+            if len(preview) < PREVIEW_ROWS:
+                preview.append({
+                    "row_data": row,
+                    "is_duplicate": is_duplicate,
+                    "duplicate_reason": duplicate_reason,
+                    "action": "skip" if is_duplicate else "import",
+                })
+
+        if new_contacts:
+            # render_nulls keeps every row in one executemany batch; by default the
+            # ORM splits batches wherever the set of None columns changes
+            await db.execute(insert(Contact).execution_options(render_nulls=True), new_contacts)
+            await log_actions(db, "contact", [c["id"] for c in new_contacts], "create")
+            await db.commit()
+            imported_count += len(new_contacts)
+
+        total += len(chunk)
+        if job is not None:
+            job.advance(len(chunk))
+            job.total = max(job.total, job.done)
+        elapsed = time.perf_counter() - started
+        log.info("Contact import: %d rows checked, %d imported (%.0f rows/s)",
+                 total, imported_count, total / elapsed if elapsed else 0)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "total_rows": total,
+        "duplicates": duplicate_count,
+        "to_import": total - duplicate_count,
+        "imported": imported_count if commit else 0,
+        "committed": commit,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_sec": round(total / elapsed) if elapsed else None,
+        "rows_truncated": total > len(preview),
+    }, preview
+
+
 @router.post("/import/contacts")
 async def import_contacts(
+    response: Response,
     file: UploadFile = File(...),
     commit: bool = Query(False, description="Set to true to actually import; false for preview"),
+    background: bool = Query(False, description="With commit, run as a background job and poll /api/jobs"),
     db: AsyncSession = Depends(get_db),
 ):
     """Import contacts from a CSV file.
 
     With commit=false (default), returns a preview with duplicate detection.
     With commit=true, creates the contact records in the database.
+    Only the first PREVIEW_ROWS rows are listed under "rows"; counts cover the whole file.
+    With commit=true&background=true, returns 202 and the job to poll instead.
     """
     if not file.filename or not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are accepted")
 
-    raw = await file.read()
-    raw_rows = _parse_csv_bytes(raw)
-    if not raw_rows:
+    parsed = _iter_csv(file.file, CONTACT_HEADER_MAP)
+    if parsed is None:
         raise HTTPException(status_code=400, detail="CSV file is empty or has no data rows")
-
-    # Build header mapping from raw keys
-    raw_headers = list(raw_rows[0].keys())
-    col_map = _normalise_headers(raw_headers, CONTACT_HEADER_MAP)
-    mapped_fields = set(col_map.values())
+    mapped_fields, rows = parsed
 
     if "first_name" not in mapped_fields or "last_name" not in mapped_fields:
         raise HTTPException(
@@ -125,111 +318,37 @@ async def import_contacts(
             detail="CSV must contain at least first_name and last_name columns",
         )
 
-    # Map rows to normalised dicts
-    mapped_rows: list[dict[str, str]] = []
-    for raw_row in raw_rows:
-        mapped: dict[str, str] = {}
-        for idx, raw_header in enumerate(raw_headers):
-            if idx in col_map:
-                mapped[col_map[idx]] = raw_row.get(raw_header, "")
-        mapped_rows.append(mapped)
-
-    # Fetch existing contacts for duplicate detection (non-deleted only)
-    result = await db.execute(select(Contact).where(Contact.is_deleted == False))  # noqa: E712
-    existing_contacts = result.scalars().all()
-
-    # Build lookup structures for fuzzy matching
-    email_set: set[str] = set()
-    name_set: set[str] = set()
-    for c in existing_contacts:
-        if c.email:
-            email_set.add(c.email.strip().lower())
-        name_key = f"{(c.first_name or '').strip().lower()}|{(c.last_name or '').strip().lower()}"
-        name_set.add(name_key)
-
-    # Analyse each row for duplicates
-    preview: list[dict] = []
-    imported_count = 0
-    duplicate_count = 0
+    if commit and background:
+        job = await _start_contact_import_job(file.file)
+        response.status_code = 202
+        return job
 
-    for row in mapped_rows:
-        first = row.get("first_name", "").strip()
-        last = row.get("last_name", "").strip()
-        email = row.get("email", "").strip()
-
-        is_duplicate = False
-        duplicate_reason = None
-
-        # Case-insensitive exact email match
-        if email and email.lower() in email_set:
-            is_duplicate = True
-            duplicate_reason = f"Email '{email}' already exists"
-        # First + last name match
-        elif f"{first.lower()}|{last.lower()}" in name_set:
-            is_duplicate = True
-            duplicate_reason = f"Name '{first} {last}' already exists"
-
-        row_info = {
-            "row_data": row,
-            "is_duplicate": is_duplicate,
-            "duplicate_reason": duplicate_reason,
-        }
+    summary, preview = await _import_contact_rows(db, rows, commit)
+    return {**summary, "mapped_fields": sorted(mapped_fields), "rows": preview}
 
-        if is_duplicate:
-            duplicate_count += 1
-            row_info["action"] = "skip"
-        else:
-            row_info["action"] = "import"
-
-        if commit and not is_duplicate:
-            # Look up or skip company_name — we don't auto-create companies here
-            company_name = row.get("company_name", "").strip()
-            company_id = None
-            if company_name:
-                comp_result = await db.execute(
-                    select(Company).where(
-                        func.lower(Company.name) == company_name.lower(),
-                        Company.is_deleted == False,  # noqa: E712
-                    )
-                )
-                comp = comp_result.scalar_one_or_none()
-                if comp:
-                    company_id = comp.id
-
-            contact = Contact(
-                first_name=first,
-                last_name=last,
-                email=email or None,
-                phone=row.get("phone", "").strip() or None,
-                role=row.get("role", "").strip() or None,
-                type=row.get("type", "").strip() or "lead",
-                source=row.get("source", "").strip() or "csv_import",
-                company_id=company_id,
-            )
-            db.add(contact)
-            await db.flush()
-            await log_action(db, "contact", str(contact.id), "create")
-            imported_count += 1
 
-            # Add to lookup sets so later rows in the same file detect intra-file duplicates
-            if email:
-                email_set.add(email.lower())
-            name_set.add(f"{first.lower()}|{last.lower()}")
+async def _start_contact_import_job(upload: BinaryIO) -> dict:
+    """Copy the upload aside (the request's copy is closed once it returns) and import it as a job."""
+    if any(job.is_active for job in list_jobs("contact_import")):
+        raise HTTPException(status_code=409, detail="A contact import is already running")
 
-        preview.append(row_info)
+    upload.seek(0)
+    with tempfile.NamedTemporaryFile(prefix="ripple_import_", suffix=".csv", delete=False) as tmp:
+        shutil.copyfileobj(upload, tmp, READ_BLOCK)
 
-    if commit:
-        await db.commit()
+    async def work(db: AsyncSession, job) -> dict:
+        try:
+            with open(tmp.name, "rb") as f:
+                encoding, lines = _sniff_upload(f)
+                job.total = max(lines - 1, 0)  # data lines, approximately
+                mapped_fields, rows = _iter_csv(f, CONTACT_HEADER_MAP, encoding)
+                summary, _ = await _import_contact_rows(db, rows, commit=True, job=job)
+            job.total = job.done
+            return {**summary, "mapped_fields": sorted(mapped_fields)}
+        finally:
+            os.unlink(tmp.name)
 
-    return {
-        "total_rows": len(mapped_rows),
-        "duplicates": duplicate_count,
-        "to_import": len(mapped_rows) - duplicate_count,
-        "imported": imported_count if commit else 0,
-        "committed": commit,
-        "mapped_fields": sorted(mapped_fields),
-        "rows": preview,
-    }
+    return start_job("contact_import", work).to_dict()
 
 
 # ---------------------------------------------------------------------------
@@ -250,25 +369,15 @@ async def import_companies(
     if not file.filename or not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are accepted")
 
-    raw = await file.read()
-    raw_rows = _parse_csv_bytes(raw)
-    if not raw_rows:
+    parsed = _iter_csv(file.file, COMPANY_HEADER_MAP)
+    if parsed is None:
         raise HTTPException(status_code=400, detail="CSV file is empty or has no data rows")
-
-    raw_headers = list(raw_rows[0].keys())
-    col_map = _normalise_headers(raw_headers, COMPANY_HEADER_MAP)
-    mapped_fields = set(col_map.values())
+    mapped_fields, rows = parsed
 
     if "name" not in mapped_fields:
         raise HTTPException(status_code=400, detail="CSV must contain a 'name' or 'Company Name' column")
 
-    mapped_rows: list[dict[str, str]] = []
-    for raw_row in raw_rows:
-        mapped: dict[str, str] = {}
-        for idx, raw_header in enumerate(raw_headers):
-            if idx in col_map:
-                mapped[col_map[idx]] = raw_row.get(raw_header, "")
-        mapped_rows.append(mapped)
+    mapped_rows = list(rows)
 
     # Fetch existing companies for duplicate detection
     result = await db.execute(select(Company).where(Company.is_deleted == False))  # noqa: E712
@@ -324,106 +433,114 @@ async def import_companies(
 
 
 # ---------------------------------------------------------------------------
-# Contact export
+# Export
 # ---------------------------------------------------------------------------
 
-@router.get("/export/contacts")
-async def export_contacts(db: AsyncSession = Depends(get_db)):
-    """Export all non-deleted contacts as a CSV download."""
-    result = await db.execute(
-        select(Contact).where(Contact.is_deleted == False).order_by(Contact.created_at.desc())  # noqa: E712
-    )
-    contacts = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    headers = [
-        "id", "first_name", "last_name", "email", "phone",
-        "role", "title", "type", "source", "timezone",
-        "linkedin_url", "preferred_channel",
-        "relationship_health_score", "created_at", "updated_at",
-    ]
-    writer.writerow(headers)
-
-    for c in contacts:
-        writer.writerow([
-            str(c.id),
-            c.first_name,
-            c.last_name,
-            c.email or "",
-            c.phone or "",
-            c.role or "",
-            c.title or "",
-            c.type,
-            c.source or "",
-            c.timezone or "",
-            c.linkedin_url or "",
-            c.preferred_channel or "",
-            c.relationship_health_score if c.relationship_health_score is not None else "",
-            c.created_at.isoformat() if c.created_at else "",
-            c.updated_at.isoformat() if c.updated_at else "",
-        ])
-
-    output.seek(0)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    filename = f"ripple_contacts_{timestamp}.csv"
+EXPORT_CHUNK = 1000  # rows per server-side cursor fetch, and per chunk sent
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+CONTACT_EXPORT_COLUMNS = [
+    Contact.id, Contact.first_name, Contact.last_name, Contact.email, Contact.phone,
+    Contact.role, Contact.title, Contact.type, Contact.source, Contact.timezone,
+    Contact.linkedin_url, Contact.preferred_channel,
+    Contact.relationship_health_score, Contact.created_at, Contact.updated_at,
+]
+
+DEAL_EXPORT_COLUMNS = [
+    Deal.id, Deal.title, Deal.description, Deal.contact_id, Deal.company_id,
+    Deal.value, Deal.currency, Deal.stage, Deal.probability,
+    Deal.expected_close_date, Deal.actual_close_date,
+    Deal.owner, Deal.source, Deal.created_at, Deal.updated_at,
+]
+
+
+def _export_value(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
 
+async def _stream_export(columns: list, stmt, fmt: str, gzip: bool) -> AsyncIterator[bytes]:
+    """Encode rows as they come off a server-side cursor, EXPORT_CHUNK at a time.
+
+    Runs on its own session: the request's get_db session is closed before a
+    StreamingResponse body starts.
+    """
+    headers = [c.key for c in columns]
+    compressor = zlib.compressobj(wbits=31) if gzip else None  # wbits=31: gzip container
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> bytes:
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        if compressor is not None:
+            # Sync flush so each chunk reaches the client now, not when zlib's window fills
+            data = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        return data
+
+    if fmt == "csv":
+        writer.writerow(headers)
+        yield drain()
+
+    rows = 0
+    async with async_session() as db:
+        result = await db.stream(stmt.execution_options(yield_per=EXPORT_CHUNK))
+        async for partition in result.partitions():
+            for row in partition:
+                values = [_export_value(v) for v in row]
+                if fmt == "csv":
+                    writer.writerow(values)
+                else:
+                    buffer.write(json.dumps(dict(zip(headers, values))))
+                    buffer.write("\n")
+            rows += len(partition)
+            yield drain()
+
+    if compressor is not None:
+        yield compressor.flush()
+    log.info("Exported %d rows as %s%s", rows, fmt, " (gzip)" if gzip else "")
+
+
+def _export_response(name: str, columns: list, stmt, fmt: str, gzip: bool) -> StreamingResponse:
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    filename = f"ripple_{name}_{timestamp}.{fmt}" + (".gz" if gzip else "")
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
+        _stream_export(columns, stmt, fmt, gzip),
+        media_type="application/gzip" if gzip else EXPORT_MEDIA_TYPES[fmt],
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
-# ---------------------------------------------------------------------------
-# Deal export
-# ---------------------------------------------------------------------------
-
-@router.get("/export/deals")
-async def export_deals(db: AsyncSession = Depends(get_db)):
-    """Export all non-deleted deals as a CSV download."""
-    result = await db.execute(
-        select(Deal).where(Deal.is_deleted == False).order_by(Deal.created_at.desc())  # noqa: E712
+@router.get("/export/contacts")
+async def export_contacts(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    gzip: bool = Query(False, description="Compress on the fly; the download is a .gz file"),
+):
+    """Export all non-deleted contacts as a CSV (or NDJSON) download, streamed as it is read."""
+    stmt = (
+        select(*CONTACT_EXPORT_COLUMNS)
+        .where(Contact.is_deleted == False)  # noqa: E712
+        .order_by(Contact.created_at.desc())
     )
-    deals = result.scalars().all()
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    headers = [
-        "id", "title", "description", "contact_id", "company_id",
-        "value", "currency", "stage", "probability",
-        "expected_close_date", "actual_close_date",
-        "owner", "source", "created_at", "updated_at",
-    ]
-    writer.writerow(headers)
-
-    for d in deals:
-        writer.writerow([
-            str(d.id),
-            d.title,
-            d.description or "",
-            str(d.contact_id) if d.contact_id else "",
-            str(d.company_id) if d.company_id else "",
-            d.value if d.value is not None else "",
-            d.currency,
-            d.stage,
-            d.probability if d.probability is not None else "",
-            d.expected_close_date.isoformat() if d.expected_close_date else "",
-            d.actual_close_date.isoformat() if d.actual_close_date else "",
-            d.owner or "",
-            d.source or "",
-            d.created_at.isoformat() if d.created_at else "",
-            d.updated_at.isoformat() if d.updated_at else "",
-        ])
-
-    output.seek(0)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    filename = f"ripple_deals_{timestamp}.csv"
+    return _export_response("contacts", CONTACT_EXPORT_COLUMNS, stmt, format, gzip)
 
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+
+@router.get("/export/deals")
+async def export_deals(
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    gzip: bool = Query(False, description="Compress on the fly; the download is a .gz file"),
+):
+    """Export all non-deleted deals as a CSV (or NDJSON) download, streamed as it is read."""
+    stmt = (
+        select(*DEAL_EXPORT_COLUMNS)
+        .where(Deal.is_deleted == False)  # noqa: E712
+        .order_by(Deal.created_at.desc())
     )
+    return _export_response("deals", DEAL_EXPORT_COLUMNS, stmt, format, gzip)
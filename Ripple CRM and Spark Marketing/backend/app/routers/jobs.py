@@ -0,0 +1,21 @@
+"""Ripple CRM — Background job status API routes."""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.services.jobs import get_job, list_jobs
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("")
+async def jobs(kind: str | None = Query(None)):
+    items = [j.to_dict() for j in list_jobs(kind)]
+    return {"items": items, "total": len(items)}
+
+
+@router.get("/{job_id}")
+async def job_status(job_id: str):
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.services.jobs import start_job
 from app.services.three_brains import calculate_lead_score, get_leaderboard, recalculate_all
 
 router = APIRouter(prefix="/lead-scores", tags=["lead-scoring"])
@@ -20,10 +21,15 @@ async def leaderboard(
     return {"items": items, "total": len(items)}
 
 
-@router.post("/recalculate-all")
-async def recalculate_all_scores(db: AsyncSession = Depends(get_db)):
-    count = await recalculate_all(db)
-    return {"recalculated": count}
+async def _recalculate_all_job(db: AsyncSession, job) -> dict:
+    return {"recalculated": await recalculate_all(db, job)}
+
+
+@router.post("/recalculate-all", status_code=202)
+async def recalculate_all_scores():
+    """Start a bulk rescore in the background; poll GET /api/jobs/{job_id}."""
+    job = start_job("lead_scores", _recalculate_all_job)
+    return job.to_dict()
 
 
 # Contact-scoped endpoints (mounted separately)
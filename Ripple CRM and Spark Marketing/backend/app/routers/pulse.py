@@ -36,6 +36,7 @@ from app.services.pulse_engine import (
     query_target_vs_actual,
     rank_easy_wins,
 )
+from app.services.pulse_facts import refresh_contact_facts
 
 router = APIRouter(prefix="/pulse", tags=["pulse"])
 
@@ -385,6 +386,14 @@ async def force_generate_pulse(db: AsyncSession = Depends(get_db)):
     return pulse
 
 
+@router.post("/facts/rebuild")
+async def rebuild_pulse_facts(db: AsyncSession = Depends(get_db)):
+    """Rebuild every Pulse contact fact (after bulk writes that skip the ORM)."""
+    count = await refresh_contact_facts(db, full=True)
+    await db.commit()
+    return {"refreshed": count}
+
+
 @router.get("/{pulse_date}", response_model=PulseResponse)
 async def get_pulse_by_date(pulse_date: date, db: AsyncSession = Depends(get_db)):
     """Get historical Pulse for a specific date."""
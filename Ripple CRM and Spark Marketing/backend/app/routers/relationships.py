@@ -11,7 +11,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.contact import Contact
+from app.services.jobs import start_job
 from app.services.relationship_health import calculate_health_score, recalculate_all
+from app.services.relationship_recompute import recompute_contacts
 
 router = APIRouter(prefix="/relationships", tags=["relationships"])
 
@@ -41,3 +43,15 @@ async def trigger_recalculate(db: AsyncSession = Depends(get_db)):
     """Recalculate health scores for all contacts."""
     count = await recalculate_all(db)
     return {"detail": f"Recalculated {count} contacts", "count": count}
+
+
+async def _recompute_all_job(db: AsyncSession, job) -> dict:
+    return {"recalculated": await recompute_contacts(db, job=job)}
+
+
+@router.post("/recompute-all", status_code=202)
+async def trigger_recompute_all():
+    """Start the nightly health + trust decay recompute in the background;
+    poll GET /api/jobs/{job_id}."""
+    job = start_job("relationship_recompute", _recompute_all_job)
+    return job.to_dict()
@@ -20,6 +20,7 @@ from app.models.deal import Deal
 from app.models.interaction import Interaction
 from app.models.note import Note
 from app.models.privacy_consent import PrivacyConsent
+from app.models.pulse_fact import PulseContactFact
 from app.models.relationship import Relationship
 from app.models.tag import Tag, contact_tags
 from app.models.task import Task
@@ -159,6 +160,9 @@ async def delete_all_data(db: AsyncSession = Depends(get_db)):
     counts["deals"] = result.scalar() or 0
     await db.execute(delete(Deal))
 
+    # 8b. Pulse facts (FK -> contacts; derived data, not counted)
+    await db.execute(delete(PulseContactFact))
+
     # 9. Contacts (FK -> companies)
     result = await db.execute(select(func.count()).select_from(Contact))
     counts["contacts"] = result.scalar() or 0
@@ -35,6 +35,7 @@ from app.models.relationship import Relationship
 from app.models.rep_forecast import RepForecastHistory
 from app.models.tag import contact_tags
 from app.models.task import Task
+from app.services.pulse_facts import invalidate_contact_facts
 
 SEED_SOURCE = "seed_data"
 
@@ -685,6 +686,10 @@ async def clear_seed_data(db=None, confirm=False):
                 contact_tags.c.contact_id.in_(seed_contact_ids_q)
             )
         )
+        # 15b. Pulse facts of contacts losing seed deals (Core deletes skip the flush hook)
+        await invalidate_contact_facts(
+            db, select(Deal.contact_id).where(Deal.source == SEED_SOURCE)
+        )
         # 16. Deals
         await db.execute(
             delete(Deal).where(Deal.source == SEED_SOURCE)
@@ -1,5 +1,6 @@
 """Ripple CRM — Audit log service."""
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.audit_log import AuditLog
@@ -27,6 +28,21 @@ async def log_action(
     db.add(entry)
 
 
+async def log_actions(
+    db: AsyncSession,
+    entity_type: str,
+    entity_ids: list,
+    action: str,
+    changed_by: str = "system",
+):
+    """Record the same action for many entities with one bulk INSERT."""
+    if entity_ids:
+        await db.execute(insert(AuditLog), [
+            {"entity_type": entity_type, "entity_id": str(eid), "action": action, "changed_by": changed_by}
+            for eid in entity_ids
+        ])
+
+
 async def log_changes(
     db: AsyncSession,
     entity_type: str,
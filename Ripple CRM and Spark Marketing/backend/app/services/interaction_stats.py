@@ -0,0 +1,127 @@
+"""Ripple CRM — Per-contact interaction statistics.
+
+Everything relationship health and trust decay need from a contact's
+interaction history, accumulated in one pass over the interactions
+newest-first:
+  - count, latest timestamp
+  - the 50-interaction health window (size, oldest timestamp)
+  - sentiment scores among the latest 10
+  - sum / count of positive day gaps between consecutive interactions
+
+stream_interaction_stats() walks every non-deleted contact's interactions,
+ordered by (contact_id, occurred_at DESC), through a server-side cursor and
+yields one InteractionStats per contact, so memory stays bounded by a single
+contact's state however large the interactions table is.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AsyncIterator, NamedTuple
+
+from sqlalchemy import func, select
+
+from app.models.commitment import Commitment
+from app.models.contact import Contact
+from app.models.interaction import Interaction
+
+HEALTH_WINDOW = 50  # interactions considered for recency / frequency / response
+SENTIMENT_WINDOW = 10  # latest interactions averaged for sentiment
+STREAM_CHUNK = 5000  # rows fetched per round trip from the server-side cursor
+
+
+def _aware(ts: datetime) -> datetime:
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class InteractionStats:
+    contact_id: object
+    count: int = 0
+    last: datetime | None = None
+    window_oldest: datetime | None = None
+    sentiments: list[float] = field(default_factory=list)
+    gap_sum: int = 0
+    gap_count: int = 0
+    _prev: datetime | None = field(default=None, repr=False)
+
+    @property
+    def window_count(self) -> int:
+        return min(self.count, HEALTH_WINDOW)
+
+    def add(self, occurred_at: datetime, sentiment: float | None = None) -> None:
+        """Feed the next interaction; calls must be newest-first."""
+        ts = _aware(occurred_at)
+        if self._prev is None:
+            self.last = ts
+        else:
+            gap = (self._prev - ts).days
+            if gap > 0:
+                self.gap_sum += gap
+                self.gap_count += 1
+        if self.count < HEALTH_WINDOW:
+            self.window_oldest = ts
+        if self.count < SENTIMENT_WINDOW and sentiment is not None:
+            self.sentiments.append(sentiment)
+        self.count += 1
+        self._prev = ts
+
+
+class CommitmentCounts(NamedTuple):
+    total: int
+    fulfilled: int
+    broken: int
+
+
+async def load_interaction_stats(db, contact_id, limit: int | None = None) -> InteractionStats:
+    """Stats for one contact; ``limit`` keeps only the latest N interactions."""
+    stmt = (
+        select(Interaction.occurred_at, Interaction.sentiment_score)
+        .where(Interaction.contact_id == contact_id)
+        .order_by(Interaction.occurred_at.desc())
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    stats = InteractionStats(contact_id)
+    for occurred_at, sentiment in (await db.execute(stmt)).all():
+        stats.add(occurred_at, sentiment)
+    return stats
+
+
+async def stream_interaction_stats(conn, chunk: int = STREAM_CHUNK) -> AsyncIterator[InteractionStats]:
+    """Yield InteractionStats for every non-deleted contact, in contact_id order.
+
+    ``conn`` is an AsyncConnection or AsyncSession. Contacts without
+    interactions come through the outer join as a single NULL row and are
+    yielded with count 0.
+    """
+    stmt = (
+        select(Contact.id, Interaction.occurred_at, Interaction.sentiment_score)
+        .outerjoin(Interaction, Interaction.contact_id == Contact.id)
+        .where(Contact.is_deleted == False)  # noqa: E712
+        .order_by(Contact.id, Interaction.occurred_at.desc())
+        .execution_options(yield_per=chunk)
+    )
+    result = await conn.stream(stmt)
+    stats = None
+    async for contact_id, occurred_at, sentiment in result:
+        if stats is None or contact_id != stats.contact_id:
+            if stats is not None:
+                yield stats
+            stats = InteractionStats(contact_id)
+        if occurred_at is not None:
+            stats.add(occurred_at, sentiment)
+    if stats is not None:
+        yield stats
+
+
+async def commitment_counts(db, contact_id=None) -> dict:
+    """contact_id → CommitmentCounts, from one grouped query."""
+    stmt = select(
+        Commitment.contact_id,
+        func.count(),
+        func.count().filter(Commitment.status == "fulfilled"),
+        func.count().filter(Commitment.status == "broken"),
+    ).group_by(Commitment.contact_id)
+    if contact_id is not None:
+        stmt = stmt.where(Commitment.contact_id == contact_id)
+    return {row[0]: CommitmentCounts(*row[1:]) for row in (await db.execute(stmt)).all()}
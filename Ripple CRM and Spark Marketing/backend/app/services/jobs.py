@@ -0,0 +1,112 @@
+"""Ripple CRM — In-process background jobs with progress reporting.
+
+Long recalculations (lead scores, trust decay, relationship health) run as
+asyncio tasks on their own database session, so the request that starts
+one returns straight away with a job id. Progress is polled via
+GET /api/jobs/{job_id}.
+
+Only one job of a given kind runs at a time: starting a second while the
+first is still going returns the running job instead of doubling the work.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+
+log = logging.getLogger(__name__)
+
+MAX_FINISHED_JOBS = 50  # finished jobs kept for polling; oldest dropped first
+
+
+@dataclass
+class Job:
+    kind: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"  # queued, running, completed, failed
+    total: int = 0
+    done: int = 0
+    result: dict | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ("queued", "running")
+
+    def advance(self, n: int = 1) -> None:
+        self.done += n
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "total": self.total,
+            "done": self.done,
+            "progress": round(self.done / self.total * 100, 1) if self.total else (100.0 if self.status == "completed" else 0.0),
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+JobWork = Callable[[AsyncSession, Job], Awaitable[dict]]
+
+_jobs: dict[str, Job] = {}
+_tasks: set[asyncio.Task] = set()
+
+
+def start_job(kind: str, work: JobWork) -> Job:
+    """Schedule `work(db, job)` in the background; returns the job to poll."""
+    for job in _jobs.values():
+        if job.kind == kind and job.is_active:
+            return job
+
+    job = Job(kind=kind)
+    _jobs[job.id] = job
+    _prune()
+    task = asyncio.create_task(_run(job, work))
+    _tasks.add(task)  # keep a reference until it finishes
+    task.add_done_callback(_tasks.discard)
+    return job
+
+
+async def _run(job: Job, work: JobWork) -> None:
+    job.status = "running"
+    job.started_at = datetime.now(timezone.utc)
+    try:
+        async with async_session() as db:
+            job.result = await work(db, job)
+        job.status = "completed"
+    except Exception as exc:  # noqa: BLE001 — surfaced through the job record
+        log.exception("Background job %s (%s) failed", job.id, job.kind)
+        job.status = "failed"
+        job.error = str(exc)
+    finally:
+        job.finished_at = datetime.now(timezone.utc)
+
+
+def _prune() -> None:
+    finished = [j for j in _jobs.values() if not j.is_active]
+    for job in sorted(finished, key=lambda j: j.created_at)[:-MAX_FINISHED_JOBS or None]:
+        _jobs.pop(job.id, None)
+
+
+def get_job(job_id: str) -> Job | None:
+    return _jobs.get(job_id)
+
+
+def list_jobs(kind: str | None = None) -> list[Job]:
+    jobs = [j for j in _jobs.values() if kind is None or j.kind == kind]
+    return sorted(jobs, key=lambda j: j.created_at, reverse=True)
@@ -16,11 +16,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.models.contact import Contact
 from app.models.deal import Deal
-from app.models.interaction import Interaction
 from app.models.pulse_action import PulseAction
+from app.models.pulse_fact import PulseContactFact
 from app.models.pulse_snapshot import PulseSnapshot
 from app.models.pulse_wisdom import PulseWisdom
 from app.models.sales_target import SalesTarget
+from app.services.pulse_facts import CLOSED_STAGES, ensure_contact_facts
 
 log = logging.getLogger(__name__)
 
@@ -111,26 +112,26 @@ async def rank_easy_wins(db: AsyncSession, limit: int = 10) -> list[dict]:
     """
     today = date.today()
     wins: list[dict] = []
+    await ensure_contact_facts(db)
 
-    # Active deals with contact info
+    # Active deals with contact name and last interaction (from Pulse facts)
     result = await db.execute(
-        select(Deal)
+        select(
+            Deal.id, Deal.title, Deal.contact_id, Deal.value, Deal.stage, Deal.probability,
+            Contact.first_name, Contact.last_name, PulseContactFact.last_interaction_at,
+        )
+        .outerjoin(Contact, Contact.id == Deal.contact_id)
+        .outerjoin(PulseContactFact, PulseContactFact.contact_id == Deal.contact_id)
         .where(
             Deal.is_deleted == False,  # noqa: E712
-            Deal.stage.notin_(["closed_won", "closed_lost"]),
+            Deal.stage.notin_(CLOSED_STAGES),
         )
         .order_by(Deal.value.desc().nullslast())
         .limit(50)
     )
-    deals = result.scalars().all()
-
-    for deal in deals:
-        # Get days since last interaction
-        last_interaction = (await db.execute(
-            select(func.max(Interaction.occurred_at))
-            .where(Interaction.contact_id == deal.contact_id)
-        )).scalar()
 
+    for deal in result.all():
+        last_interaction = deal.last_interaction_at
         days_since = (today - last_interaction.date()).days if last_interaction else 30
 
         value = deal.value or 0
@@ -149,15 +150,9 @@ async def rank_easy_wins(db: AsyncSession, limit: int = 10) -> list[dict]:
         elif deal.stage == "qualified":
             win_type = "warm_lead"
 
-        # Get contact name
         contact_name = None
-        if deal.contact_id:
-            contact = (await db.execute(
-                select(Contact.first_name, Contact.last_name)
-                .where(Contact.id == deal.contact_id)
-            )).first()
-            if contact:
-                contact_name = f"{contact.first_name} {contact.last_name}"
+        if deal.first_name is not None:
+            contact_name = f"{deal.first_name} {deal.last_name}"
 
         wins.append({
             "deal_id": str(deal.id),
@@ -174,37 +169,22 @@ async def rank_easy_wins(db: AsyncSession, limit: int = 10) -> list[dict]:
 
     # Detect renewal opportunities (customers with no active deal)
     result = await db.execute(
-        select(Contact)
+        select(
+            Contact.id, Contact.first_name, Contact.last_name,
+            PulseContactFact.open_deal_count, PulseContactFact.last_won_value,
+        )
+        .outerjoin(PulseContactFact, PulseContactFact.contact_id == Contact.id)
         .where(
             Contact.is_deleted == False,  # noqa: E712
             Contact.type == "customer",
         )
         .limit(20)
     )
-    customers = result.scalars().all()
-
-    for cust in customers:
-        has_active = (await db.execute(
-            select(func.count()).select_from(
-                select(Deal.id).where(
-                    Deal.contact_id == cust.id,
-                    Deal.is_deleted == False,  # noqa: E712
-                    Deal.stage.notin_(["closed_won", "closed_lost"]),
-                ).subquery()
-            )
-        )).scalar() or 0
-
-        if has_active == 0:
-            # Get their last won deal value as estimate
-            last_won = (await db.execute(
-                select(Deal.value)
-                .where(
-                    Deal.contact_id == cust.id,
-                    Deal.stage == "closed_won",
-                )
-                .order_by(Deal.actual_close_date.desc().nullslast())
-                .limit(1)
-            )).scalar()
+
+    for cust in result.all():
+        if not cust.open_deal_count:
+            # Their last won deal value as estimate
+            last_won = cust.last_won_value
 
             if last_won and last_won > 0:
                 wins.append({
@@ -246,28 +226,26 @@ async def analyse_pipeline(db: AsyncSession) -> dict:
     # Stalled deals (>14 days same stage, not closed)
     stale_cutoff = today - timedelta(days=14)
     result = await db.execute(
-        select(Deal)
+        select(
+            Deal.id, Deal.title, Deal.stage, Deal.value, Deal.updated_at,
+            Contact.first_name, Contact.last_name,
+        )
+        .outerjoin(Contact, Contact.id == Deal.contact_id)
         .where(
             Deal.is_deleted == False,  # noqa: E712
-            Deal.stage.notin_(["closed_won", "closed_lost"]),
+            Deal.stage.notin_(CLOSED_STAGES),
             Deal.updated_at < datetime(stale_cutoff.year, stale_cutoff.month, stale_cutoff.day, tzinfo=timezone.utc),
         )
         .order_by(Deal.updated_at.asc())
         .limit(10)
     )
-    stalled_deals_raw = result.scalars().all()
 
     stalled = []
-    for d in stalled_deals_raw:
+    for d in result.all():
         days_in_stage = (today - d.updated_at.date()).days if d.updated_at else 0
         contact_name = None
-        if d.contact_id:
-            c = (await db.execute(
-                select(Contact.first_name, Contact.last_name)
-                .where(Contact.id == d.contact_id)
-            )).first()
-            if c:
-                contact_name = f"{c.first_name} {c.last_name}"
+        if d.first_name is not None:
+            contact_name = f"{d.first_name} {d.last_name}"
 
         stalled.append({
             "deal_id": str(d.id),
@@ -278,28 +256,21 @@ async def analyse_pipeline(db: AsyncSession) -> dict:
             "contact_name": contact_name,
         })
 
-    # Win/loss rates for 30/60/90 days
+    # Win/loss rates for 30/60/90 days, counted in one pass
+    windows = (30, 60, 90)
+    counts = (await db.execute(
+        select(*(
+            func.count().filter(Deal.stage == stage, Deal.actual_close_date >= today - timedelta(days=days))
+            for days in windows
+            for stage in CLOSED_STAGES
+        )).where(
+            Deal.stage.in_(CLOSED_STAGES),
+            Deal.actual_close_date >= today - timedelta(days=max(windows)),
+        )
+    )).one()
     rates = {}
-    for days in (30, 60, 90):
-        cutoff = today - timedelta(days=days)
-        won = (await db.execute(
-            select(func.count()).select_from(
-                select(Deal.id).where(
-                    Deal.stage == "closed_won",
-                    Deal.actual_close_date >= cutoff,
-                ).subquery()
-            )
-        )).scalar() or 0
-
-        lost = (await db.execute(
-            select(func.count()).select_from(
-                select(Deal.id).where(
-                    Deal.stage == "closed_lost",
-                    Deal.actual_close_date >= cutoff,
-                ).subquery()
-            )
-        )).scalar() or 0
-
+    for i, days in enumerate(windows):
+        won, lost = counts[2 * i] or 0, counts[2 * i + 1] or 0
         total = won + lost
         rates[f"win_rate_{days}d"] = round(won / total * 100, 1) if total > 0 else None
 
@@ -330,15 +301,29 @@ async def analyse_pipeline(db: AsyncSession) -> dict:
 
 # ── Relationship Changes ──────────────────────────────────────────────────
 
+# Contact columns the relationship lists need (full rows would also pull in
+# every selectin relationship)
+_CONTACT_SUMMARY = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.relationship_health_score,
+    Contact.trust_decay_days,
+    Contact.trust_decay_status,
+)
+
+
 async def detect_relationship_changes(
     db: AsyncSession, no_contact_days: int = 14
 ) -> dict:
     """Find decaying, champion, and silent contacts."""
     today = date.today()
+    await ensure_contact_facts(db)
 
     # Decaying: health score below 40 or trust_decay_status in warning/critical
     result = await db.execute(
-        select(Contact)
+        select(*_CONTACT_SUMMARY, PulseContactFact.last_interaction_at)
+        .outerjoin(PulseContactFact, PulseContactFact.contact_id == Contact.id)
         .where(
             Contact.is_deleted == False,  # noqa: E712
             or_(
@@ -349,13 +334,9 @@ async def detect_relationship_changes(
         .order_by(Contact.relationship_health_score.asc().nullslast())
         .limit(10)
     )
-    decaying_raw = result.scalars().all()
     decaying = []
-    for c in decaying_raw:
-        last = (await db.execute(
-            select(func.max(Interaction.occurred_at))
-            .where(Interaction.contact_id == c.id)
-        )).scalar()
+    for c in result.all():
+        last = c.last_interaction_at
         last_days = (today - last.date()).days if last else None
 
         decaying.append({
@@ -369,7 +350,7 @@ async def detect_relationship_changes(
 
     # Champions: highest health scores
     result = await db.execute(
-        select(Contact)
+        select(*_CONTACT_SUMMARY)
         .where(
             Contact.is_deleted == False,  # noqa: E712
             Contact.relationship_health_score.isnot(None),
@@ -378,7 +359,7 @@ async def detect_relationship_changes(
         .order_by(Contact.relationship_health_score.desc())
         .limit(5)
     )
-    champ_raw = result.scalars().all()
+    champ_raw = result.all()
     champions = [
         {
             "contact_id": str(c.id),
@@ -396,22 +377,17 @@ async def detect_relationship_changes(
     cutoff_dt = datetime(cutoff.year, cutoff.month, cutoff.day, tzinfo=timezone.utc)
 
     # Contacts whose most recent interaction is before the cutoff
-    subq = (
-        select(Interaction.contact_id, func.max(Interaction.occurred_at).label("latest"))
-        .group_by(Interaction.contact_id)
-    ).subquery()
-
     result = await db.execute(
-        select(Contact)
-        .join(subq, Contact.id == subq.c.contact_id)
+        select(*_CONTACT_SUMMARY)
+        .join(PulseContactFact, PulseContactFact.contact_id == Contact.id)
         .where(
             Contact.is_deleted == False,  # noqa: E712
-            subq.c.latest < cutoff_dt,
+            PulseContactFact.last_interaction_at < cutoff_dt,
         )
-        .order_by(subq.c.latest.asc())
+        .order_by(PulseContactFact.last_interaction_at.asc())
         .limit(10)
     )
-    silent_raw = result.scalars().all()
+    silent_raw = result.all()
     no_contact_list = [
         {
             "contact_id": str(c.id),
@@ -437,27 +413,23 @@ async def generate_coaching(db: AsyncSession) -> dict:
     """Win streaks, personal bests, pattern detection."""
     today = date.today()
 
-    # Count consecutive days with closed_won deals (streak)
+    # Count consecutive days with closed_won deals (streak), from one query
+    # over the days that had a win
+    result = await db.execute(
+        select(Deal.actual_close_date)
+        .where(
+            Deal.stage == "closed_won",
+            Deal.actual_close_date <= today,
+            Deal.actual_close_date >= today - timedelta(days=366),
+        )
+        .distinct()
+    )
+    win_days = set(result.scalars().all())
     streak = 0
     check_date = today
-    while True:
-        won_today = (await db.execute(
-            select(func.count()).select_from(
-                select(Deal.id).where(
-                    Deal.stage == "closed_won",
-                    Deal.actual_close_date == check_date,
-                ).subquery()
-            )
-        )).scalar() or 0
-
-        if won_today > 0:
-            streak += 1
-            check_date -= timedelta(days=1)
-        else:
-            break
-
-        if streak > 365:
-            break
+    while check_date in win_days and streak <= 365:
+        streak += 1
+        check_date -= timedelta(days=1)
 
     # Personal bests
     bests: list[str] = []
@@ -477,26 +449,17 @@ async def generate_coaching(db: AsyncSession) -> dict:
     if biggest and biggest.value:
         bests.append(f"Biggest win this month: {biggest.title} (${biggest.value:,.0f})")
 
-    # Total closed this month
-    month_total = (await db.execute(
-        select(func.coalesce(func.sum(Deal.value), 0)).where(
+    # Total and count closed this month
+    month_total, month_count = (await db.execute(
+        select(func.coalesce(func.sum(Deal.value), 0), func.count()).where(
             Deal.stage == "closed_won",
             Deal.actual_close_date >= month_start,
         )
-    )).scalar() or 0
+    )).one()
 
     if month_total > 0:
         bests.append(f"Total closed this month: ${month_total:,.0f}")
 
-    # Count of deals won this month
-    month_count = (await db.execute(
-        select(func.count()).select_from(
-            select(Deal.id).where(
-                Deal.stage == "closed_won",
-                Deal.actual_close_date >= month_start,
-            ).subquery()
-        )
-    )).scalar() or 0
     if month_count > 0:
         bests.append(f"Deals closed this month: {month_count}")
 
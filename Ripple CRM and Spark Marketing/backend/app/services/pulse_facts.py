@@ -0,0 +1,148 @@
+"""Ripple CRM — Pulse fact materialisation.
+
+Maintains pulse_contact_facts: per contact, the latest interaction, open
+deal count / value and last won deal value. Pulse reads these with a join
+instead of running per-deal and per-customer subqueries.
+
+Refresh is incremental:
+  - any ORM flush that adds, changes or deletes an Interaction or Deal
+    drops the fact rows of the contacts involved (old and new contact_id)
+  - refresh_contact_facts() rebuilds only the contacts with no fact row,
+    a chunk at a time with one grouped query per figure
+  - Pulse readers call ensure_contact_facts(), which does that on its own
+    session and commits, so read-only requests keep the rows they build
+
+Bulk Core writes bypass the flush hook; callers doing those use
+invalidate_contact_facts(), or rebuild everything with full=True.
+"""
+
+import logging
+from datetime import datetime, timezone
+from itertools import chain
+
+from sqlalchemy import delete, event, func, inspect, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.contact import Contact
+from app.models.deal import Deal
+from app.models.interaction import Interaction
+from app.models.pulse_fact import PulseContactFact
+
+log = logging.getLogger(__name__)
+
+FACT_CHUNK = 1000  # contacts rebuilt per round of grouped queries
+CLOSED_STAGES = ("closed_won", "closed_lost")
+
+
+@event.listens_for(Session, "after_flush")
+def _drop_stale_facts(session, flush_context):
+    touched = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (Interaction, Deal)):
+            history = inspect(obj).attrs.contact_id.history
+            touched.update(cid for cid in chain(*history) if cid is not None)
+    if touched:
+        session.connection().execute(
+            delete(PulseContactFact).where(PulseContactFact.contact_id.in_(touched))
+        )
+
+
+async def invalidate_contact_facts(db: AsyncSession, contact_ids=None) -> None:
+    """Drop fact rows for ``contact_ids`` (a list or a select), or all of them."""
+    stmt = delete(PulseContactFact)
+    if contact_ids is not None:
+        stmt = stmt.where(PulseContactFact.contact_id.in_(contact_ids))
+    await db.execute(stmt)
+
+
+async def refresh_contact_facts(db: AsyncSession, full: bool = False) -> int:
+    """Rebuild fact rows for contacts that have none; returns how many."""
+    if full:
+        await invalidate_contact_facts(db)
+    result = await db.execute(
+        select(Contact.id)
+        .outerjoin(PulseContactFact, PulseContactFact.contact_id == Contact.id)
+        .where(PulseContactFact.contact_id.is_(None))
+    )
+    missing = result.scalars().all()
+    for start in range(0, len(missing), FACT_CHUNK):
+        await _build_facts(db, missing[start:start + FACT_CHUNK])
+    if missing:
+        await db.flush()
+        log.info("Refreshed Pulse facts for %d contacts", len(missing))
+    return len(missing)
+
+
+async def ensure_contact_facts(db: AsyncSession) -> int:
+    """refresh_contact_facts() in a separate session that commits its rows.
+
+    The caller's session may never commit (GET routes), which would roll
+    the rebuilt rows back and rebuild them again on the next request.
+    """
+    async with AsyncSession(db.bind) as facts_db:
+        built = await refresh_contact_facts(facts_db)
+        await facts_db.commit()
+    return built
+
+
+async def _build_facts(db: AsyncSession, contact_ids: list) -> None:
+    last_interaction = dict((await db.execute(
+        select(Interaction.contact_id, func.max(Interaction.occurred_at))
+        .where(Interaction.contact_id.in_(contact_ids))
+        .group_by(Interaction.contact_id)
+    )).all())
+
+    open_deals = {
+        cid: (n, value)
+        for cid, n, value in (await db.execute(
+            select(Deal.contact_id, func.count(), func.coalesce(func.sum(Deal.value), 0))
+            .where(
+                Deal.contact_id.in_(contact_ids),
+                Deal.is_deleted == False,  # noqa: E712
+                Deal.stage.notin_(CLOSED_STAGES),
+            )
+            .group_by(Deal.contact_id)
+        )).all()
+    }
+
+    latest_won = (
+        select(
+            Deal.contact_id,
+            Deal.value,
+            func.row_number().over(
+                partition_by=Deal.contact_id,
+                order_by=Deal.actual_close_date.desc().nullslast(),
+            ).label("rn"),
+        )
+        .where(Deal.contact_id.in_(contact_ids), Deal.stage == "closed_won")
+        .subquery()
+    )
+    last_won = dict((await db.execute(
+        select(latest_won.c.contact_id, latest_won.c.value).where(latest_won.c.rn == 1)
+    )).all())
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "contact_id": cid,
+            "last_interaction_at": last_interaction.get(cid),
+            "open_deal_count": open_deals.get(cid, (0, 0))[0],
+            "open_deal_value": float(open_deals.get(cid, (0, 0))[1]),
+            "last_won_value": last_won.get(cid),
+            "refreshed_at": now,
+        }
+        for cid in contact_ids
+    ]
+    # A concurrent refresh may have built some of these rows already. render_nulls
+    # keeps the chunk in one batch; the ORM otherwise splits it on every change
+    # in which columns are None
+    stmt = insert(PulseContactFact).execution_options(render_nulls=True)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[PulseContactFact.contact_id],
+            set_={c: stmt.excluded[c] for c in rows[0] if c != "contact_id"},
+        ),
+        rows,
+    )
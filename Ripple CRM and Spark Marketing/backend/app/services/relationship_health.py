@@ -8,45 +8,34 @@ Scores 0-100 based on five weighted factors:
   - Response pattern:               10%
 """
 
-from datetime import date, datetime, timezone
+from datetime import datetime, timezone
 
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.commitment import Commitment
-from app.models.contact import Contact
-from app.models.interaction import Interaction
+from app.services.interaction_stats import (
+    HEALTH_WINDOW,
+    CommitmentCounts,
+    InteractionStats,
+    commitment_counts,
+    load_interaction_stats,
+)
 
 
 async def calculate_health_score(db: AsyncSession, contact_id) -> dict:
     """Calculate relationship health for a single contact. Returns dict with
     score, components, trust_decay_days, and label."""
+    stats = await load_interaction_stats(db, contact_id, limit=HEALTH_WINDOW)
+    commitments = (await commitment_counts(db, contact_id)).get(contact_id)
+    return score_health(stats, commitments, datetime.now(timezone.utc))
 
-    # Fetch recent interactions (last 50)
-    result = await db.execute(
-        select(Interaction)
-        .where(Interaction.contact_id == contact_id)
-        .order_by(Interaction.occurred_at.desc())
-        .limit(50)
-    )
-    interactions = result.scalars().all()
-
-    # Fetch commitments
-    result = await db.execute(
-        select(Commitment).where(Commitment.contact_id == contact_id)
-    )
-    commitments = result.scalars().all()
 
-    now = datetime.now(timezone.utc)
-    today = date.today()
+def score_health(stats: InteractionStats, commitments: CommitmentCounts | None, now: datetime) -> dict:
+    """Health score from precomputed interaction stats and commitment counts."""
+    n = stats.window_count
 
     # ── Recency Score (30%) ──────────────────────────────────────────────
-    if interactions:
-        last_interaction = interactions[0].occurred_at
-        if last_interaction.tzinfo is None:
-            from datetime import timezone as tz
-            last_interaction = last_interaction.replace(tzinfo=tz.utc)
-        days_since = (now - last_interaction).days
+    if n:
+        days_since = (now - stats.last).days
         # 0 days = 100, 7 days = 85, 30 days = 50, 90 days = 10, 180+ = 0
         if days_since <= 7:
             recency_score = 100 - (days_since * 2)
@@ -61,13 +50,9 @@ async def calculate_health_score(db: AsyncSession, contact_id) -> dict:
         recency_score = 0
 
     # ── Frequency Score (25%) ────────────────────────────────────────────
-    if len(interactions) >= 2:
-        oldest = interactions[-1].occurred_at
-        if oldest.tzinfo is None:
-            from datetime import timezone as tz
-            oldest = oldest.replace(tzinfo=tz.utc)
-        span_days = max((now - oldest).days, 1)
-        avg_gap = span_days / len(interactions)
+    if n >= 2:
+        span_days = max((now - stats.window_oldest).days, 1)
+        avg_gap = span_days / n
         # Ideal gap is 7-14 days. Score penalises both too frequent and too rare.
         if avg_gap <= 3:
             frequency_score = 80  # very frequent — slight concern about over-contact
@@ -81,12 +66,11 @@ async def calculate_health_score(db: AsyncSession, contact_id) -> dict:
             frequency_score = max(0, 20 - (avg_gap - 60) * 0.3)
         baseline_gap = avg_gap
     else:
-        frequency_score = 0 if not interactions else 30
+        frequency_score = 0 if not n else 30
         baseline_gap = None
 
     # ── Sentiment Score (20%) ────────────────────────────────────────────
-    recent_10 = interactions[:10]
-    sentiments = [i.sentiment_score for i in recent_10 if i.sentiment_score is not None]
+    sentiments = stats.sentiments
     if sentiments:
         avg_sentiment = sum(sentiments) / len(sentiments)
         # Map -1..1 to 0..100
@@ -95,19 +79,17 @@ async def calculate_health_score(db: AsyncSession, contact_id) -> dict:
         sentiment_score = 50  # neutral when no data
 
     # ── Commitment Score (15%) ───────────────────────────────────────────
-    if commitments:
-        total_c = len(commitments)
-        fulfilled = sum(1 for c in commitments if c.status == "fulfilled")
-        broken = sum(1 for c in commitments if c.status == "broken")
+    if commitments and commitments.total:
+        total_c, fulfilled, broken = commitments
         commitment_score = max(0, (fulfilled / total_c) * 100 - (broken / total_c) * 30)
     else:
         commitment_score = 50  # neutral when no commitments
 
     # ── Response Pattern Score (10%) ─────────────────────────────────────
     # Simple heuristic: if there are recent interactions, we assume engagement
-    if len(interactions) >= 5:
-        response_score = min(100, len(interactions) * 5)
-    elif interactions:
+    if n >= 5:
+        response_score = min(100, n * 5)
+    elif n:
         response_score = 40
     else:
         response_score = 0
@@ -149,24 +131,10 @@ async def calculate_health_score(db: AsyncSession, contact_id) -> dict:
 
 
 async def recalculate_all(db: AsyncSession) -> int:
-    """Recalculate health scores for all non-deleted contacts. Returns count updated."""
-    result = await db.execute(
-        select(Contact.id).where(Contact.is_deleted == False)  # noqa: E712
-    )
-    contact_ids = result.scalars().all()
-
-    count = 0
-    for cid in contact_ids:
-        health = await calculate_health_score(db, cid)
-        await db.execute(
-            select(Contact).where(Contact.id == cid)
-        )
-        result2 = await db.execute(select(Contact).where(Contact.id == cid))
-        contact = result2.scalar_one_or_none()
-        if contact:
-            contact.relationship_health_score = health["score"]
-            contact.trust_decay_days = health["trust_decay_days"]
-            count += 1
-
-    await db.commit()
-    return count
+    """Recalculate health scores for all non-deleted contacts. Returns count updated.
+
+    Runs the streaming bulk pipeline in app.services.relationship_recompute.
+    """
+    from app.services.relationship_recompute import recompute_contacts
+
+    return await recompute_contacts(db, decay=False)
@@ -0,0 +1,76 @@
+"""Ripple CRM — Bulk relationship health and trust decay recomputation.
+
+One streaming pass over every contact's interactions (see
+app.services.interaction_stats) feeds both score_health and
+decay_from_stats; commitment counts come from a single grouped query.
+Contacts are written back with batched executemany UPDATEs by primary key,
+committed per batch, instead of a SELECT and ORM flush per contact.
+
+The interaction stream runs on its own connection so the per-batch commits
+on the session never close the server-side cursor.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.contact import Contact
+from app.services.interaction_stats import commitment_counts, stream_interaction_stats
+from app.services.relationship_health import score_health
+from app.services.trust_decay import decay_from_stats
+
+RECOMPUTE_BATCH = 1000  # contacts per UPDATE executemany / commit
+
+
+async def recompute_contacts(
+    db: AsyncSession,
+    health: bool = True,
+    decay: bool = True,
+    job=None,
+    batch_size: int = RECOMPUTE_BATCH,
+) -> int:
+    """Recompute health and/or trust decay for all non-deleted contacts.
+
+    Returns the number of contacts processed. ``job`` (see app.services.jobs)
+    receives progress as batches land.
+    """
+    now = datetime.now(timezone.utc)
+    commitments = await commitment_counts(db) if health else {}
+    if job is not None:
+        job.total = await db.scalar(
+            select(func.count()).select_from(Contact).where(Contact.is_deleted == False)  # noqa: E712
+        )
+
+    count = flushed = 0
+    batch: list[dict] = []
+    async with db.bind.connect() as conn:
+        async for stats in stream_interaction_stats(conn):
+            count += 1
+            values = {}
+            if health:
+                scored = score_health(stats, commitments.get(stats.contact_id), now)
+                values["relationship_health_score"] = scored["score"]
+                values["trust_decay_days"] = scored["trust_decay_days"]
+            if decay and stats.count:
+                # Contacts with no interactions keep their stored decay status
+                decayed = decay_from_stats(stats, now)
+                values["trust_decay_status"] = decayed["status"]
+                values["trust_decay_days"] = decayed["days_since_last"]
+            if values:
+                batch.append({"id": stats.contact_id, **values})
+            if len(batch) >= batch_size:
+                await _write(db, batch)
+                if job is not None:
+                    job.advance(count - flushed)
+                batch, flushed = [], count
+        await _write(db, batch)
+        if job is not None:
+            job.advance(count - flushed)
+    return count
+
+
+async def _write(db: AsyncSession, rows: list[dict]) -> None:
+    if rows:
+        await db.execute(update(Contact), rows)
+    await db.commit()
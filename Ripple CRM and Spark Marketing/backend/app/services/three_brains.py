@@ -7,9 +7,11 @@ Scores contacts across three dimensions:
 """
 
 import json
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import func, select
+from sqlalchemy import case, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.commitment import Commitment
@@ -20,37 +22,158 @@ from app.models.lead_score import LeadScore
 from app.models.tag import contact_tags
 from app.models.task import Task
 
+STAGE_WEIGHTS = {"lead": 10, "qualified": 30, "proposal": 50, "negotiation": 70, "closed_won": 100}
+FIT_FIELDS = ("email", "phone", "role", "title", "linkedin_url")
+MQL_THRESHOLD = 70
+SENTIMENT_WINDOW = 10  # most recent scored interactions averaged
+SCORE_BATCH = 500  # lead_scores rows written per statement batch
+
+
+@dataclass
+class ScoreInputs:
+    """Raw per-contact signals behind the three brains."""
+
+    fields_filled: int = 0
+    has_company: bool = False
+    relationship_health: float | None = None
+    tag_count: int = 0
+    recent_interactions: int = 0
+    last_interaction: datetime | None = None
+    best_stage: float = 0.0
+    tasks_total: int = 0
+    tasks_done: int = 0
+    avg_sentiment: float | None = None
+    commitments_total: int = 0
+    commitments_fulfilled: int = 0
+
+
+def _scoped(stmt, column, contact_ids):
+    return stmt if contact_ids is None else stmt.where(column.in_(contact_ids))
+
+
+async def gather_score_inputs(db: AsyncSession, contact_ids=None) -> dict[uuid.UUID, ScoreInputs]:
+    """Collect every scoring input with one grouped query per source table.
+
+    With ``contact_ids=None`` this covers all non-deleted contacts; otherwise
+    exactly the given contacts. The query count does not grow with the
+    number of contacts.
+    """
+    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+
+    stmt = select(
+        Contact.id,
+        *(getattr(Contact, f) for f in FIT_FIELDS),
+        Contact.company_id,
+        Contact.relationship_health_score,
+    )
+    if contact_ids is None:
+        stmt = stmt.where(Contact.is_deleted == False)  # noqa: E712
+    else:
+        stmt = stmt.where(Contact.id.in_(contact_ids))
+    inputs: dict[uuid.UUID, ScoreInputs] = {}
+    for cid, *fields, company_id, health in (await db.execute(stmt)).all():
+        inputs[cid] = ScoreInputs(
+            fields_filled=sum(1 for v in fields if v),
+            has_company=bool(company_id),
+            relationship_health=health,
+        )
+    if not inputs:
+        return inputs
 
-async def calculate_lead_score(db: AsyncSession, contact_id) -> dict:
-    """Calculate Three Brains lead score for a single contact."""
-
-    # Fetch contact
-    result = await db.execute(select(Contact).where(Contact.id == contact_id))
-    contact = result.scalar_one_or_none()
-    if not contact:
-        return None
-
-    now = datetime.now(timezone.utc)
-    thirty_days_ago = now - timedelta(days=30)
-
-    # ── Fit Brain (40%) ────────────────────────────────────────
-    fit_components = {}
+    # Tags
+    stmt = _scoped(
+        select(contact_tags.c.contact_id, func.count()).group_by(contact_tags.c.contact_id),
+        contact_tags.c.contact_id, contact_ids,
+    )
+    for cid, n in (await db.execute(stmt)).all():
+        if cid in inputs:
+            inputs[cid].tag_count = n
+
+    # Interactions: 30-day count and latest
+    stmt = _scoped(
+        select(
+            Interaction.contact_id,
+            func.count().filter(Interaction.occurred_at >= thirty_days_ago),
+            func.max(Interaction.occurred_at),
+        ).group_by(Interaction.contact_id),
+        Interaction.contact_id, contact_ids,
+    )
+    for cid, recent, last in (await db.execute(stmt)).all():
+        if cid in inputs:
+            inputs[cid].recent_interactions = recent or 0
+            inputs[cid].last_interaction = last
+
+    # Deals: furthest stage reached
+    stage_weight = case(STAGE_WEIGHTS, value=Deal.stage, else_=0)
+    stmt = _scoped(
+        select(Deal.contact_id, func.max(stage_weight))
+        .where(Deal.is_deleted == False)  # noqa: E712
+        .group_by(Deal.contact_id),
+        Deal.contact_id, contact_ids,
+    )
+    for cid, best in (await db.execute(stmt)).all():
+        if cid in inputs:
+            inputs[cid].best_stage = float(best or 0)
+
+    # Tasks: total and completed
+    stmt = _scoped(
+        select(
+            Task.contact_id,
+            func.count(),
+            func.count().filter(Task.status.in_(("done", "completed"))),
+        ).where(Task.contact_id.isnot(None)).group_by(Task.contact_id),
+        Task.contact_id, contact_ids,
+    )
+    for cid, total, done in (await db.execute(stmt)).all():
+        if cid in inputs:
+            inputs[cid].tasks_total, inputs[cid].tasks_done = total, done
+
+    # Sentiment: average of the most recent scored interactions
+    ranked = _scoped(
+        select(
+            Interaction.contact_id,
+            Interaction.sentiment_score,
+            func.row_number().over(
+                partition_by=Interaction.contact_id,
+                order_by=Interaction.occurred_at.desc(),
+            ).label("rn"),
+        ).where(Interaction.sentiment_score.isnot(None)),
+        Interaction.contact_id, contact_ids,
+    ).subquery()
+    stmt = (
+        select(ranked.c.contact_id, func.avg(ranked.c.sentiment_score))
+        .where(ranked.c.rn <= SENTIMENT_WINDOW)
+        .group_by(ranked.c.contact_id)
+    )
+    for cid, avg in (await db.execute(stmt)).all():
+        if cid in inputs:
+            inputs[cid].avg_sentiment = float(avg)
+
+    # Commitments: total and fulfilled
+    stmt = _scoped(
+        select(
+            Commitment.contact_id,
+            func.count(),
+            func.count().filter(Commitment.status == "fulfilled"),
+        ).where(Commitment.contact_id.isnot(None)).group_by(Commitment.contact_id),
+        Commitment.contact_id, contact_ids,
+    )
+    for cid, total, fulfilled in (await db.execute(stmt)).all():
+        if cid in inputs:
+            inputs[cid].commitments_total, inputs[cid].commitments_fulfilled = total, fulfilled
 
-    # Data completeness: check key fields
-    fields = ["email", "phone", "role", "title", "linkedin_url"]
-    filled = sum(1 for f in fields if getattr(contact, f, None))
-    fit_components["data_completeness"] = round((filled / len(fields)) * 100, 1)
+    return inputs
 
-    # Company association
-    fit_components["has_company"] = 100.0 if contact.company_id else 0.0
 
-    # Tag richness
-    tag_count_q = select(func.count()).select_from(contact_tags).where(
-        contact_tags.c.contact_id == contact_id
-    )
-    tag_count = (await db.execute(tag_count_q)).scalar() or 0
-    fit_components["tag_richness"] = min(100.0, tag_count * 25.0)  # 4+ tags = 100
+def score_contact(inp: ScoreInputs, now: datetime) -> dict:
+    """Turn raw signals into the three brain scores. Pure — no database access."""
 
+    # ── Fit Brain (40%) ────────────────────────────────────────
+    fit_components = {
+        "data_completeness": round((inp.fields_filled / len(FIT_FIELDS)) * 100, 1),
+        "has_company": 100.0 if inp.has_company else 0.0,
+        "tag_richness": min(100.0, inp.tag_count * 25.0),  # 4+ tags = 100
+    }
     fit_score = round(
         fit_components["data_completeness"] * 0.50
         + fit_components["has_company"] * 0.30
@@ -59,26 +182,11 @@ async def calculate_lead_score(db: AsyncSession, contact_id) -> dict:
     )
 
     # ── Intent Brain (35%) ─────────────────────────────────────
-    intent_components = {}
-
-    # Recent interactions (30d)
-    result = await db.execute(
-        select(func.count()).where(
-            Interaction.contact_id == contact_id,
-            Interaction.occurred_at >= thirty_days_ago,
-        )
-    )
-    recent_count = result.scalar() or 0
-    intent_components["recent_interactions"] = min(100.0, recent_count * 15.0)  # 7+ = 100
+    intent_components = {
+        "recent_interactions": min(100.0, inp.recent_interactions * 15.0),  # 7+ = 100
+    }
 
-    # Interaction recency
-    result = await db.execute(
-        select(Interaction.occurred_at)
-        .where(Interaction.contact_id == contact_id)
-        .order_by(Interaction.occurred_at.desc())
-        .limit(1)
-    )
-    last_interaction = result.scalar_one_or_none()
+    last_interaction = inp.last_interaction
     if last_interaction:
         if last_interaction.tzinfo is None:
             last_interaction = last_interaction.replace(tzinfo=timezone.utc)
@@ -94,28 +202,10 @@ async def calculate_lead_score(db: AsyncSession, contact_id) -> dict:
     else:
         intent_components["recency"] = 0.0
 
-    # Deal stage progression
-    result = await db.execute(
-        select(Deal.stage).where(
-            Deal.contact_id == contact_id, Deal.is_deleted == False  # noqa: E712
-        )
-    )
-    stages = [r for (r,) in result.all()]
-    stage_weights = {"lead": 10, "qualified": 30, "proposal": 50, "negotiation": 70, "closed_won": 100}
-    if stages:
-        best_stage = max(stage_weights.get(s, 0) for s in stages)
-        intent_components["deal_progression"] = float(best_stage)
-    else:
-        intent_components["deal_progression"] = 0.0
+    intent_components["deal_progression"] = inp.best_stage
 
-    # Task completion rate
-    result = await db.execute(
-        select(Task.status).where(Task.contact_id == contact_id)
-    )
-    task_statuses = [r for (r,) in result.all()]
-    if task_statuses:
-        done = sum(1 for s in task_statuses if s in ("done", "completed"))
-        intent_components["task_completion"] = round((done / len(task_statuses)) * 100, 1)
+    if inp.tasks_total:
+        intent_components["task_completion"] = round((inp.tasks_done / inp.tasks_total) * 100, 1)
     else:
         intent_components["task_completion"] = 50.0  # neutral
 
@@ -130,36 +220,17 @@ async def calculate_lead_score(db: AsyncSession, contact_id) -> dict:
     # ── Instinct Brain (25%) ───────────────────────────────────
     instinct_components = {}
 
-    # Average sentiment
-    result = await db.execute(
-        select(Interaction.sentiment_score)
-        .where(
-            Interaction.contact_id == contact_id,
-            Interaction.sentiment_score.isnot(None),
-        )
-        .order_by(Interaction.occurred_at.desc())
-        .limit(10)
-    )
-    sentiments = [r for (r,) in result.all()]
-    if sentiments:
-        avg_sent = sum(sentiments) / len(sentiments)
-        instinct_components["sentiment"] = round(max(0, min(100, (avg_sent + 1) * 50)), 1)
+    if inp.avg_sentiment is not None:
+        instinct_components["sentiment"] = round(max(0, min(100, (inp.avg_sentiment + 1) * 50)), 1)
     else:
         instinct_components["sentiment"] = 50.0
 
-    # Relationship health
-    health = contact.relationship_health_score
+    health = inp.relationship_health
     instinct_components["relationship_health"] = round(health, 1) if health else 50.0
 
-    # Commitment fulfilment
-    result = await db.execute(
-        select(Commitment.status).where(Commitment.contact_id == contact_id)
-    )
-    commitment_statuses = [r for (r,) in result.all()]
-    if commitment_statuses:
-        fulfilled = sum(1 for s in commitment_statuses if s == "fulfilled")
+    if inp.commitments_total:
         instinct_components["commitment_fulfilment"] = round(
-            (fulfilled / len(commitment_statuses)) * 100, 1
+            (inp.commitments_fulfilled / inp.commitments_total) * 100, 1
         )
     else:
         instinct_components["commitment_fulfilment"] = 50.0
@@ -174,9 +245,42 @@ async def calculate_lead_score(db: AsyncSession, contact_id) -> dict:
     # ── Composite ──────────────────────────────────────────────
     composite = round(fit_score * 0.40 + intent_score * 0.35 + instinct_score * 0.25, 1)
 
-    # MQL threshold (default 70)
-    MQL_THRESHOLD = 70
-    is_mql = composite >= MQL_THRESHOLD
+    return {
+        "fit_score": fit_score,
+        "intent_score": intent_score,
+        "instinct_score": instinct_score,
+        "composite_score": composite,
+        "fit_breakdown": {"score": fit_score, "components": fit_components},
+        "intent_breakdown": {"score": intent_score, "components": intent_components},
+        "instinct_breakdown": {"score": instinct_score, "components": instinct_components},
+        "is_mql": composite >= MQL_THRESHOLD,
+    }
+
+
+def _score_columns(scored: dict, now: datetime) -> dict:
+    """LeadScore column values for a scored contact."""
+    return {
+        "fit_score": scored["fit_score"],
+        "intent_score": scored["intent_score"],
+        "instinct_score": scored["instinct_score"],
+        "composite_score": scored["composite_score"],
+        "is_mql": scored["is_mql"],
+        "fit_breakdown": json.dumps(scored["fit_breakdown"]),
+        "intent_breakdown": json.dumps(scored["intent_breakdown"]),
+        "instinct_breakdown": json.dumps(scored["instinct_breakdown"]),
+        "calculated_at": now,
+    }
+
+
+async def calculate_lead_score(db: AsyncSession, contact_id) -> dict:
+    """Calculate Three Brains lead score for a single contact."""
+    inputs = await gather_score_inputs(db, [contact_id])
+    if contact_id not in inputs:
+        return None
+
+    now = datetime.now(timezone.utc)
+    scored = score_contact(inputs[contact_id], now)
+    columns = _score_columns(scored, now)
 
     # Upsert lead score
     result = await db.execute(
@@ -185,32 +289,12 @@ async def calculate_lead_score(db: AsyncSession, contact_id) -> dict:
         .order_by(LeadScore.calculated_at.desc())
         .limit(1)
     )
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        existing.fit_score = fit_score
-        existing.intent_score = intent_score
-        existing.instinct_score = instinct_score
-        existing.composite_score = composite
-        existing.is_mql = is_mql
-        existing.fit_breakdown = json.dumps({"score": fit_score, "components": fit_components})
-        existing.intent_breakdown = json.dumps({"score": intent_score, "components": intent_components})
-        existing.instinct_breakdown = json.dumps({"score": instinct_score, "components": instinct_components})
-        existing.calculated_at = now
-        lead_score = existing
+    lead_score = result.scalar_one_or_none()
+    if lead_score:
+        for key, value in columns.items():
+            setattr(lead_score, key, value)
     else:
-        lead_score = LeadScore(
-            contact_id=contact_id,
-            fit_score=fit_score,
-            intent_score=intent_score,
-            instinct_score=instinct_score,
-            composite_score=composite,
-            is_mql=is_mql,
-            fit_breakdown=json.dumps({"score": fit_score, "components": fit_components}),
-            intent_breakdown=json.dumps({"score": intent_score, "components": intent_components}),
-            instinct_breakdown=json.dumps({"score": instinct_score, "components": instinct_components}),
-            calculated_at=now,
-        )
+        lead_score = LeadScore(contact_id=contact_id, **columns)
         db.add(lead_score)
 
     await db.flush()
@@ -219,14 +303,7 @@ async def calculate_lead_score(db: AsyncSession, contact_id) -> dict:
     return {
         "id": lead_score.id,
         "contact_id": contact_id,
-        "fit_score": fit_score,
-        "intent_score": intent_score,
-        "instinct_score": instinct_score,
-        "composite_score": composite,
-        "fit_breakdown": {"score": fit_score, "components": fit_components},
-        "intent_breakdown": {"score": intent_score, "components": intent_components},
-        "instinct_breakdown": {"score": instinct_score, "components": instinct_components},
-        "is_mql": is_mql,
+        **scored,
         "calculated_at": lead_score.calculated_at,
     }
 
@@ -255,16 +332,49 @@ async def get_leaderboard(db: AsyncSession, limit: int = 20) -> list[dict]:
     ]
 
 
-async def recalculate_all(db: AsyncSession) -> int:
-    """Recalculate lead scores for all non-deleted contacts."""
-    result = await db.execute(
-        select(Contact.id).where(Contact.is_deleted == False)  # noqa: E712
-    )
-    contact_ids = result.scalars().all()
-    count = 0
-    for cid in contact_ids:
-        score = await calculate_lead_score(db, cid)
-        if score:
-            count += 1
-    await db.commit()
-    return count
+async def _latest_score_ids(db: AsyncSession) -> dict[uuid.UUID, uuid.UUID]:
+    """Newest LeadScore id per contact — the row a recalculation overwrites."""
+    ranked = select(
+        LeadScore.id,
+        LeadScore.contact_id,
+        func.row_number().over(
+            partition_by=LeadScore.contact_id,
+            order_by=LeadScore.calculated_at.desc(),
+        ).label("rn"),
+    ).subquery()
+    result = await db.execute(select(ranked.c.contact_id, ranked.c.id).where(ranked.c.rn == 1))
+    return dict(result.all())
+
+
+async def recalculate_all(db: AsyncSession, job=None, batch_size: int = SCORE_BATCH) -> int:
+    """Recalculate lead scores for all non-deleted contacts in bulk.
+
+    Inputs come from a fixed handful of grouped queries, scoring is a single
+    in-memory pass, and lead_scores rows are written with batched
+    executemany UPDATEs / INSERTs, committed per batch. ``job`` (see
+    app.services.jobs) receives progress as batches land.
+    """
+    now = datetime.now(timezone.utc)
+    inputs = await gather_score_inputs(db)
+    existing = await _latest_score_ids(db)
+    if job is not None:
+        job.total = len(inputs)
+
+    items = list(inputs.items())
+    for start in range(0, len(items), batch_size):
+        updates, inserts = [], []
+        for cid, inp in items[start:start + batch_size]:
+            columns = _score_columns(score_contact(inp, now), now)
+            score_id = existing.get(cid)
+            if score_id:
+                updates.append({"id": score_id, **columns})
+            else:
+                inserts.append({"id": uuid.uuid4(), "contact_id": cid, **columns})
+        if updates:
+            await db.execute(update(LeadScore), updates)
+        if inserts:
+            await db.execute(insert(LeadScore), inserts)
+        await db.commit()
+        if job is not None:
+            job.advance(len(updates) + len(inserts))
+    return len(items)
@@ -13,25 +13,31 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.contact import Contact
-from app.models.interaction import Interaction
+from app.services.interaction_stats import InteractionStats, load_interaction_stats
 
 
 async def compute_trust_decay(db: AsyncSession, contact_id) -> dict:
     """Compute trust decay for a single contact."""
+    stats = await load_interaction_stats(db, contact_id)
+    decay = decay_from_stats(stats, datetime.now(timezone.utc))
 
-    result = await db.execute(
-        select(Interaction.occurred_at)
-        .where(Interaction.contact_id == contact_id)
-        .order_by(Interaction.occurred_at.desc())
-    )
-    timestamps = [r for (r,) in result.all()]
+    # Update contact
+    if stats.count:
+        result = await db.execute(select(Contact).where(Contact.id == contact_id))
+        contact = result.scalar_one_or_none()
+        if contact:
+            contact.trust_decay_status = decay["status"]
+            contact.trust_decay_days = decay["days_since_last"]
 
-    now = datetime.now(timezone.utc)
+    return decay
 
-    if not timestamps:
+
+def decay_from_stats(stats: InteractionStats, now: datetime) -> dict:
+    """Trust decay from precomputed interaction stats."""
+    if not stats.count:
         status = "dormant"
         return {
-            "contact_id": contact_id,
+            "contact_id": stats.contact_id,
             "status": status,
             "days_since_last": None,
             "baseline_gap_days": None,
@@ -40,26 +46,11 @@ async def compute_trust_decay(db: AsyncSession, contact_id) -> dict:
             "interaction_count": 0,
         }
 
-    # Ensure timezone awareness
-    clean_ts = []
-    for ts in timestamps:
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=timezone.utc)
-        clean_ts.append(ts)
-
-    last = clean_ts[0]
-    days_since = (now - last).days
-
-    # Compute baseline gap (average gap between consecutive interactions)
-    if len(clean_ts) >= 2:
-        gaps = []
-        for i in range(len(clean_ts) - 1):
-            gap = (clean_ts[i] - clean_ts[i + 1]).days
-            if gap > 0:
-                gaps.append(gap)
-        baseline_gap = sum(gaps) / len(gaps) if gaps else 30.0
-    else:
-        baseline_gap = 30.0  # default if only one interaction
+    days_since = (now - stats.last).days
+
+    # Baseline gap: average positive gap between consecutive interactions,
+    # 30 days when there is only one interaction (or no positive gaps)
+    baseline_gap = stats.gap_sum / stats.gap_count if stats.gap_count else 30.0
 
     # Compute decay ratio
     if baseline_gap > 0:
@@ -77,21 +68,14 @@ async def compute_trust_decay(db: AsyncSession, contact_id) -> dict:
     else:
         status = "dormant"
 
-    # Update contact
-    result = await db.execute(select(Contact).where(Contact.id == contact_id))
-    contact = result.scalar_one_or_none()
-    if contact:
-        contact.trust_decay_status = status
-        contact.trust_decay_days = days_since
-
     return {
-        "contact_id": contact_id,
+        "contact_id": stats.contact_id,
         "status": status,
         "days_since_last": days_since,
         "baseline_gap_days": round(baseline_gap, 1),
         "decay_ratio": decay_ratio,
-        "last_interaction_at": last,
-        "interaction_count": len(clean_ts),
+        "last_interaction_at": stats.last,
+        "interaction_count": stats.count,
     }
 
 
@@ -120,14 +104,10 @@ async def get_at_risk(db: AsyncSession) -> list[dict]:
 
 
 async def recalculate_all(db: AsyncSession) -> int:
-    """Recalculate trust decay for all non-deleted contacts."""
-    result = await db.execute(
-        select(Contact.id).where(Contact.is_deleted == False)  # noqa: E712
-    )
-    contact_ids = result.scalars().all()
-    count = 0
-    for cid in contact_ids:
-        await compute_trust_decay(db, cid)
-        count += 1
-    await db.commit()
-    return count
+    """Recalculate trust decay for all non-deleted contacts.
+
+    Runs the streaming bulk pipeline in app.services.relationship_recompute.
+    """
+    from app.services.relationship_recompute import recompute_contacts
+
+    return await recompute_contacts(db, health=False)
@@ -14,6 +14,7 @@ Sections:
 """
 
 import os
+import time
 import uuid
 
 import requests
@@ -194,8 +195,17 @@ def test_lead_score_leaderboard():
 
 def test_lead_score_recalculate_all():
     r = requests.post(f"{BASE}/lead-scores/recalculate-all")
-    assert r.status_code == 200
-    assert "recalculated" in r.json()
+    assert r.status_code == 202
+    job = r.json()
+    assert job["kind"] == "lead_scores"
+    for _ in range(100):
+        job = requests.get(f"{BASE}/jobs/{job['job_id']}").json()
+        if job["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.1)
+    assert job["status"] == "completed"
+    assert "recalculated" in job["result"]
+    assert job["done"] == job["total"]
 
 
 def test_lead_score_nonexistent_contact():
@@ -11,6 +11,7 @@ Sections:
 """
 
 import os
+import time
 import uuid
 from datetime import date, timedelta
 
@@ -246,6 +247,21 @@ def test_recalculate_all():
     assert data["count"] >= 1
 
 
+def test_recompute_all_job():
+    r = requests.post(f"{BASE}/relationships/recompute-all")
+    assert r.status_code == 202
+    job = r.json()
+    assert job["kind"] == "relationship_recompute"
+    for _ in range(100):
+        job = requests.get(f"{BASE}/jobs/{job['job_id']}").json()
+        if job["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.1)
+    assert job["status"] == "completed"
+    assert job["result"]["recalculated"] >= 1
+    assert job["done"] == job["total"]
+
+
 # ══════════════════════════════════════════════════════════════════════════
 # SECTION 7 — Confidence Stamp
 # ══════════════════════════════════════════════════════════════════════════
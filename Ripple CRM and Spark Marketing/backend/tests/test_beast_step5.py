@@ -12,8 +12,11 @@ Sections:
 """
 
 import csv
+import gzip
 import io
+import json
 import os
+import time
 import uuid
 
 import requests
@@ -122,6 +125,29 @@ def test_import_contacts_commit():
     assert data["committed"] is True
     assert data["imported"] == 1
 
+def test_import_contacts_background_job():
+    csv_bytes = _make_csv(
+        ["first_name", "last_name", "email"],
+        [[f"BeastBg{_RUN_ID}", f"Row{i}", f"beastbg{_RUN_ID}.{i}@step5.test"] for i in range(25)]
+        + [[f"BeastBg{_RUN_ID}", "Row0", ""]],  # name duplicate of a row earlier in the file
+    )
+    r = requests.post(
+        f"{BASE}/import-export/import/contacts?commit=true&background=true",
+        files={"file": ("test.csv", csv_bytes, "text/csv")},
+    )
+    assert r.status_code == 202
+    job = r.json()
+    assert job["kind"] == "contact_import"
+    for _ in range(100):
+        job = requests.get(f"{BASE}/jobs/{job['job_id']}").json()
+        if job["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.1)
+    assert job["status"] == "completed"
+    assert job["result"]["total_rows"] == 26
+    assert job["result"]["imported"] == 25
+    assert job["result"]["duplicates"] == 1
+
 def test_import_rejects_non_csv():
     r = requests.post(
         f"{BASE}/import-export/import/contacts",
@@ -188,6 +214,23 @@ def test_export_contacts_has_headers():
     assert "first_name" in header
     assert "email" in header
 
+def test_export_contacts_ndjson():
+    r = requests.get(f"{BASE}/import-export/export/contacts?format=ndjson")
+    assert r.status_code == 200
+    assert "application/x-ndjson" in r.headers.get("content-type", "")
+    records = [json.loads(line) for line in r.text.splitlines()]
+    assert records  # contacts imported above
+    assert "first_name" in records[0]
+    assert "email" in records[0]
+
+def test_export_contacts_gzip():
+    plain = requests.get(f"{BASE}/import-export/export/contacts")
+    r = requests.get(f"{BASE}/import-export/export/contacts?gzip=true")
+    assert r.status_code == 200
+    assert ".csv.gz" in r.headers.get("content-disposition", "")
+    header = gzip.decompress(r.content).decode("utf-8").split("\n", 1)[0]
+    assert header == plain.text.split("\n", 1)[0]
+
 
 # ══════════════════════════════════════════════════════════════════════════
 # SECTION 6 — CSV Export deals
@@ -94,6 +94,15 @@ def test_pulse_snapshot_model_columns():
     assert expected.issubset(cols), f"Missing columns: {expected - cols}"
 
 
+def test_pulse_contact_fact_model_columns():
+    """PulseContactFact model has required columns."""
+    from app.models.pulse_fact import PulseContactFact
+    cols = {c.name for c in PulseContactFact.__table__.columns}
+    expected = {"contact_id", "last_interaction_at", "open_deal_count", "open_deal_value",
+                "last_won_value", "refreshed_at"}
+    assert expected.issubset(cols), f"Missing columns: {expected - cols}"
+
+
 def test_pulse_action_model_columns():
     """PulseAction model has required columns."""
     from app.models.pulse_action import PulseAction
@@ -360,6 +369,13 @@ def test_force_regenerate():
     assert "pipeline" in data
 
 
+def test_rebuild_contact_facts():
+    """POST /api/pulse/facts/rebuild rebuilds a fact row per contact."""
+    r = requests.post(f"{BASE}/pulse/facts/rebuild", timeout=60)
+    assert r.status_code == 200
+    assert r.json()["refreshed"] >= 1
+
+
 def test_no_targets_edge_case():
     """Pulse works even with no matching targets for edge dates."""
     r = requests.get(f"{BASE}/pulse/targets/current")
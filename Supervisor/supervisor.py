@@ -8,7 +8,7 @@ Components:
   2. Model Registry    — models.yaml, alias resolution, no hardcoded names
   3. Service Graph     — Dependency ordering, startup/shutdown, health checks
   4. LLM Router        — Local Ollama first, cloud fallback on failure
-  5. Health Guardian    — 30s health checks, auto-restart (3 retries), alerting
+  5. Health Guardian    — Async adaptive health probes, auto-restart (3 retries), alerting
   6. Cloud Fallback    — Anthropic/OpenAI transparent fallback
 
 Usage:
@@ -22,18 +22,24 @@ Usage:
 """
 
 import argparse
+import asyncio
+import hashlib
 import io
 import json
 import logging
 import os
+import random
 import socket
+import sqlite3
 import subprocess
 import sys
 import threading
 import time
 import urllib.error
 import urllib.request
+from array import array
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -54,7 +60,7 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from flask import Flask, jsonify, request as flask_request
+    from flask import Flask, Response, jsonify, request as flask_request
 except ImportError:
     print("Flask required: pip install flask")
     sys.exit(1)
@@ -77,6 +83,7 @@ BASE_DIR = Path(__file__).parent
 CONFIG_DIR = BASE_DIR / "config"
 LOGS_DIR = BASE_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
+CACHE_DIR = BASE_DIR / "cache"
 
 SOURCE_BASE = BASE_DIR.parent  # Source and Brand/
 
@@ -205,12 +212,43 @@ class ModelRegistry:
 # ═══════════════════════════════════════════════════════════════════════════
 
 class GPUScheduler:
-    """Tracks VRAM usage, manages model loading/unloading."""
+    """Tracks VRAM usage, manages model loading/unloading.
 
-    def __init__(self, registry):
+    Eviction and prewarming are driven by learned demand: every request bumps
+    a per-model, per-hour-of-day counter (decayed hourly, persisted to
+    logs/model_usage.json). When VRAM is tight, the set of models evicted is
+    the one with the lowest expected reload cost (expected reuse x size).
+    Prewarming waits while the request queue is serving another model.
+    """
+
+    USAGE_DECAY_PER_HOUR = 0.995  # ~6 day half-life on learned demand
+    RECENCY_WINDOW_S = 900
+
+    def __init__(self, registry, history_path=None, queue=None):
         self.registry = registry
+        self.queue = queue
         self.loaded_models = {}  # {ollama_name: {"vram_gb": float, "last_used": float}}
         self._lock = threading.Lock()
+        self.history_path = history_path or (LOGS_DIR / "model_usage.json")
+        self.usage = {}  # {ollama_name: [24 decayed request counts, one per hour of day]}
+        self.stats = {
+            "cold_loads": 0,
+            "warm_hits": 0,
+            "prewarm_loads": 0,
+            "prewarm_hits": 0,
+            "prewarm_deferred": 0,
+            "evictions": 0,
+            "avoided_swaps": 0,
+        }
+        self._prewarmed = set()  # loaded ahead of demand, not yet requested
+        self._spared = set()  # kept where plain LRU would have unloaded them
+        prewarm_cfg = registry.config.get("prewarm", {})
+        self.prewarm_schedule = prewarm_cfg.get("schedule", [])
+        self.prewarm_interval = prewarm_cfg.get("interval_seconds", 60)
+        self.prewarm_min_demand = prewarm_cfg.get("min_hourly_requests", 3)
+        self._prewarm_thread = None
+        self._last_decay = time.time()
+        self._load_history()
 
     def get_gpu_stats(self):
         """Get actual GPU VRAM usage from nvidia-smi."""
@@ -276,11 +314,25 @@ class GPUScheduler:
         Returns True if model is ready, False if loading failed.
         """
         with self._lock:
+            self._record_use(ollama_name)
             # Already loaded?
             if ollama_name in self.loaded_models:
                 self.loaded_models[ollama_name]["last_used"] = time.time()
+                self.stats["warm_hits"] += 1
+                if ollama_name in self._prewarmed:
+                    self._prewarmed.discard(ollama_name)
+                    self.stats["prewarm_hits"] += 1
+                if ollama_name in self._spared:
+                    self._spared.discard(ollama_name)
+                    self.stats["avoided_swaps"] += 1
                 return True
+            self.stats["cold_loads"] += 1
+
+        return self._load_model(ollama_name)
 
+    def _load_model(self, ollama_name, reason="request"):
+        """Make room if needed, then load the model by sending a minimal request."""
+        with self._lock:
             # Check VRAM budget
             info = self.registry.get_model_info(ollama_name)
             needed_gb = info.get("vram_gb", 6.0) if info else 6.0
@@ -289,9 +341,8 @@ class GPUScheduler:
             if available_gb < needed_gb:
                 self._evict_for_vram(needed_gb - available_gb)
 
-        # Load the model by sending a minimal request
         try:
-            logger.info(f"Loading model {ollama_name}...")
+            logger.info(f"Loading model {ollama_name} ({reason})...")
             resp = req_lib.post(
                 f"{OLLAMA_URL}/api/generate",
                 json={"model": ollama_name, "prompt": "", "keep_alive": "10m"},
@@ -320,24 +371,195 @@ class GPUScheduler:
         return total - reserved - used
 
     def _evict_for_vram(self, needed_gb):
-        """Unload least-recently-used models until we free enough VRAM."""
-        # Sort by last_used, oldest first. Never evict always_loaded models.
+        """Unload the cheapest set of models (by expected reload cost) that frees enough VRAM."""
+        # Never evict always_loaded models.
         evictable = []
         for name, info in self.loaded_models.items():
             model_info = self.registry.get_model_info(name)
             if model_info and model_info.get("always_loaded"):
                 continue
             evictable.append((name, info))
-        evictable.sort(key=lambda x: x[1]["last_used"])
+        if not evictable:
+            return
 
-        freed = 0
-        for name, info in evictable:
+        now = time.time()
+        victims = self._choose_victims(evictable, needed_gb, now)
+
+        # What plain LRU would have unloaded — anything it would have dropped
+        # but we kept counts as an avoided swap if it is requested again.
+        lru_victims, freed = set(), 0
+        for name, info in sorted(evictable, key=lambda x: x[1]["last_used"]):
             if freed >= needed_gb:
                 break
+            lru_victims.add(name)
+            freed += info["vram_gb"]
+        self._spared |= lru_victims - set(victims)
+
+        for name in victims:
             logger.info(f"Unloading model {name} to free VRAM...")
             self._unload_model(name)
-            freed += info["vram_gb"]
             del self.loaded_models[name]
+            self._spared.discard(name)
+            self._prewarmed.discard(name)
+            self.stats["evictions"] += 1
+
+    def _choose_victims(self, evictable, needed_gb, now):
+        """Minimise total expected reload cost subject to freeing needed_gb.
+
+        Loaded models are few, so small sets are solved exactly; larger ones
+        fall back to a greedy pass ordered by cost per GB freed.
+        """
+        costs = {name: self._reload_cost(name, info, now) for name, info in evictable}
+        if len(evictable) <= 12:
+            best, best_key = None, None
+            for mask in range(1, 1 << len(evictable)):
+                chosen = [evictable[i] for i in range(len(evictable)) if mask >> i & 1]
+                freed = sum(info["vram_gb"] for _, info in chosen)
+                if freed < needed_gb:
+                    continue
+                key = (sum(costs[n] for n, _ in chosen), len(chosen),
+                       max(info["last_used"] for _, info in chosen))
+                if best_key is None or key < best_key:
+                    best, best_key = [n for n, _ in chosen], key
+            if best is not None:
+                return best
+            return [n for n, _ in evictable]
+
+        ranked = sorted(evictable, key=lambda x: (costs[x[0]] / max(x[1]["vram_gb"], 0.1), x[1]["last_used"]))
+        victims, freed = [], 0
+        for name, info in ranked:
+            if freed >= needed_gb:
+                break
+            victims.append(name)
+            freed += info["vram_gb"]
+        return victims
+
+    def _reload_cost(self, name, info, now):
+        """Expected cost of having to reload a model: expected reuse x model size."""
+        return self.expected_reuse(name, now, last_used=info["last_used"]) * max(info["vram_gb"], 0.1)
+
+    def expected_reuse(self, name, now=None, last_used=None):
+        """Relative likelihood a model is needed soon.
+
+        Combines learned demand for this and the next hour of day, recency of
+        the last request, and any scheduled prewarm that is due.
+        """
+        now = now or time.time()
+        hour = datetime.fromtimestamp(now).hour
+        by_hour = self.usage.get(name)
+        demand = (by_hour[hour] + by_hour[(hour + 1) % 24]) if by_hour else 0.0
+        recency = 0.0
+        if last_used:
+            recency = 5.0 * max(0.0, 1 - (now - last_used) / self.RECENCY_WINDOW_S)
+        scheduled = 50.0 if name in self._scheduled_models(now) else 0.0
+        # Small floor so size still separates models with no history
+        return demand + recency + scheduled + 0.1
+
+    def _record_use(self, ollama_name):
+        hour = datetime.now().hour
+        self.usage.setdefault(ollama_name, [0.0] * 24)[hour] += 1
+
+    def _decay_usage(self):
+        hours = (time.time() - self._last_decay) / 3600
+        if hours < 1:
+            return
+        factor = self.USAGE_DECAY_PER_HOUR ** hours
+        with self._lock:
+            for name, by_hour in self.usage.items():
+                self.usage[name] = [round(c * factor, 4) for c in by_hour]
+        self._last_decay = time.time()
+
+    def _load_history(self):
+        try:
+            data = json.loads(Path(self.history_path).read_text(encoding="utf-8"))
+            self.usage = {k: v for k, v in data.get("usage", {}).items() if len(v) == 24}
+            self._last_decay = data.get("last_decay", time.time())
+        except (OSError, ValueError):
+            pass
+
+    def save_history(self):
+        with self._lock:
+            data = {"usage": self.usage, "last_decay": self._last_decay}
+        try:
+            Path(self.history_path).write_text(json.dumps(data), encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Could not save model usage history: {e}")
+
+    # ── Prewarming ───────────────────────────────────────────────────────
+
+    def _scheduled_models(self, now, lead_minutes=10):
+        """Models with a scheduled prewarm whose window (at .. at+lead) covers now."""
+        local = datetime.fromtimestamp(now)
+        day = local.strftime("%a").lower()
+        minute_of_day = local.hour * 60 + local.minute
+        due = set()
+        for entry in self.prewarm_schedule:
+            days = [d.lower()[:3] for d in entry.get("days", [])]
+            if days and day not in days:
+                continue
+            try:
+                hh, mm = (int(x) for x in str(entry.get("at", "")).split(":"))
+            except ValueError:
+                continue
+            if 0 <= minute_of_day - (hh * 60 + mm) < lead_minutes:
+                due.add(self.registry.resolve(entry["model"]))
+        return due
+
+    def predict_next_model(self, now=None):
+        """The unloaded model most likely to be needed next, with its reason."""
+        now = now or time.time()
+        for name in sorted(self._scheduled_models(now)):
+            if name not in self.loaded_models:
+                return name, "scheduled"
+        hour = datetime.fromtimestamp(now).hour
+        best, best_demand = None, 0.0
+        for name, by_hour in self.usage.items():
+            if name in self.loaded_models:
+                continue
+            demand = by_hour[hour] + by_hour[(hour + 1) % 24]
+            if demand > best_demand:
+                best, best_demand = name, demand
+        if best and best_demand >= self.prewarm_min_demand:
+            return best, "learned"
+        return None, None
+
+    def prewarm_tick(self, now=None):
+        """Load the predicted next model if it is worth it. Returns the model loaded, if any."""
+        name, reason = self.predict_next_model(now)
+        if not name:
+            return None
+        # Loading could evict the model a queued batch is running on — try next tick
+        if self.queue is not None and self.queue.busy_with_other(name):
+            with self._lock:
+                self.stats["prewarm_deferred"] += 1
+            return None
+        info = self.registry.get_model_info(name)
+        needed_gb = info.get("vram_gb", 6.0) if info else 6.0
+        # Learned predictions only fill free VRAM; scheduled ones may evict
+        if reason == "learned" and self._available_vram_gb() < needed_gb:
+            return None
+        if self._load_model(name, reason=f"prewarm:{reason}"):
+            with self._lock:
+                self._prewarmed.add(name)
+                self.stats["prewarm_loads"] += 1
+            return name
+        return None
+
+    def start_prewarmer(self):
+        """Run prewarm ticks and usage decay in a background thread."""
+        self._prewarm_thread = threading.Thread(target=self._prewarm_loop, daemon=True, name="GPUPrewarmer")
+        self._prewarm_thread.start()
+        logger.info(f"GPU prewarmer started ({self.prewarm_interval}s interval)")
+
+    def _prewarm_loop(self):
+        while True:
+            time.sleep(self.prewarm_interval)
+            try:
+                self._decay_usage()
+                self.prewarm_tick()
+                self.save_history()
+            except Exception as e:
+                logger.error(f"GPU prewarmer error: {e}")
 
     def _unload_model(self, ollama_name):
         """Tell Ollama to unload a model."""
@@ -364,6 +586,11 @@ class GPUScheduler:
                 "used_gb": round(sum(m["vram_gb"] for m in self.loaded_models.values()), 1),
                 "available_gb": round(self._available_vram_gb(), 1),
             },
+            "policy": {
+                **self.stats,
+                "predicted_next": self.predict_next_model()[0],
+                "tracked_models": len(self.usage),
+            },
         }
 
 
@@ -541,17 +768,396 @@ class CloudFallback:
 # 4. LLM ROUTER
 # ═══════════════════════════════════════════════════════════════════════════
 
+class RequestQueue:
+    """Admission queue that groups pending LLM requests by resolved model.
+
+    Requests for the active model are admitted (up to max_concurrent at once)
+    until its queue is empty or max_batch have been served; only then, once
+    in-flight work has drained, does the queue switch to the model whose
+    oldest request has waited longest. Identical buffered requests that are
+    already in flight are coalesced onto the first one's result.
+    """
+
+    def __init__(self, max_concurrent=4, max_batch=8):
+        self.max_concurrent = max_concurrent
+        self.max_batch = max_batch
+        self._cond = threading.Condition()
+        self._pending = {}  # {ollama_name: deque of job dicts}
+        self._inflight = {}  # {request_key: job dict}
+        self._running = 0
+        self._active_model = None
+        self._served_in_batch = 0
+        self.wait_ms = deque(maxlen=200)
+        self.stats = {"admitted": 0, "coalesced": 0, "model_switches": 0}
+
+    @staticmethod
+    def request_key(endpoint, body):
+        """Identity of a buffered request — same endpoint and same body."""
+        raw = json.dumps(body, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{endpoint}|{raw}".encode("utf-8")).hexdigest()
+
+    def submit(self, ollama_name, key, run):
+        """Run ``run()`` when the scheduler admits it. Returns run's (result, status).
+
+        Pass key=None for requests that must not be coalesced (streams).
+        """
+        with self._cond:
+            leader = self._inflight.get(key) if key else None
+            if leader is not None:
+                self.stats["coalesced"] += 1
+            else:
+                job = {"model": ollama_name, "enqueued": time.time(),
+                       "done": threading.Event(), "result": None}
+                self._pending.setdefault(ollama_name, deque()).append(job)
+                if key:
+                    self._inflight[key] = job
+                while not self._can_admit(job):
+                    self._cond.wait()
+                self._admit(job)
+
+        if leader is not None:
+            leader["done"].wait()
+            result, status = leader["result"]
+            return (dict(result) if isinstance(result, dict) else result), status
+
+        try:
+            result, status = run()
+        except Exception as e:
+            result, status = {"error": f"Request failed: {e}"}, 500
+        if isinstance(result, dict):
+            self._release(job, key, (result, status))
+            return result, status
+        # Streams hold their slot until the client has consumed them
+        return self._hold_until_drained(result, job, key), status
+
+    def _can_admit(self, job):
+        if self._running >= self.max_concurrent:
+            return False
+        model = self._next_model()
+        if model != job["model"] or self._pending[model][0] is not job:
+            return False
+        # Never run two models side by side — let the old batch finish first
+        return model == self._active_model or self._running == 0
+
+    def _next_model(self):
+        active = self._pending.get(self._active_model)
+        if active and self._served_in_batch < self.max_batch:
+            return self._active_model
+        waiting = [(q[0]["enqueued"], m) for m, q in self._pending.items() if q]
+        if not waiting:
+            return None
+        others = [w for w in waiting if w[1] != self._active_model]
+        return min(others or waiting)[1]
+
+    def _admit(self, job):
+        self._pending[job["model"]].popleft()
+        if job["model"] != self._active_model:
+            if self._active_model is not None:
+                self.stats["model_switches"] += 1
+            self._active_model = job["model"]
+            self._served_in_batch = 0
+        self._served_in_batch += 1
+        self._running += 1
+        self.stats["admitted"] += 1
+        self.wait_ms.append(int((time.time() - job["enqueued"]) * 1000))
+        self._cond.notify_all()
+
+    def _release(self, job, key, result):
+        job["result"] = result
+        job["done"].set()
+        with self._cond:
+            self._running -= 1
+            if key and self._inflight.get(key) is job:
+                del self._inflight[key]
+            self._cond.notify_all()
+
+    def _hold_until_drained(self, stream, job, key):
+        return _HeldStream(stream, lambda: self._release(job, key, ({"error": "stream already consumed"}, 409)))
+
+    def busy_with_other(self, ollama_name):
+        """True while another model is running or waiting in the queue."""
+        with self._cond:
+            if self._running and self._active_model != ollama_name:
+                return True
+            return any(q for m, q in self._pending.items() if m != ollama_name)
+
+    def to_dict(self):
+        with self._cond:
+            depth = {m: len(q) for m, q in self._pending.items() if q}
+            oldest = min((q[0]["enqueued"] for q in self._pending.values() if q), default=None)
+            waits = list(self.wait_ms)
+            return {
+                "pending": sum(depth.values()),
+                "pending_by_model": depth,
+                "running": self._running,
+                "active_model": self._active_model,
+                "max_concurrent": self.max_concurrent,
+                "max_batch": self.max_batch,
+                "oldest_wait_ms": int((time.time() - oldest) * 1000) if oldest else 0,
+                "avg_wait_ms": round(sum(waits) / len(waits)) if waits else 0,
+                "p95_wait_ms": round(sorted(waits)[int(len(waits) * 0.95)] if len(waits) >= 2 else 0),
+                **self.stats,
+            }
+
+
+class _HeldStream:
+    """Streamed response body that holds a resource (a queue slot, an upstream
+    response) until it is finished.
+
+    The resource is released by close(), which the WSGI server calls even when
+    the client goes away before the body starts; a generator's finally block
+    never runs if it is closed before its first next().
+    """
+
+    def __init__(self, stream, release):
+        self._stream = stream
+        self._release = release
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __iter__(self):
+        try:
+            yield from self._stream
+        finally:
+            self.close()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            if hasattr(self._stream, "close"):
+                self._stream.close()
+        finally:
+            self._release()
+
+
+class ResponseCache:
+    """Content-addressed SQLite cache for buffered LLM responses.
+
+    Keyed on (resolved model, endpoint, normalised messages/prompt, options).
+    Entries expire after ttl_seconds; once the store grows past max_mb the
+    least-recently-read entries are evicted.
+    """
+
+    # Request fields that change what the model produces
+    KEY_FIELDS = ("messages", "prompt", "system", "template", "format", "options", "images", "tools")
+
+    def __init__(self, path=None, ttl_seconds=86400, max_mb=256, enabled_by_default=False):
+        self.path = Path(path) if path else CACHE_DIR / "responses.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.enabled_by_default = enabled_by_default
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                endpoint TEXT,
+                body BLOB,
+                size INTEGER,
+                created REAL,
+                last_access REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self._conn.commit()
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def wants(self, body):
+        """Pop the per-request opt-in flag and decide whether to use the cache."""
+        flag = body.pop("cache", None)
+        if body.get("stream"):
+            return False
+        return self.enabled_by_default if flag is None else bool(flag)
+
+    @classmethod
+    def key(cls, endpoint, body):
+        normalised = {"model": body.get("model"), "endpoint": endpoint}
+        for field in cls.KEY_FIELDS:
+            if field not in body:
+                continue
+            value = body[field]
+            if field == "messages":
+                value = [
+                    {**m, "role": m.get("role", "user"), "content": " ".join(str(m.get("content", "")).split())}
+                    for m in value
+                ]
+            elif field == "prompt":
+                value = " ".join(str(value).split())
+            normalised[field] = value
+        raw = json.dumps(normalised, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, size, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row[2] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._bytes -= row[1]
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, model, endpoint, result):
+        blob = json.dumps({k: v for k, v in result.items() if k != "_source"}).encode("utf-8")
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, endpoint, body, size, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, model, endpoint, blob, len(blob), now, now),
+            )
+            self._bytes += len(blob) - (old[0] if old else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired entries, then least-recently-read ones down to 90% of max."""
+        cutoff = time.time() - self.ttl_seconds
+        self.evictions += self._conn.execute("DELETE FROM responses WHERE created < ?", (cutoff,)).rowcount
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        target = int(self.max_bytes * 0.9)
+        if self._bytes <= target:
+            return
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+            if self._bytes - freed <= target:
+                break
+            victims.append((key,))
+            freed += size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._bytes -= freed
+        self.evictions += len(victims)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "enabled_by_default": self.enabled_by_default,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_mb": round(self._bytes / (1024 * 1024), 2),
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+class VectorStore:
+    """Persistent embedding store — float32 blobs in SQLite keyed by content hash.
+
+    The key is sha256(model + text), so the same text is only ever embedded
+    once per model no matter which app asks for it.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else CACHE_DIR / "vectors.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS vectors (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                dim INTEGER,
+                vec BLOB,
+                created REAL
+            )
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def key(model, text):
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys):
+        """Return {key: [floats]} for the keys already stored."""
+        found = {}
+        keys = list(keys)
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                for key, blob in self._conn.execute(
+                    f"SELECT key, vec FROM vectors WHERE key IN ({marks})", chunk
+                ):
+                    vec = array("f")
+                    vec.frombytes(blob)
+                    found[key] = vec.tolist()
+        return found
+
+    def put_many(self, model, items):
+        """Store [(key, vector), ...] in one transaction."""
+        now = time.time()
+        rows = [(k, model, len(v), array("f", v).tobytes(), now) for k, v in items]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO vectors (key, model, dim, vec, created) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+
 class LLMRouter:
     """Routes LLM requests to Ollama with auto-restart on failure."""
 
-    def __init__(self, registry, gpu_scheduler):
+    def __init__(self, registry, gpu_scheduler, queue=None, cache=None, vectors=None,
+                 embed_batch_size=64, embed_batch_chars=32000):
         self.registry = registry
         self.gpu = gpu_scheduler
+        self.queue = queue
+        self.cache = cache
+        self.vectors = vectors
+        self.embed_batch_size = embed_batch_size
+        self.embed_batch_chars = embed_batch_chars
         self.metrics = {
             "total_requests": 0,
             "local_success": 0,
             "errors": 0,
+            "streamed_requests": 0,
             "latencies_ms": deque(maxlen=100),
+            "ttft_ms": deque(maxlen=100),
+            "tokens_per_sec": deque(maxlen=100),
+            "embeddings": {
+                "texts": 0,
+                "cache_hits": 0,
+                "computed": 0,
+                "batches": 0,
+                "texts_per_sec": deque(maxlen=100),
+            },
         }
         self._lock = threading.Lock()
 
@@ -564,18 +1170,113 @@ class LLMRouter:
         return self._proxy_request("/api/generate", body)
 
     def proxy_embed(self, body):
-        """Proxy /api/embed to Ollama (no cloud fallback for embeddings yet)."""
-        model = body.get("model", "nomic-embed-text")
-        body["model"] = self.registry.resolve(model)
-        self.gpu.ensure_model_loaded(body["model"])
+        """Proxy /api/embed (and legacy /api/embeddings) through the vector store.
+
+        Accepts Ollama's {"input": str | [str]} or the legacy {"prompt": str}
+        and answers in the matching shape. No cloud fallback for embeddings yet.
+        """
+        model = self.registry.resolve(body.get("model", "nomic-embed-text"))
+        legacy = "prompt" in body and "input" not in body
+        texts = body.get("prompt") if legacy else body.get("input", [])
+        if isinstance(texts, str):
+            texts = [texts]
+
+        result, status = self.embed_texts(model, texts, body)
+        if status != 200:
+            return result, status
+        if legacy:
+            return {"embedding": result["embeddings"][0] if result["embeddings"] else []}, 200
+        return {"model": model, "embeddings": result["embeddings"]}, 200
+
+    def embed_texts(self, model, texts, extra=None):
+        """Embed many texts, reusing stored vectors and batching the misses.
+
+        Returns ({"embeddings", "cached", "computed", "batches", "elapsed_ms"}, status).
+        """
+        start = time.time()
+        keys = [VectorStore.key(model, t) for t in texts]
+        known = self.vectors.get_many(set(keys)) if self.vectors else {}
+
+        # Deduplicate misses so repeated text in one call is embedded once
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in known and key not in missing:
+                missing[key] = text
+
+        batches = self._embed_batches(missing)
+        computed = {}
+        if missing:
+            passthrough = {k: v for k, v in (extra or {}).items()
+                           if k in ("truncate", "options", "keep_alive")}
+            for batch in batches:
+                payload = {**passthrough, "model": model, "input": [missing[k] for k in batch]}
+                if self.queue is None:
+                    result, status = self._embed_batch(payload)
+                else:
+                    # Each batch waits its turn in the embed model's group like any other request
+                    result, status = self.queue.submit(
+                        model, self.queue.request_key("/api/embed", payload),
+                        lambda payload=payload: self._embed_batch(payload),
+                    )
+                if status != 200:
+                    return result, status
+                vectors = result.get("embeddings", [])
+                if len(vectors) != len(batch):
+                    return {"error": f"Embedding failed: expected {len(batch)} vectors, got {len(vectors)}"}, 502
+                computed.update(zip(batch, vectors))
+            if self.vectors:
+                self.vectors.put_many(model, computed.items())
+
+        known.update(computed)
+        elapsed = time.time() - start
+        with self._lock:
+            em = self.metrics["embeddings"]
+            em["texts"] += len(texts)
+            em["cache_hits"] += len(texts) - len(computed)
+            em["computed"] += len(computed)
+            em["batches"] += len(batches)
+            if texts and elapsed > 0:
+                em["texts_per_sec"].append(round(len(texts) / elapsed, 1))
+        return {
+            "embeddings": [known[k] for k in keys],
+            "cached": len(texts) - len(computed),
+            "computed": len(computed),
+            "batches": len(batches),
+            "elapsed_ms": int(elapsed * 1000),
+        }, 200
+
+    def _embed_batch(self, payload):
+        """Load the embed model and send one batch to Ollama's /api/embed."""
+        self.gpu.ensure_model_loaded(payload["model"])
         try:
-            resp = req_lib.post(f"{OLLAMA_URL}/api/embed", json=body, timeout=30)
-            return resp.json(), resp.status_code
+            resp = req_lib.post(f"{OLLAMA_URL}/api/embed", json=payload, timeout=60)
+            if resp.status_code != 200:
+                return {"error": f"Embedding failed: Ollama HTTP {resp.status_code}"}, resp.status_code
+            return {"embeddings": resp.json().get("embeddings", [])}, 200
         except Exception as e:
             return {"error": f"Embedding failed: {e}"}, 503
 
+    def _embed_batches(self, texts_by_key):
+        """Split {key: text} into key batches bounded by count and total characters."""
+        batches, current, chars = [], [], 0
+        for key, text in texts_by_key.items():
+            size = len(text)
+            if current and (len(current) >= self.embed_batch_size or chars + size > self.embed_batch_chars):
+                batches.append(current)
+                current, chars = [], 0
+            current.append(key)
+            chars += size
+        if current:
+            batches.append(current)
+        return batches
+
     def _proxy_request(self, endpoint, body):
-        """Core routing logic: resolve model, ensure loaded, try Ollama, fallback."""
+        """Core routing logic: resolve model, ensure loaded, try Ollama, fallback.
+
+        Buffered requests return (dict, status). When the caller explicitly
+        asks for ``"stream": true`` the result is a generator of NDJSON lines
+        relayed from Ollama as they arrive.
+        """
         start = time.time()
 
         with self._lock:
@@ -586,9 +1287,38 @@ class LLMRouter:
         ollama_name = self.registry.resolve(model)
         body["model"] = ollama_name
 
-        # Ensure stream is false for Week 1
-        body["stream"] = False
+        # Only stream when asked to — Ollama defaults to streaming, but our
+        # callers have always received a single buffered JSON object.
+        stream = body.get("stream") is True
+        body["stream"] = stream
+
+        # Cache hits return before the queue and ensure_model_loaded — no VRAM swap
+        cache_key = None
+        if self.cache is not None and self.cache.wants(body):
+            cache_key = self.cache.key(endpoint, body)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                cached["_source"] = "cache"
+                logger.info(f"LLM request served from cache ({ollama_name})")
+                return cached, 200
+        else:
+            body.pop("cache", None)
+
+        if self.queue is None:
+            result, status = self._dispatch(endpoint, body, ollama_name, stream, start)
+        else:
+            key = None if stream else self.queue.request_key(endpoint, body)
+            result, status = self.queue.submit(
+                ollama_name, key,
+                lambda: self._dispatch(endpoint, body, ollama_name, stream, start),
+            )
+
+        if cache_key and status == 200:
+            self.cache.put(cache_key, ollama_name, endpoint, result)
+        return result, status
 
+    def _dispatch(self, endpoint, body, ollama_name, stream, start):
+        """Load the model and send the request to Ollama, retrying on failure."""
         # Ensure model is loaded
         self.gpu.ensure_model_loaded(ollama_name)
 
@@ -600,18 +1330,19 @@ class LLMRouter:
                     f"{OLLAMA_URL}{endpoint}",
                     json=body,
                     timeout=120,
+                    stream=stream,
                 )
                 if resp.status_code == 200:
+                    if stream:
+                        # Close the upstream response even if the relay never starts
+                        return _HeldStream(self._relay_stream(resp, ollama_name, start), resp.close), 200
                     result = resp.json()
                     result["_source"] = "local:ollama"
-                    latency = int((time.time() - start) * 1000)
-                    with self._lock:
-                        self.metrics["local_success"] += 1
-                        self.metrics["latencies_ms"].append(latency)
-                    logger.info(f"LLM request served locally ({ollama_name}, {latency}ms)")
+                    self._record_success(ollama_name, start, None, result)
                     return result, 200
                 else:
                     last_error = f"Ollama HTTP {resp.status_code}"
+                    resp.close()
             except Exception as e:
                 last_error = str(e)
 
@@ -620,7 +1351,71 @@ class LLMRouter:
                 logger.warning(f"Ollama attempt {attempt + 1} failed: {last_error}. Retrying in {delay}s...")
                 time.sleep(delay)
 
-        # All Ollama attempts failed — notify and suggest browser fallback
+        return self._ollama_failure(ollama_name, last_error)
+
+    def _relay_stream(self, resp, ollama_name, start):
+        """Yield Ollama NDJSON chunks as they arrive, recording TTFT on the way."""
+        first_chunk_at = None
+        chunks = 0
+        final = {}
+        try:
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                if first_chunk_at is None:
+                    first_chunk_at = time.time()
+                chunks += 1
+                # Only the closing chunk carries eval stats — skip parsing the rest
+                if b'"done":true' in line:
+                    try:
+                        final = json.loads(line)
+                    except ValueError:
+                        pass
+                yield line + b"\n"
+        except Exception as e:
+            logger.warning(f"Stream from {ollama_name} interrupted: {e}")
+            with self._lock:
+                self.metrics["errors"] += 1
+            yield json.dumps({"error": f"Stream interrupted: {e}", "done": True}).encode("utf-8") + b"\n"
+            return
+        finally:
+            resp.close()
+
+        if "eval_count" not in final:
+            final["eval_count"] = chunks
+        self._record_success(ollama_name, start, first_chunk_at, final)
+
+    def _record_success(self, ollama_name, start, first_chunk_at, result):
+        """Record latency, TTFT (streams only) and decode throughput."""
+        end = time.time()
+        latency = int((end - start) * 1000)
+
+        tokens = result.get("eval_count", 0)
+        eval_ns = result.get("eval_duration", 0)
+        if tokens and eval_ns:
+            tokens_per_sec = tokens / (eval_ns / 1e9)
+        elif tokens and first_chunk_at and end > first_chunk_at:
+            tokens_per_sec = tokens / (end - first_chunk_at)
+        else:
+            tokens_per_sec = None
+
+        with self._lock:
+            self.metrics["local_success"] += 1
+            self.metrics["latencies_ms"].append(latency)
+            if first_chunk_at is not None:
+                self.metrics["streamed_requests"] += 1
+                self.metrics["ttft_ms"].append(int((first_chunk_at - start) * 1000))
+            if tokens_per_sec is not None:
+                self.metrics["tokens_per_sec"].append(round(tokens_per_sec, 1))
+
+        if first_chunk_at is not None:
+            ttft = int((first_chunk_at - start) * 1000)
+            logger.info(f"LLM stream served locally ({ollama_name}, ttft {ttft}ms, total {latency}ms)")
+        else:
+            logger.info(f"LLM request served locally ({ollama_name}, {latency}ms)")
+
+    def _ollama_failure(self, ollama_name, last_error):
+        """All Ollama attempts failed — notify and suggest browser fallback."""
         logger.critical(f"Ollama failed after 3 attempts for {ollama_name}: {last_error}")
 
         with self._lock:
@@ -653,12 +1448,30 @@ class LLMRouter:
     def get_metrics(self):
         with self._lock:
             lats = list(self.metrics["latencies_ms"])
+            ttfts = list(self.metrics["ttft_ms"])
+            tps = list(self.metrics["tokens_per_sec"])
+            em = self.metrics["embeddings"]
+            em_tps = list(em["texts_per_sec"])
             return {
                 "total_requests": self.metrics["total_requests"],
                 "local_success": self.metrics["local_success"],
                 "errors": self.metrics["errors"],
+                "streamed_requests": self.metrics["streamed_requests"],
                 "avg_latency_ms": round(sum(lats) / len(lats)) if lats else 0,
                 "p95_latency_ms": round(sorted(lats)[int(len(lats) * 0.95)] if len(lats) >= 2 else 0),
+                "avg_ttft_ms": round(sum(ttfts) / len(ttfts)) if ttfts else 0,
+                "p95_ttft_ms": round(sorted(ttfts)[int(len(ttfts) * 0.95)] if len(ttfts) >= 2 else 0),
+                "avg_tokens_per_sec": round(sum(tps) / len(tps), 1) if tps else 0,
+                "cache": self.cache.stats() if self.cache else {"enabled": False},
+                "embeddings": {
+                    "texts": em["texts"],
+                    "cache_hits": em["cache_hits"],
+                    "computed": em["computed"],
+                    "batches": em["batches"],
+                    "cache_hit_rate": round(em["cache_hits"] / em["texts"], 3) if em["texts"] else 0,
+                    "avg_texts_per_sec": round(sum(em_tps) / len(em_tps), 1) if em_tps else 0,
+                    "stored_vectors": self.vectors.count() if self.vectors else 0,
+                },
             }
 
 
@@ -678,6 +1491,10 @@ class ServiceGraph:
         self.restart_policy = {}
         self.health_results = {}  # {service_id: {"status": str, "last_check": str, ...}}
         self.processes = {}  # {service_id: subprocess.Popen}
+        # Keep-alive pool shared by every HTTP health probe
+        self.http = req_lib.Session()
+        self.http.mount("http://", req_lib.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
+        self._probe_engine = None  # built on first check_all_health, reused after
         self.load()
 
     def load(self):
@@ -693,9 +1510,23 @@ class ServiceGraph:
         logger.info(f"Service graph loaded: {len(self.services)} services, "
                      f"{len(self.docker_services)} docker services")
 
+    def get_service(self, service_id):
+        return self.services.get(service_id) or self.docker_services.get(service_id)
+
+    def new_result(self, service_id, svc):
+        """Blank health result for a service, stamped with the check time."""
+        return {
+            "service": service_id,
+            "name": svc.get("name", service_id),
+            "port": svc.get("port", 0),
+            "status": "unknown",
+            "detail": "",
+            "last_check": datetime.now(timezone.utc).isoformat(),
+        }
+
     def check_health(self, service_id):
         """Check health of a single service. Returns dict."""
-        svc = self.services.get(service_id) or self.docker_services.get(service_id)
+        svc = self.get_service(service_id)
         if not svc:
             return {"status": "unknown", "detail": f"Service '{service_id}' not found"}
 
@@ -703,19 +1534,12 @@ class ServiceGraph:
         hc_type = hc.get("type", "tcp")
         port = svc.get("port", 0)
 
-        result = {
-            "service": service_id,
-            "name": svc.get("name", service_id),
-            "port": port,
-            "status": "unknown",
-            "detail": "",
-            "last_check": datetime.now(timezone.utc).isoformat(),
-        }
+        result = self.new_result(service_id, svc)
 
         if hc_type == "http":
             url = hc.get("url", f"http://localhost:{port}/")
             try:
-                resp = req_lib.get(url, timeout=5)
+                resp = self.http.get(url, timeout=5)
                 if resp.status_code < 500:
                     result["status"] = "healthy"
                     result["detail"] = f"HTTP {resp.status_code}"
@@ -746,13 +1570,10 @@ class ServiceGraph:
         return result
 
     def check_all_health(self):
-        """Check health of all services. Returns dict of results."""
-        results = {}
-        for sid in self.services:
-            results[sid] = self.check_health(sid)
-        for sid in self.docker_services:
-            results[sid] = self.check_health(sid)
-        return results
+        """Check health of all services concurrently. Returns dict of results."""
+        if self._probe_engine is None:
+            self._probe_engine = HealthProbeEngine(self)
+        return asyncio.run(self._probe_engine.probe_all())
 
     def start_service(self, service_id):
         """Start a service via its configured command."""
@@ -847,84 +1668,212 @@ class ServiceGraph:
 # 6. HEALTH GUARDIAN
 # ═══════════════════════════════════════════════════════════════════════════
 
+class HealthProbeEngine:
+    """Asyncio health-probe engine behind the Health Guardian and /api/services.
+
+    TCP probes run natively on the event loop; HTTP probes go through the
+    service graph's keep-alive session on a small executor. Every service has
+    its own adaptive interval — stretched while it stays healthy, cut to
+    min_interval while a watched service is failing — with +/-10% jitter so
+    probes never fire in lockstep. Results land in graph.health_results, so
+    readers always get the cached snapshot without triggering a probe.
+    """
+
+    def __init__(self, graph, min_interval=10, max_interval=120, on_result=None):
+        self.graph = graph
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.on_result = on_result  # fn(service_id, result) -> optional defer seconds
+        self.state = {}  # {service_id: {"interval": float, "next_due": float, "streak": int}}
+        self.probes = 0
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="probe")
+        self._loop = None
+        self._thread = None
+        self._running = False
+
+    def service_ids(self):
+        return list(self.graph.services) + list(self.graph.docker_services)
+
+    async def probe(self, service_id):
+        svc = self.graph.get_service(service_id)
+        hc = svc.get("health_check", {})
+        if hc.get("type", "tcp") == "http":
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, self.graph.check_health, service_id)
+        else:
+            result = self.graph.new_result(service_id, svc)
+            port = svc.get("port", 0)
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection("localhost", port), timeout=3)
+                writer.close()
+                result["status"] = "healthy"
+                result["detail"] = f"Port {port} open"
+            except Exception:
+                result["status"] = "unhealthy"
+                result["detail"] = f"Port {port} closed"
+            self.graph.health_results[service_id] = result
+        self.probes += 1
+        return result
+
+    async def probe_all(self):
+        """Probe every service once, concurrently."""
+        ids = self.service_ids()
+        results = await asyncio.gather(*(self.probe(sid) for sid in ids))
+        return dict(zip(ids, results))
+
+    def _reschedule(self, service_id, result, defer=None):
+        svc = self.graph.get_service(service_id)
+        base = svc.get("health_check", {}).get("interval_seconds", 30)
+        st = self.state.setdefault(service_id, {"interval": base, "next_due": 0, "streak": 0})
+        watched = not svc.get("on_demand") and service_id in self.graph.services
+        if result["status"] == "healthy":
+            st["streak"] += 1
+            if st["streak"] >= 3:
+                st["interval"] = min(self.max_interval, max(base, st["interval"] * 1.5))
+            else:
+                st["interval"] = base
+        else:
+            st["streak"] = 0
+            st["interval"] = self.min_interval if watched else base
+        wait = st["interval"] * random.uniform(0.9, 1.1)
+        st["next_due"] = time.time() + max(wait, defer or 0)
+
+    async def _probe_and_schedule(self, service_id):
+        try:
+            result = await self.probe(service_id)
+        except Exception as e:
+            logger.error(f"Health probe for {service_id} failed: {e}")
+            result = {"status": "unhealthy", "detail": str(e)}
+        defer = None
+        if self.on_result:
+            try:
+                defer = self.on_result(service_id, result)
+            except Exception as e:
+                logger.error(f"Health Guardian error: {e}")
+        self._reschedule(service_id, result, defer)
+
+    async def _run(self, initial_delay):
+        now = time.time()
+        for sid in self.service_ids():
+            self.state[sid] = {
+                "interval": self.graph.get_service(sid).get("health_check", {}).get("interval_seconds", 30),
+                "next_due": now + initial_delay + random.uniform(0, 2),
+                "streak": 0,
+            }
+        inflight = set()
+        while self._running:
+            now = time.time()
+            for sid, st in self.state.items():
+                if st["next_due"] <= now and sid not in inflight:
+                    inflight.add(sid)
+                    task = asyncio.ensure_future(self._probe_and_schedule(sid))
+                    task.add_done_callback(lambda _t, sid=sid: inflight.discard(sid))
+            next_due = min((st["next_due"] for sid, st in self.state.items() if sid not in inflight),
+                           default=now + 1)
+            await asyncio.sleep(min(max(next_due - time.time(), 0.05), 1.0))
+
+    def start(self, initial_delay=10):
+        self._running = True
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._run(initial_delay)), daemon=True, name="HealthProbeEngine",
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+
+    def to_dict(self):
+        now = time.time()
+        return {
+            "running": self._running,
+            "probes": self.probes,
+            "intervals": {
+                sid: {"interval_s": round(st["interval"], 1), "next_in_s": round(max(st["next_due"] - now, 0), 1)}
+                for sid, st in list(self.state.items())
+            },
+        }
+
+
 class HealthGuardian:
-    """Background thread: monitors critical services, auto-restarts on failure."""
+    """Monitors critical services through the probe engine, auto-restarts on failure."""
 
-    def __init__(self, service_graph):
+    def __init__(self, service_graph, engine=None):
         self.graph = service_graph
         self.failure_counts = {}
         self.restart_counts = {}
         self._running = False
-        self._thread = None
+        self.engine = engine or HealthProbeEngine(service_graph)
+        self.engine.on_result = self._handle_result
         self.log_buffer = deque(maxlen=200)
 
     def start(self):
-        """Start the guardian in a background thread."""
+        """Start the probe engine in a background thread."""
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True, name="HealthGuardian")
-        self._thread.start()
-        logger.info("Health Guardian started (30s interval)")
+        self.engine.start()
+        logger.info("Health Guardian started (adaptive intervals)")
 
     def stop(self):
         self._running = False
-
-    def _run(self):
-        # Initial delay to let services start
-        time.sleep(10)
-        while self._running:
-            try:
-                self._check_cycle()
-            except Exception as e:
-                logger.error(f"Health Guardian error: {e}")
-            time.sleep(30)
+        self.engine.stop()
 
     def _check_cycle(self):
-        """Run one health check cycle across all critical services."""
-        policy = self.graph.restart_policy
+        """Run one concurrent health check cycle across all services."""
+        results = asyncio.run(self.engine.probe_all())
+        for sid, result in results.items():
+            self._handle_result(sid, result)
 
-        for sid, svc in self.graph.services.items():
-            if svc.get("on_demand"):
-                continue
+    def _handle_result(self, sid, result):
+        """Apply failure counting and restart policy to one probe result.
 
-            result = self.graph.check_health(sid)
-            is_healthy = result["status"] == "healthy"
-            entry = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "service": sid,
-                "status": result["status"],
-                "detail": result["detail"],
-            }
-            self.log_buffer.append(entry)
-
-            if not is_healthy:
-                self.failure_counts[sid] = self.failure_counts.get(sid, 0) + 1
-                failures = self.failure_counts[sid]
-                logger.warning(f"[Guardian] {svc['name']} unhealthy (#{failures}): {result['detail']}")
-
-                if failures >= 3:
-                    retries = self.restart_counts.get(sid, 0)
-                    max_retries = policy.get("max_retries", 3)
-
-                    if retries < max_retries:
-                        delay = policy.get("retry_delay_seconds", 10) * (
-                            policy.get("backoff_multiplier", 2) ** retries
-                        )
-                        logger.info(f"[Guardian] Restarting {svc['name']} (attempt {retries + 1}/{max_retries})...")
-                        self.graph.restart_service(sid)
-                        self.restart_counts[sid] = retries + 1
-                        time.sleep(delay)
-                    elif retries == max_retries:
-                        logger.critical(
-                            f"[Guardian] {svc['name']} failed after {max_retries} restart attempts. "
-                            f"Manual intervention required."
-                        )
-                        self._write_alert(sid, svc)
-                        self.restart_counts[sid] = retries + 1  # prevent spamming
-            else:
-                if self.failure_counts.get(sid, 0) > 0:
-                    logger.info(f"[Guardian] {svc['name']} recovered")
-                self.failure_counts[sid] = 0
-                self.restart_counts[sid] = 0
+        Returns seconds to hold off the next probe (restart backoff) or None.
+        Restarts run on their own thread so the probe loop never blocks.
+        """
+        svc = self.graph.services.get(sid)
+        if not svc or svc.get("on_demand"):
+            return None
+        policy = self.graph.restart_policy
+
+        is_healthy = result["status"] == "healthy"
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "service": sid,
+            "status": result["status"],
+            "detail": result["detail"],
+        }
+        self.log_buffer.append(entry)
+
+        if not is_healthy:
+            self.failure_counts[sid] = self.failure_counts.get(sid, 0) + 1
+            failures = self.failure_counts[sid]
+            logger.warning(f"[Guardian] {svc['name']} unhealthy (#{failures}): {result['detail']}")
+
+            if failures >= 3:
+                retries = self.restart_counts.get(sid, 0)
+                max_retries = policy.get("max_retries", 3)
+
+                if retries < max_retries:
+                    delay = policy.get("retry_delay_seconds", 10) * (
+                        policy.get("backoff_multiplier", 2) ** retries
+                    )
+                    logger.info(f"[Guardian] Restarting {svc['name']} (attempt {retries + 1}/{max_retries})...")
+                    threading.Thread(
+                        target=self.graph.restart_service, args=(sid,), daemon=True, name=f"restart-{sid}",
+                    ).start()
+                    self.restart_counts[sid] = retries + 1
+                    return delay
+                elif retries == max_retries:
+                    logger.critical(
+                        f"[Guardian] {svc['name']} failed after {max_retries} restart attempts. "
+                        f"Manual intervention required."
+                    )
+                    self._write_alert(sid, svc)
+                    self.restart_counts[sid] = retries + 1  # prevent spamming
+        else:
+            if self.failure_counts.get(sid, 0) > 0:
+                logger.info(f"[Guardian] {svc['name']} recovered")
+            self.failure_counts[sid] = 0
+            self.restart_counts[sid] = 0
+        return None
 
     def _write_alert(self, service_id, svc):
         """Write alert to alerts.jsonl for ELAINE / friction-log."""
@@ -1065,7 +2014,7 @@ def api_health():
 
 @app.route("/api/status")
 def api_status():
-    # Use cached health results (updated every 30s by HealthGuardian)
+    # Use cached health results (kept fresh by the HealthProbeEngine)
     # instead of live check_all_health() which blocks 45-75s on down services
     services = service_graph.to_dict() if service_graph else {}
     gpu = gpu_scheduler.to_dict() if gpu_scheduler else {}
@@ -1077,6 +2026,7 @@ def api_status():
         "services": services,
         "gpu": gpu,
         "metrics": llm_router.get_metrics() if llm_router else {},
+        "health_probes": health_guardian.engine.to_dict() if health_guardian else {},
         "timestamp": datetime.now(timezone.utc).isoformat(),
     })
 
@@ -1138,6 +2088,7 @@ def api_gpu():
 
 @app.route("/api/services")
 def api_services():
+    # Cached snapshot maintained by the probe engine — never probes inline
     if not service_graph:
         return jsonify({"error": "Service graph not loaded"}), 503
     return jsonify(service_graph.to_dict())
@@ -1171,8 +2122,9 @@ def api_restart_service(service_id):
 
 @app.route("/api/queue")
 def api_queue():
-    # Week 1: simple queue indicator
-    return jsonify({"pending": 0, "note": "Queue tracking in v1.1"})
+    if llm_router and llm_router.queue:
+        return jsonify(llm_router.queue.to_dict())
+    return jsonify({"pending": 0, "note": "Request queue not initialized"})
 
 
 @app.route("/api/logs")
@@ -1207,18 +2159,25 @@ def api_boot():
 
 # ── Ollama-Compatible Proxy Endpoints ────────────────────────────────────
 
+def _llm_response(result, status):
+    """Buffered results go out as JSON, streamed ones as chunked NDJSON."""
+    if isinstance(result, dict):
+        return jsonify(result), status
+    return Response(result, status=status, mimetype="application/x-ndjson")
+
+
 @app.route("/api/chat", methods=["POST"])
 def proxy_chat():
     body = flask_request.get_json(force=True, silent=True) or {}
     result, status = llm_router.proxy_chat(body)
-    return jsonify(result), status
+    return _llm_response(result, status)
 
 
 @app.route("/api/generate", methods=["POST"])
 def proxy_generate():
     body = flask_request.get_json(force=True, silent=True) or {}
     result, status = llm_router.proxy_generate(body)
-    return jsonify(result), status
+    return _llm_response(result, status)
 
 
 @app.route("/api/embed", methods=["POST"])
@@ -1229,6 +2188,22 @@ def proxy_embed():
     return jsonify(result), status
 
 
+@app.route("/api/embed/batch", methods=["POST"])
+def api_embed_batch():
+    """Embed many texts in one call. Body: {"model": "embeddings", "inputs": [...]}"""
+    body = flask_request.get_json(force=True, silent=True) or {}
+    inputs = body.get("inputs", [])
+    if not isinstance(inputs, list) or not all(isinstance(t, str) for t in inputs):
+        return jsonify({"error": "inputs must be a list of strings"}), 400
+    model = registry.resolve(body.get("model", "embeddings"))
+    result, status = llm_router.embed_texts(model, inputs, body)
+    if status == 200:
+        elapsed_s = result["elapsed_ms"] / 1000
+        result["model"] = model
+        result["texts_per_sec"] = round(len(inputs) / elapsed_s, 1) if elapsed_s > 0 else None
+    return jsonify(result), status
+
+
 @app.route("/api/tags")
 def proxy_tags():
     """Proxy to Ollama /api/tags — list available models."""
@@ -1310,8 +2285,25 @@ def main():
     logger.info("Initializing The Supervisor...")
 
     registry = ModelRegistry()
-    gpu_scheduler = GPUScheduler(registry)
-    llm_router = LLMRouter(registry, gpu_scheduler)
+    queue_cfg = registry.config.get("queue", {})
+    request_queue = RequestQueue(
+        max_concurrent=queue_cfg.get("max_concurrent", 4),
+        max_batch=queue_cfg.get("max_batch", 8),
+    )
+    gpu_scheduler = GPUScheduler(registry, queue=request_queue)
+    cache_cfg = registry.config.get("cache", {})
+    response_cache = ResponseCache(
+        ttl_seconds=cache_cfg.get("ttl_seconds", 86400),
+        max_mb=cache_cfg.get("max_mb", 256),
+        enabled_by_default=cache_cfg.get("enabled_by_default", False),
+    )
+    embed_cfg = registry.config.get("embeddings", {})
+    llm_router = LLMRouter(
+        registry, gpu_scheduler, request_queue, response_cache,
+        vectors=VectorStore(),
+        embed_batch_size=embed_cfg.get("batch_size", 64),
+        embed_batch_chars=embed_cfg.get("batch_chars", 32000),
+    )
     service_graph = ServiceGraph()
     health_guardian = HealthGuardian(service_graph)
     boot_sequencer = BootSequencer(service_graph, gpu_scheduler, registry)
@@ -1329,13 +2321,14 @@ def main():
 
     # Start Health Guardian
     health_guardian.start()
+    gpu_scheduler.start_prewarmer()
 
     START_TIME = time.time()
 
     print(f"  Port: {args.port}")
     print(f"  Models: {len(registry.models)} registered")
     print(f"  Services: {len(service_graph.services)} managed")
-    print(f"  Health Guardian: active (30s interval)")
+    print(f"  Health Guardian: active (adaptive intervals)")
     print(f"  Ollama proxy: http://localhost:{args.port}/api/chat")
     print(f"  Dashboard: http://localhost:{args.port}/api/status")
     print(f"\n  \"The Supervisor is the backbone.\"\n")
@@ -141,8 +141,8 @@ print("2. UNIT TESTS")
 print("=" * 60)
 
 from supervisor import (
-    ModelRegistry, GPUScheduler, LLMRouter,
-    ServiceGraph, HealthGuardian, BootSequencer
+    ModelRegistry, GPUScheduler, LLMRouter, RequestQueue, ResponseCache, VectorStore,
+    ServiceGraph, HealthGuardian, HealthProbeEngine, BootSequencer
 )
 
 # ── Model Registry Tests ─────────────────────────────────────────────────
@@ -249,6 +249,63 @@ def test_eviction_never_removes_always_loaded():
     assert "nomic-embed-text" in gpu.loaded_models, "nomic-embed-text was wrongly evicted"
 
 
+def test_eviction_weighs_expected_reuse():
+    import tempfile
+    reg = ModelRegistry()
+    gpu = GPUScheduler(reg, history_path=Path(tempfile.mkdtemp()) / "usage.json")
+    now = time.time()
+    hour = datetime.fromtimestamp(now).hour
+    # gemma2 is least recently used but in heavy demand at this hour of day
+    gpu.usage["gemma2:27b"] = [0.0] * 24
+    gpu.usage["gemma2:27b"][hour] = 20.0
+    gpu.loaded_models["gemma2:27b"] = {"vram_gb": 6.0, "last_used": now - 3600}
+    gpu.loaded_models["qwen3:4b"] = {"vram_gb": 2.5, "last_used": now - 600}
+    gpu._unload_model = MagicMock()
+    with gpu._lock:
+        gpu._evict_for_vram(2.0)
+    assert "gemma2:27b" in gpu.loaded_models
+    assert "qwen3:4b" not in gpu.loaded_models
+    assert gpu.ensure_model_loaded("gemma2:27b") is True
+    assert gpu.stats["avoided_swaps"] == 1
+    assert gpu.stats["warm_hits"] == 1
+
+
+def test_prewarm_follows_schedule():
+    import tempfile
+    reg = ModelRegistry()
+    gpu = GPUScheduler(reg, history_path=Path(tempfile.mkdtemp()) / "usage.json")
+    now = time.time()
+    gpu.prewarm_schedule = [{"model": "fast", "at": datetime.fromtimestamp(now).strftime("%H:%M")}]
+    assert gpu.predict_next_model(now) == ("qwen3:4b", "scheduled")
+    gpu._load_model = MagicMock(side_effect=lambda name, reason="": gpu.loaded_models.update(
+        {name: {"vram_gb": 2.5, "last_used": now}}) or True)
+    assert gpu.prewarm_tick(now) == "qwen3:4b"
+    gpu.ensure_model_loaded("qwen3:4b")
+    assert gpu.stats["prewarm_hits"] == 1
+    assert gpu.stats["cold_loads"] == 0
+    assert gpu.to_dict()["policy"]["prewarm_loads"] == 1
+
+
+def test_prewarm_defers_while_queue_serves_another_model():
+    import tempfile
+    import threading
+    reg = ModelRegistry()
+    queue = RequestQueue(max_concurrent=1)
+    gpu = GPUScheduler(reg, history_path=Path(tempfile.mkdtemp()) / "usage.json", queue=queue)
+    now = time.time()
+    gpu.prewarm_schedule = [{"model": "fast", "at": datetime.fromtimestamp(now).strftime("%H:%M")}]
+    gpu._load_model = MagicMock(return_value=True)
+    gate = threading.Event()
+    worker = threading.Thread(target=queue.submit, args=("gemma2:27b", None, lambda: ({"done": gate.wait(5)}, 200)))
+    worker.start()
+    time.sleep(0.05)
+    assert gpu.prewarm_tick(now) is None  # would evict the running batch's model
+    assert gpu._load_model.call_count == 0 and gpu.stats["prewarm_deferred"] == 1
+    gate.set()
+    worker.join(5)
+    assert gpu.prewarm_tick(now) == "qwen3:4b"  # queue idle again
+
+
 def test_gpu_to_dict():
     reg = ModelRegistry()
     gpu = GPUScheduler(reg)
@@ -261,6 +318,9 @@ def test_gpu_to_dict():
 test("GPU stats (nvidia-smi or estimated)", test_gpu_stats, critical=False)
 test("VRAM budget calculation", test_vram_budget_calculation)
 test("Eviction protects always_loaded models", test_eviction_never_removes_always_loaded)
+test("Eviction weighs expected reuse against size", test_eviction_weighs_expected_reuse)
+test("Prewarm follows schedule and counts hits", test_prewarm_follows_schedule)
+test("Prewarm waits while the queue serves another model", test_prewarm_defers_while_queue_serves_another_model)
 test("GPU to_dict", test_gpu_to_dict)
 
 # ── Service Graph Tests ──────────────────────────────────────────────────
@@ -336,8 +396,253 @@ def test_router_metrics():
     assert m["errors"] == 0
 
 
+class _FakeOllamaResponse:
+    """Minimal stand-in for a requests.Response from Ollama."""
+
+    def __init__(self, lines=None, payload=None, status_code=200):
+        self.status_code = status_code
+        self._lines = lines or []
+        self._payload = payload or {}
+        self.closed = False
+
+    def iter_lines(self):
+        for line in self._lines:
+            yield line
+
+    def json(self):
+        return self._payload
+
+    def close(self):
+        self.closed = True
+
+
+def test_router_streams_ndjson():
+    reg = ModelRegistry()
+    gpu = GPUScheduler(reg)
+    gpu.ensure_model_loaded = MagicMock(return_value=True)
+    router = LLMRouter(reg, gpu)
+    lines = [
+        b'{"message":{"content":"Hel"},"done":false}',
+        b'{"message":{"content":"lo"},"done":false}',
+        b'{"message":{"content":""},"done":true,"eval_count":2,"eval_duration":100000000}',
+    ]
+    fake = _FakeOllamaResponse(lines=lines)
+    with patch("supervisor.req_lib.post", return_value=fake) as post:
+        result, status = router.proxy_chat({"model": "reasoning", "stream": True, "messages": []})
+        assert status == 200
+        assert post.call_args.kwargs["stream"] is True
+        chunks = list(result)
+    assert len(chunks) == 3
+    assert all(c.endswith(b"\n") for c in chunks)
+    assert fake.closed
+    m = router.get_metrics()
+    assert m["streamed_requests"] == 1
+    assert m["local_success"] == 1
+    assert m["avg_tokens_per_sec"] == 20.0
+
+
+def test_router_buffers_by_default():
+    reg = ModelRegistry()
+    gpu = GPUScheduler(reg)
+    gpu.ensure_model_loaded = MagicMock(return_value=True)
+    router = LLMRouter(reg, gpu)
+    fake = _FakeOllamaResponse(payload={"message": {"content": "hi"}, "done": True})
+    with patch("supervisor.req_lib.post", return_value=fake) as post:
+        body = {"model": "reasoning", "messages": []}
+        result, status = router.proxy_chat(body)
+    assert status == 200
+    assert body["stream"] is False
+    assert post.call_args.kwargs["stream"] is False
+    assert result["_source"] == "local:ollama"
+    assert router.get_metrics()["streamed_requests"] == 0
+
+
+def test_queue_drains_active_model_first():
+    import threading
+    q = RequestQueue(max_concurrent=1, max_batch=8)
+    order = []
+    gate = threading.Event()
+
+    def job(name, block=False):
+        def run():
+            if block:
+                gate.wait(5)
+            order.append(name)
+            return {"model": name}, 200
+        return run
+
+    first = threading.Thread(target=q.submit, args=("a", None, job("a1", block=True)))
+    first.start()
+    time.sleep(0.05)
+    waiters = [
+        threading.Thread(target=q.submit, args=("b", None, job("b1"))),
+        threading.Thread(target=q.submit, args=("a", None, job("a2"))),
+    ]
+    for t in waiters:
+        t.start()
+        time.sleep(0.05)
+    assert q.to_dict()["pending"] == 2
+    gate.set()
+    for t in [first] + waiters:
+        t.join(5)
+    assert order == ["a1", "a2", "b1"], order
+    assert q.to_dict()["model_switches"] == 1
+
+
+def test_queue_coalesces_identical_requests():
+    import threading
+    q = RequestQueue(max_concurrent=4)
+    calls = []
+    gate = threading.Event()
+    key = RequestQueue.request_key("/api/chat", {"model": "a", "messages": []})
+
+    def run():
+        calls.append(1)
+        gate.wait(5)
+        return {"message": {"content": "same"}}, 200
+
+    out = []
+    threads = [threading.Thread(target=lambda: out.append(q.submit("a", key, run))) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    gate.set()
+    for t in threads:
+        t.join(5)
+    assert len(calls) == 1
+    assert len(out) == 3 and all(r == ({"message": {"content": "same"}}, 200) for r in out)
+    assert q.to_dict()["coalesced"] == 2
+
+
+def test_queue_releases_unstarted_stream():
+    q = RequestQueue(max_concurrent=1)
+
+    def stream():
+        yield b'{"done": true}\n'
+
+    body, status = q.submit("a", None, lambda: (stream(), 200))
+    assert status == 200 and q.to_dict()["running"] == 1
+    body.close()  # client disconnected before the first chunk was sent
+    assert q.to_dict()["running"] == 0
+    body.close()  # closing twice must not release twice
+    assert q.to_dict()["running"] == 0
+
+    body, _ = q.submit("a", None, lambda: (stream(), 200))
+    assert list(body) == [b'{"done": true}\n']
+    assert q.to_dict()["running"] == 0
+
+
+def test_router_closes_upstream_of_unstarted_stream():
+    reg = ModelRegistry()
+    gpu = GPUScheduler(reg)
+    gpu.ensure_model_loaded = MagicMock(return_value=True)
+    queue = RequestQueue(max_concurrent=1)
+    router = LLMRouter(reg, gpu, queue)
+    fake = _FakeOllamaResponse(lines=[b'{"done":true}'])
+    with patch("supervisor.req_lib.post", return_value=fake):
+        body, status = router.proxy_chat({"model": "reasoning", "stream": True, "messages": []})
+    assert status == 200 and queue.to_dict()["running"] == 1
+    body.close()  # client disconnected before the first chunk was sent
+    assert fake.closed
+    assert queue.to_dict()["running"] == 0
+
+
+def test_cache_hit_skips_model_load():
+    import tempfile
+    reg = ModelRegistry()
+    gpu = GPUScheduler(reg)
+    gpu.ensure_model_loaded = MagicMock(return_value=True)
+    cache = ResponseCache(path=Path(tempfile.mkdtemp()) / "responses.db")
+    router = LLMRouter(reg, gpu, cache=cache)
+    fake = _FakeOllamaResponse(payload={"message": {"content": "brief"}, "done": True})
+
+    def body():
+        return {"model": "reasoning", "cache": True,
+                "messages": [{"role": "user", "content": "Render  the brief"}]}
+
+    with patch("supervisor.req_lib.post", return_value=fake) as post:
+        first, _ = router.proxy_chat(body())
+        second_body = body()
+        second_body["messages"][0]["content"] = "Render the brief "  # whitespace-normalised
+        second, status = router.proxy_chat(second_body)
+        assert "cache" not in post.call_args.kwargs["json"]
+    assert post.call_count == 1
+    assert gpu.ensure_model_loaded.call_count == 1
+    assert status == 200 and second["_source"] == "cache"
+    assert second["message"]["content"] == "brief"
+    stats = router.get_metrics()["cache"]
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_cache_is_opt_in_and_evicts():
+    import tempfile
+    cache = ResponseCache(path=Path(tempfile.mkdtemp()) / "responses.db", max_mb=0.001)
+    assert cache.wants({"messages": []}) is False
+    assert cache.wants({"messages": [], "cache": True}) is True
+    assert cache.wants({"stream": True, "cache": True}) is False
+    for i in range(20):
+        cache.put(f"k{i}", "m", "/api/chat", {"response": "x" * 100})
+    assert cache.stats()["evictions"] > 0
+    assert cache.get("k19") is not None
+    assert cache.get("k0") is None
+
+
+def test_embed_batches_and_reuses_vectors():
+    import tempfile
+    reg = ModelRegistry()
+    gpu = GPUScheduler(reg)
+    gpu.ensure_model_loaded = MagicMock(return_value=True)
+    store = VectorStore(path=Path(tempfile.mkdtemp()) / "vectors.db")
+    router = LLMRouter(reg, gpu, vectors=store, embed_batch_size=2)
+
+    def fake_post(url, json=None, timeout=None):
+        return _FakeOllamaResponse(payload={"embeddings": [[float(len(t)), 0.5] for t in json["input"]]})
+
+    with patch("supervisor.req_lib.post", side_effect=fake_post) as post:
+        first, status = router.embed_texts("nomic-embed-text", ["a", "bb", "ccc", "a"])
+        assert status == 200
+        assert first["computed"] == 3 and first["cached"] == 1 and first["batches"] == 2
+        assert first["embeddings"][0] == first["embeddings"][3] == [1.0, 0.5]
+        second, _ = router.proxy_embed({"model": "embeddings", "input": ["ccc", "bb"]})
+        legacy, _ = router.proxy_embed({"model": "embeddings", "prompt": "a"})
+    assert post.call_count == 2
+    assert second["embeddings"] == [[3.0, 0.5], [2.0, 0.5]]
+    assert legacy == {"embedding": [1.0, 0.5]}
+    em = router.get_metrics()["embeddings"]
+    assert em["stored_vectors"] == 3
+    assert em["cache_hits"] == 4 and em["computed"] == 3
+
+
+def test_embed_batches_go_through_queue():
+    reg = ModelRegistry()
+    gpu = GPUScheduler(reg)
+    gpu.ensure_model_loaded = MagicMock(return_value=True)
+    queue = RequestQueue()
+    router = LLMRouter(reg, gpu, queue, embed_batch_size=2)
+
+    def fake_post(url, json=None, timeout=None):
+        assert queue.to_dict()["active_model"] == "nomic-embed-text"
+        return _FakeOllamaResponse(payload={"embeddings": [[1.0]] * len(json["input"])})
+
+    with patch("supervisor.req_lib.post", side_effect=fake_post):
+        result, status = router.embed_texts("nomic-embed-text", ["a", "bb", "ccc"])
+    assert status == 200 and result["batches"] == 2
+    stats = queue.to_dict()
+    assert stats["admitted"] == 2 and stats["running"] == 0
+
+
 test("LLM Router initializes", test_router_init)
 test("LLM Router metrics", test_router_metrics)
+test("LLM Router streams NDJSON chunks", test_router_streams_ndjson)
+test("LLM Router buffers unless stream requested", test_router_buffers_by_default)
+test("Request queue drains active model before switching", test_queue_drains_active_model_first)
+test("Request queue coalesces identical in-flight requests", test_queue_coalesces_identical_requests)
+test("Request queue releases a stream closed before it starts", test_queue_releases_unstarted_stream)
+test("LLM Router closes Ollama's response when a stream never starts", test_router_closes_upstream_of_unstarted_stream)
+test("Response cache hit skips model load", test_cache_hit_skips_model_load)
+test("Response cache is opt-in and evicts LRU", test_cache_is_opt_in_and_evicts)
+test("Embeddings batch misses and reuse stored vectors", test_embed_batches_and_reuses_vectors)
+test("Embedding batches are admitted through the request queue", test_embed_batches_go_through_queue)
 
 # ── Health Guardian Tests ─────────────────────────────────────────────────
 
@@ -359,8 +664,63 @@ def test_guardian_log_buffer():
     assert len(logs) == 1
 
 
+def test_probe_engine_concurrent_snapshot():
+    import asyncio
+    import socket
+    listener = socket.socket()
+    listener.bind(("localhost", 0))
+    listener.listen()
+    open_port = listener.getsockname()[1]
+    sg = ServiceGraph()
+    sg.services = {
+        "up": {"name": "Up", "port": open_port, "health_check": {"type": "tcp"}},
+        "down": {"name": "Down", "port": 1, "health_check": {"type": "tcp", "interval_seconds": 60}},
+    }
+    sg.docker_services = {}
+    engine = HealthProbeEngine(sg, min_interval=10)
+    results = asyncio.run(engine.probe_all())
+    listener.close()
+    assert results["up"]["status"] == "healthy"
+    assert results["down"]["status"] == "unhealthy"
+    assert sg.to_dict()["up"]["status"] == "healthy"  # snapshot served from cache
+    engine._reschedule("down", results["down"])
+    assert engine.state["down"]["interval"] == 10  # failing watched service probed sooner
+    for _ in range(4):
+        engine._reschedule("up", results["up"])
+    assert engine.state["up"]["interval"] > 30  # stable service backs off
+
+
+def test_check_all_health_reuses_probe_engine():
+    sg = ServiceGraph()
+    sg.services = {"down": {"name": "Down", "port": 1, "health_check": {"type": "http"}}}
+    sg.docker_services = {}
+    sg.check_all_health()  # HTTP probes run on the engine's executor
+    engine, executor = sg._probe_engine, sg._probe_engine._executor
+    for _ in range(3):
+        assert sg.check_all_health()["down"]["status"] == "unhealthy"
+    assert sg._probe_engine is engine and engine._executor is executor
+
+
+def test_guardian_restart_is_deferred_not_blocking():
+    sg = ServiceGraph()
+    sg.restart_service = MagicMock(return_value={"status": "started"})
+    hg = HealthGuardian(sg)
+    bad = {"status": "unhealthy", "detail": "Port closed"}
+    assert hg._handle_result("workshop", bad) is None
+    assert hg._handle_result("workshop", bad) is None
+    start = time.time()
+    defer = hg._handle_result("workshop", bad)
+    assert time.time() - start < 1
+    assert defer == 10
+    assert hg._handle_result("ck-writer", bad) is None  # on-demand services are never restarted
+    assert "ck-writer" not in hg.failure_counts
+
+
 test("Health Guardian initializes", test_guardian_init)
 test("Health Guardian log buffer", test_guardian_log_buffer)
+test("Probe engine checks concurrently and adapts intervals", test_probe_engine_concurrent_snapshot)
+test("check_all_health reuses one probe engine", test_check_all_health_reuses_probe_engine)
+test("Guardian defers restarts instead of blocking", test_guardian_restart_is_deferred_not_blocking)
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -423,7 +783,7 @@ from supervisor import app as flask_app
 import supervisor as sv
 sv.registry = ModelRegistry()
 sv.gpu_scheduler = GPUScheduler(sv.registry)
-sv.llm_router = LLMRouter(sv.registry, sv.gpu_scheduler)
+sv.llm_router = LLMRouter(sv.registry, sv.gpu_scheduler, RequestQueue())
 sv.service_graph = ServiceGraph()
 sv.health_guardian = HealthGuardian(sv.service_graph)
 sv.boot_sequencer = BootSequencer(sv.service_graph, sv.gpu_scheduler, sv.registry)
@@ -448,6 +808,7 @@ def test_api_status():
     assert "services" in data
     assert "gpu" in data
     assert "metrics" in data
+    assert "health_probes" in data
 
 
 def test_api_models():
@@ -471,6 +832,7 @@ def test_api_gpu():
     data = resp.get_json()
     assert "gpu" in data
     assert "vram_budget" in data
+    assert "cold_loads" in data["policy"]
 
 
 def test_api_services():
@@ -491,6 +853,9 @@ def test_api_service_detail():
 def test_api_queue():
     resp = client.get("/api/queue")
     assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["pending"] == 0
+    assert "avg_wait_ms" in data
 
 
 def test_api_logs():
@@ -4,6 +4,7 @@ Flask API endpoints for Gravity Engine v2 and Constellation v2.
 Almost Magic Tech Lab
 """
 
+import math
 from flask import Blueprint, jsonify, request
 from datetime import datetime
 from typing import Optional
@@ -51,7 +52,7 @@ def create_gravity_routes(gravity_field, consequence_engine, learning_engine, dr
                 "consequence_severity": item.consequence.trust_erosion,
                 "revenue_at_risk": item.consequence.revenue_at_risk,
                 "people": item.charge.people,
-                "explanation": item.breakdown.explanation if item.breakdown else "",
+                "explanation": gravity_field.get_breakdown(item.id).explanation,
             }
             for item in items
         ])
@@ -62,9 +63,7 @@ def create_gravity_routes(gravity_field, consequence_engine, learning_engine, dr
         item = gravity_field.get_item(item_id)
         if not item:
             return jsonify({"error": "Item not found"}), 404
-        if not item.breakdown:
-            gravity_field.recalculate()
-        bd = item.breakdown
+        bd = gravity_field.get_breakdown(item_id)
         return jsonify({
             "id": item.id,
             "title": item.title,
@@ -121,12 +120,30 @@ def create_gravity_routes(gravity_field, consequence_engine, learning_engine, dr
                         "net": o.net_impact,
                         "recommended": o.recommended,
                     }
-                    for o in c.options
+                    for o in gravity_field.collision_options(c)
                 ],
             }
             for c in collisions
         ])
 
+    @gravity_bp.route("/plan", methods=["GET"])
+    def get_plan():
+        """Best feasible set of high-gravity items for the available hours."""
+        hours = request.args.get("hours", 8.0, type=float)
+        if not math.isfinite(hours) or hours < 0:
+            return jsonify({"error": "hours must be a finite, non-negative number"}), 400
+        plan = gravity_field.best_feasible_set(hours)
+        return jsonify({
+            "available_hours": hours,
+            "planned_hours": sum(i.estimated_hours for i in plan),
+            "total_gravity": round(sum(i.gravity_score for i in plan), 1),
+            "items": [
+                {"id": i.id, "title": i.title, "gravity_score": i.gravity_score,
+                 "estimated_hours": i.estimated_hours}
+                for i in plan
+            ],
+        })
+
     @gravity_bp.route("/drift", methods=["GET"])
     def get_drift():
         """Strategic drift analysis."""
@@ -176,8 +193,8 @@ def create_gravity_routes(gravity_field, consequence_engine, learning_engine, dr
 
     @gravity_bp.route("/recalculate", methods=["POST"])
     def recalculate():
-        """Force full recalculation."""
-        gravity_field.recalculate()
+        """Force full recalculation (rate-limited by the Damping Governor)."""
+        gravity_field.recalculate(full=True)
         return jsonify({"status": "recalculated", "items": gravity_field.active_item_count()})
 
     return gravity_bp
@@ -222,6 +239,15 @@ def create_constellation_routes(poi_engine, network_intel, reciprocity_engine, p
             for p in pois
         ])
 
+    @constellation_bp.route("/pois/similar", methods=["GET"])
+    def similar_pois():
+        """Fuzzy name matches — possible duplicates of one person."""
+        name = request.args.get("name", "")
+        if not name:
+            return jsonify({"error": "name is required"}), 400
+        limit = request.args.get("limit", 5, type=int)
+        return jsonify(poi_engine.find_similar_pois(name, limit=limit))
+
     @constellation_bp.route("/pois/<poi_id>", methods=["GET"])
     def get_poi(poi_id):
         """Full POI profile with trust account."""
@@ -10,11 +10,19 @@ from flask import Blueprint, jsonify, request, Response
 import json
 import logging
 import os
+import threading
+import time
 import urllib.request
 import urllib.error
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+try:
+    import requests as http_requests
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
 logger = logging.getLogger("elaine.chat")
 
 SUPERVISOR_URL = os.environ.get("SUPERVISOR_URL", "http://localhost:9000")
@@ -271,22 +279,123 @@ Key AMTL tools: Workshop (:5003), Genie (:8000), CK Writer (:5004), Ripple CRM (
 Reference Gravity for priorities, Constellation for people, Amplifier+Sentinel for content."""
 
 
+# ── Tool health snapshot ──────────────────────────────────────
+# A background thread keeps a cached snapshot fresh using one pooled
+# keep-alive session, so /api/tools/health answers without fanning out.
+
+HEALTH_REFRESH_S = 15
+
+_health_lock = threading.Lock()
+_health_snapshot = {"services": {}, "running": 0, "checked_at": None}
+_health_monitor = None
+_health_pool = None
+_health_session = None
+
+
 def _ping_service(tool):
     """Ping a single tool's health endpoint. Returns (tool_id, status, latency_ms)."""
     url = f"http://localhost:{tool['port']}{tool['health']}"
+    start = time.time()
     try:
-        req = urllib.request.Request(url, method="GET")
-        import time
-        start = time.time()
-        with urllib.request.urlopen(req, timeout=3) as resp:
-            latency = int((time.time() - start) * 1000)
-            if resp.status < 400:
-                return (tool["id"], "running", latency)
+        if _health_session is not None:
+            resp = _health_session.get(url, timeout=3)
+            ok = resp.status_code < 400
+        else:
+            req = urllib.request.Request(url, method="GET")
+            with urllib.request.urlopen(req, timeout=3) as resp:
+                ok = resp.status < 400
+        if ok:
+            return (tool["id"], "running", int((time.time() - start) * 1000))
     except Exception:
         pass
     return (tool["id"], "stopped", None)
 
 
+def refresh_tool_health():
+    """Probe every tool concurrently on the shared pool and store the snapshot."""
+    global _health_pool, _health_session
+    with _health_lock:
+        if _health_pool is None:
+            _health_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix="tool-health")
+            if HAS_REQUESTS:
+                _health_session = http_requests.Session()
+                _health_session.mount("http://", http_requests.adapters.HTTPAdapter(pool_maxsize=len(TOOLS)))
+    results = {}
+    running = 0
+    for tool_id, status, latency in _health_pool.map(_ping_service, TOOLS):
+        results[tool_id] = {"status": status, "latency_ms": latency}
+        if status == "running":
+            running += 1
+    with _health_lock:
+        _health_snapshot.update(services=results, running=running, checked_at=time.time())
+        return dict(_health_snapshot)
+
+
+def _ensure_health_monitor():
+    """Start the background refresher once; the first caller waits for a fresh snapshot."""
+    global _health_monitor
+    with _health_lock:
+        if _health_monitor is not None:
+            return
+
+        def _loop():
+            while True:
+                time.sleep(HEALTH_REFRESH_S)
+                try:
+                    refresh_tool_health()
+                except Exception as e:
+                    logger.warning("Tool health refresh failed: %s", e)
+
+        _health_monitor = threading.Thread(target=_loop, daemon=True, name="tool-health")
+        _health_monitor.start()
+    refresh_tool_health()
+
+
+def _relay_chat_stream(resp, model, via, start):
+    """Translate an upstream Ollama NDJSON stream into Elaine reply deltas.
+
+    Yields one JSON line per content chunk, then a closing line with timing.
+    """
+    import time as _time
+    first_at = None
+    try:
+        for raw in resp:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                chunk = json.loads(line)
+            except ValueError:
+                continue
+            if "error" in chunk:
+                yield json.dumps({"error": chunk["error"], "done": True}) + "\n"
+                return
+            delta = chunk.get("message", {}).get("content", "") or chunk.get("response", "")
+            if delta:
+                if first_at is None:
+                    first_at = _time.time()
+                yield json.dumps({"delta": delta, "done": False}) + "\n"
+            if chunk.get("done"):
+                break
+    except Exception as e:
+        logger.warning("Chat stream via %s interrupted: %s", via, e)
+        yield json.dumps({"error": str(e), "done": True}) + "\n"
+        return
+    finally:
+        resp.close()
+
+    elapsed = round(_time.time() - start, 1)
+    ttft = round(first_at - start, 2) if first_at else None
+    logger.info("Chat stream via %s in %ss, first token %ss (%s)", via, elapsed, ttft, model)
+    yield json.dumps({
+        "done": True,
+        "model": model,
+        "via": via,
+        "elapsed_s": elapsed,
+        "ttft_s": ttft,
+    }) + "\n"
+
+
 def create_chat_routes():
     bp = Blueprint("chat", __name__)
 
@@ -296,7 +405,10 @@ def create_chat_routes():
     def chat():
         """
         Send a message to Ollama via The Supervisor.
-        Body: {"message": "...", "model": "llama3.2:3b"}
+        Body: {"message": "...", "model": "llama3.2:3b", "stream": false}
+
+        With "stream": true the reply arrives as NDJSON lines of
+        {"delta": "..."} followed by a closing {"done": true, ...} line.
         """
         data = request.get_json(silent=True) or {}
         message = data.get("message", "").strip()
@@ -305,6 +417,7 @@ def create_chat_routes():
 
         model = data.get("model", CHAT_MODEL)
         history = data.get("history", [])
+        stream = data.get("stream") is True
 
         # Build messages array for Ollama chat API
         messages = [{"role": "system", "content": SYSTEM_PROMPT}]
@@ -316,7 +429,7 @@ def create_chat_routes():
         payload = json.dumps({
             "model": model,
             "messages": messages,
-            "stream": False,
+            "stream": stream,
             "options": {"num_predict": CHAT_MAX_TOKENS},
         }).encode("utf-8")
 
@@ -339,6 +452,12 @@ def create_chat_routes():
                     headers={"Content-Type": "application/json"},
                     method="POST",
                 )
+                if stream:
+                    resp = urllib.request.urlopen(req, timeout=CHAT_TIMEOUT)
+                    return Response(
+                        _relay_chat_stream(resp, model, via, start),
+                        mimetype="application/x-ndjson",
+                    )
                 with urllib.request.urlopen(req, timeout=CHAT_TIMEOUT) as resp:
                     result = json.loads(resp.read().decode("utf-8"))
 
@@ -392,25 +511,20 @@ def create_chat_routes():
 
     @bp.route("/api/tools/health", methods=["GET"])
     def tools_health():
-        """Ping all tools and return health status."""
-        results = {}
-        running = 0
-
-        with ThreadPoolExecutor(max_workers=10) as pool:
-            futures = {pool.submit(_ping_service, t): t for t in TOOLS}
-            for future in as_completed(futures):
-                tool_id, status, latency = future.result()
-                results[tool_id] = {
-                    "status": status,
-                    "latency_ms": latency,
-                }
-                if status == "running":
-                    running += 1
-
+        """Return the cached tool health snapshot. ?refresh=1 probes now."""
+        if request.args.get("refresh"):
+            refresh_tool_health()
+        else:
+            _ensure_health_monitor()
+        with _health_lock:
+            snapshot = dict(_health_snapshot)
+        if snapshot["checked_at"] is None:
+            snapshot = refresh_tool_health()
         return jsonify({
-            "services": results,
-            "running": running,
+            "services": snapshot["services"],
+            "running": snapshot["running"],
             "total": len(TOOLS),
+            "age_s": round(time.time() - snapshot["checked_at"], 1),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         })
 
@@ -11,23 +11,8 @@ gatekeeper_bp = Blueprint("gatekeeper", __name__, url_prefix="/api/gatekeeper")
 
 def create_gatekeeper_routes(gatekeeper):
 
-    @gatekeeper_bp.route("/check", methods=["POST"])
-    def check():
-        """Full gatekeeper check on outbound content."""
-        data = request.get_json() or {}
-        from modules.gatekeeper import ContentChannel, ContentPriority
-        channel = ContentChannel(data.get("channel", "email"))
-        priority = None
-        if data.get("priority"):
-            priority = ContentPriority(data["priority"])
-        r = gatekeeper.check(
-            content=data.get("content", ""),
-            title=data.get("title", ""),
-            recipient=data.get("recipient", ""),
-            channel=channel,
-            priority=priority,
-        )
-        return jsonify({
+    def _result_json(r):
+        return {
             "item_id": r.item_id,
             "verdict": r.verdict.value,
             "priority": r.priority.value,
@@ -37,7 +22,48 @@ def create_gatekeeper_routes(gatekeeper):
                 {"gate": c.gate_name, "passed": c.passed, "issues": c.issues, "suggestions": c.suggestions, "score": c.score}
                 for c in r.checks
             ],
-        })
+        }
+
+    def _check_kwargs(data):
+        from modules.gatekeeper import ContentChannel, ContentPriority
+        priority = None
+        if data.get("priority"):
+            priority = ContentPriority(data["priority"])
+        return {
+            "content": data.get("content", ""),
+            "title": data.get("title", ""),
+            "recipient": data.get("recipient", ""),
+            "channel": ContentChannel(data.get("channel", "email")),
+            "priority": priority,
+        }
+
+    @gatekeeper_bp.route("/check", methods=["POST"])
+    def check():
+        """Full gatekeeper check on outbound content."""
+        data = request.get_json() or {}
+        r = gatekeeper.check(**_check_kwargs(data))
+        return jsonify(_result_json(r))
+
+    @gatekeeper_bp.route("/check-batch", methods=["POST"])
+    def check_batch():
+        """Check many outbound items in one round-trip (file watcher bursts)."""
+        data = request.get_json() or {}
+        try:
+            items = [_check_kwargs(item) for item in data.get("items", [])]
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        results = gatekeeper.check_batch(items)
+        return jsonify({"results": [_result_json(r) for r in results], "count": len(results)})
+
+    @gatekeeper_bp.route("/check-folder", methods=["POST"])
+    def check_folder():
+        """Check every file in a watched folder in one call."""
+        data = request.get_json() or {}
+        try:
+            results = gatekeeper.check_folder(data.get("path", ""))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        return jsonify({"results": [_result_json(r) for r in results], "count": len(results)})
 
     @gatekeeper_bp.route("/override", methods=["POST"])
     def override():
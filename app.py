@@ -16,8 +16,9 @@ import subprocess
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
 from config import *
+from modules.sqlite_pool import get_pool, close_all as close_sqlite_pools
+from modules.template_registry import get_registry
 
 # Load .env file if present (for ELEVENLABS_API_KEY etc.)
 _env_path = Path(__file__).parent / ".env"
@@ -66,17 +67,10 @@ def _call_ollama(prompt, model=OLLAMA_MODEL, timeout=300):
         return prompt, False
 
 
-def _render_template(template_name, **kwargs):
-    """Render a Jinja2 template from templates/briefing/."""
-    env = Environment(loader=FileSystemLoader(str(BRIEFING_TEMPLATE_DIR)))
-    tpl = env.get_template(template_name)
-    return tpl.render(**kwargs)
-
-
 def _init_llm_tables():
     """Ensure the llm_briefings table exists in briefing.db."""
     LLM_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(LLM_DB_PATH))
+    conn = get_pool(LLM_DB_PATH).connect()
     c = conn.cursor()
     c.execute("""CREATE TABLE IF NOT EXISTS llm_briefings (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -96,7 +90,7 @@ _init_llm_tables()
 
 def _store_llm_briefing(briefing_type, raw_data, rendered_prompt, llm_response, ollama_ok):
     """Store an LLM-generated briefing in briefing.db."""
-    conn = sqlite3.connect(str(LLM_DB_PATH))
+    conn = get_pool(LLM_DB_PATH).connect()
     c = conn.cursor()
     c.execute(
         "INSERT INTO llm_briefings (briefing_type, raw_data, rendered_prompt, llm_response, ollama_ok) VALUES (?, ?, ?, ?, ?)",
@@ -109,7 +103,7 @@ def _store_llm_briefing(briefing_type, raw_data, rendered_prompt, llm_response,
 def _get_latest_llm_briefing(briefing_type):
     """Return the most recent LLM briefing of the given type.
     Prefers Ollama-completed entries from today; falls back to most recent."""
-    conn = sqlite3.connect(str(LLM_DB_PATH))
+    conn = get_pool(LLM_DB_PATH).connect()
     conn.row_factory = sqlite3.Row
     c = conn.cursor()
     # Try Ollama-completed entry from last 24 hours first
@@ -140,12 +134,43 @@ def _get_latest_llm_briefing(briefing_type):
     return None
 
 
-def create_app():
+def create_app(engine_state_dir=ENGINE_STATE_DIR, template_bytecode_dir=TEMPLATE_BYTECODE_DIR):
+    """Build the Elaine app. engine_state_dir=None keeps the engines in memory only;
+    template_bytecode_dir=None keeps compiled templates in memory only."""
     app = Flask(__name__)
     app.config["JSON_SORT_KEYS"] = False
 
     # ── Initialise All Modules ───────────────────────────────────
 
+    import atexit
+    atexit.register(close_sqlite_pools)
+
+    # Briefing prompts: compiled once here, then rendered from memory
+    briefing_templates = get_registry(
+        BRIEFING_TEMPLATE_DIR,
+        auto_reload=TEMPLATE_AUTO_RELOAD,
+        bytecode_dir=template_bytecode_dir,
+    )
+    briefing_templates.precompile()
+
+    def _render_template(template_name, **kwargs):
+        """Render a precompiled Jinja2 template from templates/briefing/."""
+        return briefing_templates.render(template_name, **kwargs)
+
+    # Durable state for the in-memory engines (snapshot + journal)
+    engine_store = None
+    if ENGINE_PERSISTENCE and engine_state_dir:
+        from modules.persistence import EngineStore
+        engine_store = EngineStore(engine_state_dir, compact_every=ENGINE_COMPACT_EVERY)
+        engine_store.start_checkpointer(ENGINE_CHECKPOINT_INTERVAL_S)
+        atexit.register(engine_store.close)
+
+    def journal(name):
+        return engine_store.journal(name) if engine_store else None
+
+    def archive(name):
+        return engine_store.archive(name) if engine_store else None
+
     # Phase 8a: Thinking Frameworks (loaded first)
     from modules.thinking.engine import ThinkingFrameworksEngine
     thinking_engine = ThinkingFrameworksEngine()
@@ -155,7 +180,7 @@ def create_app():
     from modules.gravity_v2.consequence_engine import ConsequenceEngine
     from modules.gravity_v2.learning import LearningEngine
     from modules.gravity_v2.drift_detector import DriftDetector
-    gravity_field = GravityField()
+    gravity_field = GravityField(journal=journal("gravity"), archive=archive("gravity_archive"))
     consequence_engine = ConsequenceEngine()
     learning_engine = LearningEngine()
     drift_detector = DriftDetector()
@@ -165,7 +190,7 @@ def create_app():
     from modules.constellation.network_intelligence import NetworkIntelligence
     from modules.constellation.reciprocity import ReciprocityEngine
     from modules.constellation.poi_profiles import POIProfile
-    poi_engine = POIEngine()
+    poi_engine = POIEngine(journal=journal("pois"))
     network_intel = NetworkIntelligence()
     reciprocity_engine = ReciprocityEngine()
     poi_profiles = POIProfile()
@@ -182,11 +207,11 @@ def create_app():
 
     # Phase 9: Sentinel v2
     from modules.sentinel.trust_engine import TrustEngine
-    trust_engine = TrustEngine(thinking_engine=thinking_engine)
+    trust_engine = TrustEngine(thinking_engine=thinking_engine, journal=journal("audits"))
 
     # Phase 10: Chronicle v2
     from modules.chronicle.meeting_engine import MeetingEngine
-    meeting_engine = MeetingEngine()
+    meeting_engine = MeetingEngine(journal=journal("meetings"))
 
     # Phase 10: Voice
     from modules.chronicle.voice import VoiceBriefingFormatter
@@ -198,7 +223,7 @@ def create_app():
 
     # Phase 14: Learning Radar
     from modules.learning_radar import LearningRadar
-    learning_radar = LearningRadar()
+    learning_radar = LearningRadar(journal=journal("interests"))
 
     # Phase 14b: Communication + Strategic Engines
     from modules.communication import CommunicationEngine
@@ -680,7 +705,7 @@ def create_app():
             return jsonify(result)
         # Fallback: try the raw Phase 5 store
         try:
-            conn = sqlite3.connect(briefing_engine.db_path)
+            conn = get_pool(briefing_engine.db_path).connect()
             conn.row_factory = sqlite3.Row
             c = conn.cursor()
             c.execute("SELECT briefing_data, generated_at FROM briefings ORDER BY generated_at DESC LIMIT 1")
@@ -801,6 +826,11 @@ def create_app():
             "modules_enabled": MODULES,
         })
 
+    @app.route("/api/system/templates", methods=["GET"])
+    def system_templates():
+        """Briefing template registry: precompile time and per-template render timings."""
+        return jsonify(briefing_templates.stats())
+
     @app.route("/", methods=["GET"])
     def root():
         from flask import render_template
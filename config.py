@@ -50,6 +50,18 @@ DEBUG = True
 DATA_DIR = "./data"
 LOGS_DIR = "./logs"
 
+# ── Templates ──
+
+TEMPLATE_AUTO_RELOAD = DEBUG                 # Recompile edited templates (dev only)
+TEMPLATE_BYTECODE_DIR = "~/.elaine/cache/jinja"   # None to keep compiled templates in memory only
+
+# ── Engine Persistence ──
+
+ENGINE_PERSISTENCE = True
+ENGINE_STATE_DIR = "~/.elaine/engines"   # snapshot + journal per engine (create_app can override)
+ENGINE_COMPACT_EVERY = 500               # journal entries before compaction
+ENGINE_CHECKPOINT_INTERVAL_S = 300       # background snapshot interval
+
 # ── Sentinel Defaults ──
 
 SENTINEL_DEFAULT_GATE = 2
@@ -10,17 +10,17 @@ import logging
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from modules.sqlite_pool import get_pool
+
 logger = logging.getLogger("elaine.business_intelligence")
 
 DB_PATH = Path.home() / "elaine-v3" / "data" / "business_intel.db"
 
 
 def get_db():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH))
+    """Pooled connection (WAL, foreign keys on); close() returns it to the pool."""
+    conn = get_pool(DB_PATH).connect()
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
 
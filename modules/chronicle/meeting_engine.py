@@ -56,7 +56,7 @@ class MeetingEngine:
     commitment tracking, decision archaeology, and innovations.
     """
 
-    def __init__(self):
+    def __init__(self, journal=None):
         self.meetings: dict[str, MeetingRecord] = {}
         self.follow_through_models: dict[str, PersonFollowThroughModel] = {}
         self.innovations: list[Innovation] = []
@@ -65,6 +65,17 @@ class MeetingEngine:
         self._meeting_scores_by_template: dict[str, list[float]] = {}
         self._decision_outcomes: list[dict] = []
 
+        # Persistence (modules.persistence.RecordJournal)
+        self._journal = journal
+        if journal is not None:
+            self.meetings.update(journal.load())
+            journal.bind(self.meetings)
+
+    def _persist(self, meeting: MeetingRecord):
+        """Journal a meeting record after it changes."""
+        if self._journal is not None:
+            self._journal.put(meeting.meeting_id, meeting)
+
     # ── Meeting Lifecycle ────────────────────────────────────────
 
     def create_meeting(self, title: str, template: MeetingTemplate,
@@ -83,6 +94,7 @@ class MeetingEngine:
             **kwargs,
         )
         self.meetings[meeting.meeting_id] = meeting
+        self._persist(meeting)
         logger.info(f"Meeting created: {title} ({template.value})")
         return meeting
 
@@ -200,6 +212,7 @@ class MeetingEngine:
         mani_count = sum(1 for c in commitments if c.owner == "mani")
         other_count = len(commitments) - mani_count
         meeting.patterns.commitment_balance = {"mani": mani_count, "other": other_count}
+        self._persist(meeting)
 
         logger.info(f"Extracted {len(commitments)} commitments from {meeting.title}")
         return commitments
@@ -218,6 +231,7 @@ class MeetingEngine:
             due_date=due_date, trust_stake=trust_stake,
         )
         meeting.commitments.append(commitment)
+        self._persist(meeting)
         logger.info(f"Commitment added: {text[:40]} ({owner})")
         return commitment
 
@@ -238,6 +252,8 @@ class MeetingEngine:
                 if c.owner != "mani" and c.owner != "mutual":
                     self._update_follow_through(c.owner, status)
 
+                self._persist(meeting)
+
                 logger.info(f"Commitment {commitment_id}: {old.value} → {status.value}")
                 break
 
@@ -299,6 +315,7 @@ class MeetingEngine:
         )
         meeting.decisions.append(decision)
         meeting.patterns.decision_density = len(meeting.decisions)
+        self._persist(meeting)
         logger.info(f"Decision recorded: {text[:40]}")
         return decision
 
@@ -318,6 +335,7 @@ class MeetingEngine:
                     "pressure": d.pressure_level,
                     "outcome": outcome.value,
                 })
+                self._persist(meeting)
                 logger.info(f"Decision outcome: {d.text[:30]} → {outcome.value}")
                 break
 
@@ -378,6 +396,7 @@ class MeetingEngine:
             comparison=f"{'Top' if percentile >= 50 else 'Bottom'} {100 - percentile}% of {template} meetings",
         )
         meeting.score = score
+        self._persist(meeting)
         return score
 
     # ── Follow-Up Draft ──────────────────────────────────────────
@@ -415,6 +434,7 @@ class MeetingEngine:
             tone="warm_professional",
         )
         meeting.follow_up = draft
+        self._persist(meeting)
         logger.info(f"Follow-up draft generated for {meeting.title}")
         return draft
 
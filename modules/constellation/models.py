@@ -228,7 +228,7 @@ class POIRecord:
     Person of Interest — the core entity in the Constellation.
     Auto-discovered, auto-enriched, trust-tracked.
     """
-    poi_id: str = field(default_factory=lambda: f"poi_{uuid.uuid4().hex[:8]}")
+    poi_id: str = field(default_factory=lambda: f"poi_{uuid.uuid4().hex[:12]}")
 
     # Identity
     name: str = ""
@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from .models import POIRecord, POITier, NetworkConnection
+from .poi_index import POIIndex
 
 logger = logging.getLogger("elaine.constellation.network")
 
@@ -51,10 +52,12 @@ class NetworkIntelligence:
     def __init__(self):
         pass
 
-    def find_opportunities(self, pois: dict[str, POIRecord]) -> list[NetworkOpportunity]:
+    def find_opportunities(self, pois: dict[str, POIRecord],
+                           index: Optional[POIIndex] = None) -> list[NetworkOpportunity]:
         """
         Detect warm introduction opportunities through existing POI connections.
         """
+        index = index or POIIndex(pois)
         opportunities = []
 
         for poi in pois.values():
@@ -66,7 +69,7 @@ class NetworkIntelligence:
 
             for connection in poi.known_connections:
                 # Check if connection is already a POI
-                existing = self._find_poi_by_name(pois, connection.name)
+                existing = index.by_name(connection.name)
                 if existing and existing.tier.value <= 2:
                     continue  # Already an active relationship
 
@@ -125,27 +128,19 @@ class NetworkIntelligence:
             prereqs.append(f"Deliver value to {poi.name} before asking for intro")
         return prereqs
 
-    def _find_poi_by_name(self, pois: dict[str, POIRecord], name: str) -> Optional[POIRecord]:
-        name_lower = name.lower().strip()
-        for poi in pois.values():
-            if poi.name.lower().strip() == name_lower:
-                return poi
-        return None
+    def _find_poi_by_name(self, pois: dict[str, POIRecord], name: str,
+                          index: Optional[POIIndex] = None) -> Optional[POIRecord]:
+        return (index or POIIndex(pois)).by_name(name)
 
     # ── Network Risk Analysis ────────────────────────────────────
 
-    def assess_network_risk(self, poi: POIRecord, all_pois: dict[str, POIRecord]) -> NetworkRisk:
+    def assess_network_risk(self, poi: POIRecord, all_pois: dict[str, POIRecord],
+                            index: Optional[POIIndex] = None) -> NetworkRisk:
         """
         What happens to the network if this POI relationship goes bad?
         """
-        # Find POIs connected through this person
-        connected = []
-        for other_poi in all_pois.values():
-            if other_poi.poi_id == poi.poi_id:
-                continue
-            # Check if they were referred by this POI
-            if poi.poi_id in other_poi.referrals_received:
-                connected.append(other_poi)
+        # POIs referred through this person
+        connected = (index or POIIndex(all_pois)).referred_through(poi.poi_id)
 
         # Calculate pipeline impact
         pipeline_impact = sum(
@@ -173,6 +168,14 @@ class NetworkIntelligence:
             network_impact_description=description,
         )
 
+    def assess_all_network_risks(self, pois: dict[str, POIRecord],
+                                 index: Optional[POIIndex] = None) -> list[NetworkRisk]:
+        """Network risk for every POI, biggest exposure first — one index, one pass."""
+        index = index or POIIndex(pois)
+        risks = [self.assess_network_risk(p, pois, index) for p in pois.values()]
+        return sorted(risks, key=lambda r: (r.pipeline_impact, r.connected_relationships_at_risk),
+                      reverse=True)
+
     # ── Portfolio Analytics ──────────────────────────────────────
 
     def analyse_portfolio(self, pois: dict[str, POIRecord]) -> dict:
@@ -193,7 +196,7 @@ class NetworkIntelligence:
 
         # Relationship gaps
         gaps = []
-        industries = set(p.tags for p in active if p.tags)
+        industries = {t for p in active for t in p.tags}
         tier_1_count = len([p for p in active if p.tier == POITier.INNER_CIRCLE])
 
         if tier_1_count < 5:
@@ -16,6 +16,7 @@ from .models import (
     POIRecord, POITier, TierTrend, DiscoverySource,
     TrustAccount, TrustTransactionType,
 )
+from .poi_index import POIIndex
 from .trust_ledger import TrustLedger
 
 logger = logging.getLogger("elaine.constellation.poi")
@@ -27,11 +28,30 @@ class POIEngine:
     Auto-discovers and ranks people from multi-channel activity.
     """
 
-    def __init__(self):
+    def __init__(self, journal=None):
         self.pois: dict[str, POIRecord] = {}
         self.trust_ledger = TrustLedger()
         self._discovery_log: list[dict] = []
 
+        # Persistence (modules.persistence.RecordJournal)
+        self._journal = journal
+        if journal is not None:
+            self.pois.update(journal.load())
+            journal.bind(self.pois)
+        self.index = POIIndex(self.pois)
+
+    def _persist(self, poi: POIRecord) -> POIRecord:
+        """Journal a POI after it changes."""
+        self.index.add(poi)
+        if self._journal is not None:
+            self._journal.put(poi.poi_id, poi)
+        return poi
+
+    def _checkpoint(self):
+        """Bulk changes touch every POI — snapshot instead of journalling each."""
+        if self._journal is not None:
+            self._journal.compact()
+
     # ── POI Management ───────────────────────────────────────────
 
     def get_or_create_poi(
@@ -42,15 +62,10 @@ class POIEngine:
         **kwargs,
     ) -> POIRecord:
         """Get existing POI by email or create new. Zero-input."""
-        if email:
-            for poi in self.pois.values():
-                if poi.email.lower() == email.lower():
-                    return poi
-
-        name_lower = name.lower().strip()
-        for poi in self.pois.values():
-            if poi.name.lower().strip() == name_lower:
-                return poi
+        self.index.sync()
+        existing = (email and self.index.by_email(email)) or self.index.by_name(name)
+        if existing:
+            return existing
 
         poi = POIRecord(
             name=name, email=email, discovery_source=source,
@@ -62,20 +77,38 @@ class POIEngine:
             "source": source.value, "timestamp": datetime.now(),
         })
         logger.info(f"New POI discovered: {name} via {source.value}")
-        return poi
+        return self._persist(poi)
 
     def get_poi(self, poi_id: str) -> Optional[POIRecord]:
         return self.pois.get(poi_id)
 
+    def find_poi(self, name: str = "", email: str = "") -> Optional[POIRecord]:
+        """Exact match on normalised email, then name."""
+        self.index.sync()
+        return (email and self.index.by_email(email)) or (name and self.index.by_name(name)) or None
+
+    def find_similar_pois(self, name: str, limit: int = 5,
+                          min_score: float = 0.4) -> list[dict]:
+        """Likely duplicates / spellings of a name — for entity resolution."""
+        self.index.sync()
+        return [{"poi_id": p.poi_id, "name": p.name, "company": p.company,
+                 "email": p.email, "score": score}
+                for p, score in self.index.similar(name, limit, min_score)]
+
+    def who_knows(self, name: str) -> list[POIRecord]:
+        """POIs that list this person among their known connections."""
+        self.index.sync()
+        return self.index.known_by(name)
+
     def search_pois(
         self, query: str = "", tier: Optional[POITier] = None,
         company: str = "", min_trust: Optional[float] = None,
     ) -> list[POIRecord]:
-        results = list(self.pois.values())
         if query:
-            q = query.lower()
-            results = [p for p in results if q in p.name.lower()
-                       or q in p.company.lower() or q in p.email.lower()]
+            self.index.sync()
+            results = self.index.search(query)
+        else:
+            results = list(self.pois.values())
         if tier:
             results = [p for p in results if p.tier == tier]
         if company:
@@ -90,7 +123,7 @@ class POIEngine:
                              subject: str = "", **kwargs) -> POIRecord:
         poi = self.get_or_create_poi(from_name, from_email, DiscoverySource.EMAIL)
         poi.trust_account.last_interaction = datetime.now()
-        return poi
+        return self._persist(poi)
 
     def process_calendar_signal(self, participant_name: str,
                                 participant_email: str = "",
@@ -100,7 +133,7 @@ class POIEngine:
             self.trust_ledger.withdraw(poi, TrustTransactionType.CANCELLED_MEETING,
                                         reason="Meeting cancelled")
         poi.trust_account.last_interaction = datetime.now()
-        return poi
+        return self._persist(poi)
 
     def process_chronicle_signal(self, participant_name: str,
                                   participant_email: str = "",
@@ -115,7 +148,7 @@ class POIEngine:
             self.trust_ledger.withdraw(poi, TrustTransactionType.COMMITMENT_MISSED,
                                         reason=f"Missed: {commitment_made}")
         poi.trust_account.last_interaction = datetime.now()
-        return poi
+        return self._persist(poi)
 
     def process_content_signal(self, person_name: str, action: str = "liked",
                                 content_topic: str = "") -> POIRecord:
@@ -127,7 +160,7 @@ class POIEngine:
             poi.content_engagement.posts_commented += 1
         if content_topic and content_topic not in poi.content_engagement.topics_engaged:
             poi.content_engagement.topics_engaged.append(content_topic)
-        return poi
+        return self._persist(poi)
 
     def process_voice_agent_signal(self, visitor_name: str, visitor_email: str = "",
                                     company: str = "", notes: str = "") -> POIRecord:
@@ -139,7 +172,7 @@ class POIEngine:
             poi.notes = notes
         poi.trust_account.last_interaction = datetime.now()
         logger.info(f"Voice agent lead captured: {visitor_name} ({company})")
-        return poi
+        return self._persist(poi)
 
     # ── Tier Recalculation ───────────────────────────────────────
 
@@ -147,12 +180,15 @@ class POIEngine:
         """Recalculate tiers for all POIs."""
         for poi in self.pois.values():
             self.trust_ledger.recalculate_tier(poi)
+        self._checkpoint()
 
     # ── Decay Processing ─────────────────────────────────────────
 
     def process_weekly_decay(self) -> list[dict]:
         """Apply trust decay to all POIs and return alerts."""
-        return self.trust_ledger.apply_decay_all(self.pois)
+        alerts = self.trust_ledger.apply_decay_all(self.pois)
+        self._checkpoint()
+        return alerts
 
     # ── Reporting ────────────────────────────────────────────────
 
@@ -0,0 +1,230 @@
+"""
+POI Index
+Lookup structures over the POI map, so resolving a person never means
+scanning every POIRecord.
+
+  - exact hash maps on normalised email and name
+  - trigram postings for fuzzy name matching and substring search
+    (built on first use — exact lookups never pay for them)
+  - adjacency: who knows a named connection, and who was referred
+    through whom
+
+The index holds a reference to the live POI dict. POIEngine refreshes a
+record whenever it persists one; sync() picks up records added to or
+removed from the dict behind its back (journal replay, bulk loads).
+Every hit is re-checked against the record, so a stale key can only
+cause a miss, never a wrong match.
+
+Almost Magic Tech Lab — Patentable IP
+"""
+
+from collections import Counter
+from itertools import count
+from typing import Optional
+
+from .models import POIRecord
+
+GRAM = 3
+
+
+def normalise_name(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+def normalise_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+def _name_grams(name: str) -> set[str]:
+    """Padded trigrams, so short names and word boundaries still score."""
+    return _grams(f"  {name} ")
+
+
+def _search_text(poi: POIRecord) -> str:
+    # \0 between fields: no query trigram can straddle two fields
+    return "\0".join((poi.name.lower(), poi.company.lower(), poi.email.lower()))
+
+
+class POIIndex:
+    """Exact, fuzzy and adjacency indexes over a {poi_id: POIRecord} map."""
+
+    def __init__(self, pois: dict[str, POIRecord]):
+        self.pois = pois
+        self._by_email: dict[str, list[str]] = {}
+        self._by_name: dict[str, list[str]] = {}
+        self._known_by: dict[str, set[str]] = {}      # connection name → POIs who know them
+        self._referred_by: dict[str, set[str]] = {}   # poi_id → POIs referred through them
+        self._keys: dict[str, tuple] = {}             # poi_id → what it is indexed under
+        self._order: dict[str, int] = {}              # poi_id → first-seen position
+        self._seq = count()
+        self._name_postings: Optional[dict[str, set[str]]] = None
+        self._text_postings: Optional[dict[str, set[str]]] = None
+        for poi in pois.values():
+            self.add(poi)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # ── Maintenance ──────────────────────────────────────────────
+
+    def add(self, poi: POIRecord):
+        """Index a POI, or re-index it after its identity or network changed."""
+        pid = poi.poi_id
+        email = normalise_email(poi.email)
+        name = normalise_name(poi.name)
+        connections = frozenset(normalise_name(c.name) for c in poi.known_connections if c.name)
+        referrers = frozenset(poi.referrals_received)
+        text = _search_text(poi)
+        keys = (email, name, connections, referrers, text)
+        old = self._keys.get(pid)
+        if old == keys:
+            return
+        if old is not None:
+            self._unindex(pid, old)
+        else:
+            self._order[pid] = next(self._seq)
+        self._keys[pid] = keys
+        if email:
+            self._by_email.setdefault(email, []).append(pid)
+        if name:
+            self._by_name.setdefault(name, []).append(pid)
+        for conn in connections:
+            self._known_by.setdefault(conn, set()).add(pid)
+        for referrer in referrers:
+            self._referred_by.setdefault(referrer, set()).add(pid)
+        if self._name_postings is not None:
+            self._post_grams(pid, name, text)
+
+    def remove(self, poi_id: str):
+        old = self._keys.pop(poi_id, None)
+        if old is not None:
+            self._unindex(poi_id, old)
+            self._order.pop(poi_id, None)
+
+    def _unindex(self, pid: str, keys: tuple):
+        email, name, connections, referrers, text = keys
+        for table, key in ((self._by_email, email), (self._by_name, name)):
+            ids = table.get(key)
+            if ids and pid in ids:
+                ids.remove(pid)
+                if not ids:
+                    del table[key]
+        for table, group in ((self._known_by, connections), (self._referred_by, referrers)):
+            for key in group:
+                ids = table.get(key)
+                if ids:
+                    ids.discard(pid)
+                    if not ids:
+                        del table[key]
+        if self._name_postings is not None:
+            for postings, grams in ((self._name_postings, _name_grams(name)),
+                                    (self._text_postings, _grams(text))):
+                for g in grams:
+                    ids = postings.get(g)
+                    if ids:
+                        ids.discard(pid)
+
+    def sync(self):
+        """Catch up with POIs added to or removed from the dict directly."""
+        if len(self._keys) == len(self.pois):
+            return
+        for pid in [pid for pid in self._keys if pid not in self.pois]:
+            self.remove(pid)
+        for pid, poi in self.pois.items():
+            if pid not in self._keys:
+                self.add(poi)
+
+    def _ensure_grams(self):
+        if self._name_postings is not None:
+            return
+        self._name_postings, self._text_postings = {}, {}
+        for pid, (_, name, _, _, text) in self._keys.items():
+            self._post_grams(pid, name, text)
+
+    def _post_grams(self, pid: str, name: str, text: str):
+        if name:
+            for g in _name_grams(name):
+                self._name_postings.setdefault(g, set()).add(pid)
+        for g in _grams(text):
+            self._text_postings.setdefault(g, set()).add(pid)
+
+    # ── Exact lookups ────────────────────────────────────────────
+
+    def by_email(self, email: str) -> Optional[POIRecord]:
+        key = normalise_email(email)
+        for pid in self._by_email.get(key, ()):
+            poi = self.pois.get(pid)
+            if poi is not None and normalise_email(poi.email) == key:
+                return poi
+        return None
+
+    def by_name(self, name: str) -> Optional[POIRecord]:
+        key = normalise_name(name)
+        for pid in self._by_name.get(key, ()):
+            poi = self.pois.get(pid)
+            if poi is not None and normalise_name(poi.name) == key:
+                return poi
+        return None
+
+    # ── Fuzzy and substring ──────────────────────────────────────
+
+    def similar(self, name: str, limit: int = 5,
+                min_score: float = 0.4) -> list[tuple[POIRecord, float]]:
+        """POIs whose names are closest to `name` (trigram Jaccard, best first)."""
+        name = normalise_name(name)
+        if not name:
+            return []
+        self._ensure_grams()
+        grams = _name_grams(name)
+        shared = Counter()
+        for g in grams:
+            shared.update(self._name_postings.get(g, ()))
+        scored = []
+        for pid, n in shared.items():
+            poi = self.pois.get(pid)
+            if poi is None:
+                continue
+            other = len(_name_grams(self._keys[pid][1]))
+            score = n / (len(grams) + other - n)
+            if score >= min_score:
+                scored.append((poi, round(score, 3)))
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+
+    def search(self, query: str) -> list[POIRecord]:
+        """POIs with `query` in name, company or email — same answers as a scan."""
+        q = query.lower()
+        grams = _grams(q)
+        if not grams:
+            return [p for p in self.pois.values()
+                    if q in p.name.lower() or q in p.company.lower() or q in p.email.lower()]
+        self._ensure_grams()
+        postings = sorted((self._text_postings.get(g, set()) for g in grams), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        results = []
+        for pid in candidates:
+            p = self.pois.get(pid)
+            if p is not None and (q in p.name.lower() or q in p.company.lower()
+                                  or q in p.email.lower()):
+                results.append(p)
+        return sorted(results, key=self._position)
+
+    # ── Adjacency ────────────────────────────────────────────────
+
+    def known_by(self, name: str) -> list[POIRecord]:
+        """POIs listing `name` among their known connections."""
+        ids = [pid for pid in self._known_by.get(normalise_name(name), ()) if pid in self.pois]
+        return [self.pois[pid] for pid in sorted(ids, key=self._order.get)]
+
+    def referred_through(self, poi_id: str) -> list[POIRecord]:
+        """Other POIs that received a referral via `poi_id`."""
+        ids = [pid for pid in self._referred_by.get(poi_id, ())
+               if pid in self.pois and pid != poi_id]
+        return [self.pois[pid] for pid in sorted(ids, key=self._order.get)]
+
+    def _position(self, poi: POIRecord) -> int:
+        return self._order.get(poi.poi_id, len(self._order))
@@ -15,6 +15,10 @@ For each intercepted item:
 - Communication engine suggests structural improvements
 - Returns: CLEAR / REVIEW / HOLD with specific guidance
 
+The three gate checks run concurrently, and results are memoised by
+content hash, so a draft re-saved in a watched folder is not re-checked.
+Bursts of files are checked in one call via check_batch / check_folder.
+
 Not a blocker — a safety net. Mani can always override.
 But Elaine never lets something leave without checking.
 
@@ -25,8 +29,12 @@ Patentable: Pre-Transmission Quality Assurance with Multi-Dimensional Trust Anal
 Almost Magic Tech Lab — Patentable IP
 """
 
+import hashlib
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -130,6 +138,16 @@ SENSITIVE_RECIPIENTS = [
     "@asx.com", "@asic.gov",
 ]
 
+# Text formats the folder check can read directly
+TEXT_EXTENSIONS = {".txt", ".md"}
+
+
+# ── Execution ────────────────────────────────────────────────────
+
+GATE_WORKERS = 12         # Shared pool for Sentinel / Compassion / Communication
+BATCH_WORKERS = 4         # Items checked concurrently by check_batch
+CHECK_CACHE_SIZE = 1024   # Memoised gate results (LRU)
+
 
 # ── The Gatekeeper ───────────────────────────────────────────────
 
@@ -151,6 +169,12 @@ class Gatekeeper:
         self._items_checked: int = 0
         self._items_held: int = 0
 
+        # Gate results memoised by (content hash, channel, ...) — LRU
+        self._cache: OrderedDict[tuple, tuple[GateCheck, ...]] = OrderedDict()
+        self._cache_hits: int = 0
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
         # Default watched folders
         self._watched_folders.append(WatchedFolder(
             path=os.path.expanduser("~/Documents/Outbound"),
@@ -217,25 +241,15 @@ class Gatekeeper:
         Full gatekeeper check on outbound content.
         Returns verdict: CLEAR, REVIEW, or HOLD.
         """
-        self._items_checked += 1
+        with self._lock:
+            self._items_checked += 1
+            item_id = f"gate-{self._items_checked:04d}"
 
         if priority is None:
             priority = self.detect_priority(content, recipient, channel)
 
-        item_id = f"gate-{self._items_checked:04d}"
-        checks = []
-
-        # ── 1. Sentinel Check (trust/quality) ────────────────
-        sentinel_check = self._run_sentinel(content, title, recipient, priority)
-        checks.append(sentinel_check)
-
-        # ── 2. Compassion Check (tone/context) ───────────────
-        compassion_check = self._run_compassion(content, emotional_context)
-        checks.append(compassion_check)
-
-        # ── 3. Communication Check (structure) ───────────────
-        comm_check = self._run_communication(content, channel)
-        checks.append(comm_check)
+        # Sentinel (trust/quality), Compassion (tone/context), Communication (structure)
+        checks = self._run_gates(content, title, recipient, channel, priority, emotional_context)
 
         # ── Calculate Overall Verdict ─────────────────────────
         overall_score = sum(c.score for c in checks) / len(checks)
@@ -253,7 +267,6 @@ class Gatekeeper:
 
         if overall_score < hold_threshold:
             verdict = GateVerdict.HOLD
-            self._items_held += 1
         elif overall_score < review_threshold:
             verdict = GateVerdict.REVIEW
         else:
@@ -283,11 +296,95 @@ class Gatekeeper:
             summary=summary,
         )
 
-        self._history.append(result)
+        with self._lock:
+            if verdict == GateVerdict.HOLD:
+                self._items_held += 1
+            self._history.append(result)
         logger.info(f"GATE: {verdict.value} | {channel.value} | {priority.value} | "
                      f"score={overall_score:.2f} | '{title[:40]}'")
         return result
 
+    # ── Bulk Checks ───────────────────────────────────────────
+
+    def check_batch(self, items: list[dict]) -> list[GateResult]:
+        """
+        Check many outbound items in one call.
+        Each item takes the keyword arguments of check(); results keep input order.
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            return [self.check(**items[0])]
+        with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(items)),
+                                thread_name_prefix="gatekeeper-batch") as pool:
+            return list(pool.map(lambda item: self.check(**item), items))
+
+    def check_folder(self, path: str) -> list[GateResult]:
+        """
+        Check every matching file in a watched folder in one call.
+        Text files are checked on their content; other formats on their name.
+        """
+        folder = next(
+            (f for f in self._watched_folders
+             if f.active and os.path.abspath(os.path.expanduser(f.path)) == os.path.abspath(os.path.expanduser(path))),
+            None,
+        )
+        if folder is None:
+            raise ValueError(f"Not a watched folder: {path}")
+
+        directory = os.path.expanduser(folder.path)
+        if not os.path.isdir(directory):
+            return []
+        extensions = {e.lower() for e in folder.file_extensions} | TEXT_EXTENSIONS
+        items = []
+        for name in sorted(os.listdir(directory)):
+            full = os.path.join(directory, name)
+            ext = os.path.splitext(name)[1].lower()
+            if ext not in extensions or not os.path.isfile(full):
+                continue
+            content = ""
+            if ext in TEXT_EXTENSIONS:
+                with open(full, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            items.append({
+                "content": content or f"[File: {name}]",
+                "title": name,
+                "channel": folder.channel,
+                "priority": folder.priority,
+            })
+        return self.check_batch(items)
+
+    # ── Gate Execution ────────────────────────────────────────
+
+    def _run_gates(self, content: str, title: str, recipient: str,
+                   channel: ContentChannel, priority: ContentPriority,
+                   emotional_context: str) -> list[GateCheck]:
+        """Run the three gates concurrently, or reuse a memoised result."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        key = (digest, channel, priority, title, recipient, emotional_context)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                return list(cached)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=GATE_WORKERS, thread_name_prefix="gatekeeper")
+            pool = self._pool
+
+        futures = [
+            pool.submit(self._run_sentinel, content, title, recipient, priority),
+            pool.submit(self._run_compassion, content, emotional_context),
+            pool.submit(self._run_communication, content, channel),
+        ]
+        checks = [f.result() for f in futures]
+
+        with self._lock:
+            self._cache[key] = tuple(checks)
+            while len(self._cache) > CHECK_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return checks
+
     # ── Individual Gate Checks ────────────────────────────────
 
     def _run_sentinel(self, content: str, title: str, recipient: str,
@@ -546,6 +643,7 @@ Monitors outbound folders and checks files before they leave.
 """
 
 import os
+import threading
 import time
 import requests
 from watchdog.observers import Observer
@@ -557,9 +655,19 @@ WATCH_FOLDERS = [
     os.path.expanduser("~/Documents/Proposals"),
 ]
 EXTENSIONS = {".docx", ".pdf", ".pptx", ".xlsx", ".txt", ".md"}
+DEBOUNCE_S = 1.0      # Quiet period before a burst of new files is checked
+MAX_BATCH = 200       # Flush early if a burst keeps growing
 
 
 class GatekeeperHandler(FileSystemEventHandler):
+    """Collects new files and checks each burst with one batch request."""
+
+    def __init__(self):
+        super().__init__()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._timer = None
+
     def on_created(self, event):
         if event.is_directory:
             return
@@ -567,29 +675,53 @@ class GatekeeperHandler(FileSystemEventHandler):
         if ext not in EXTENSIONS:
             return
 
-        print(f"New file detected: {os.path.basename(event.src_path)}")
+        with self._lock:
+            self._pending[event.src_path] = ext
+            if self._timer:
+                self._timer.cancel()
+            if len(self._pending) >= MAX_BATCH:
+                self._timer = None
+                threading.Thread(target=self.flush, daemon=True).start()
+            else:
+                self._timer = threading.Timer(DEBOUNCE_S, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._timer = None
+        if not pending:
+            return
 
-        # Read file content (text-based only for now)
-        content = ""
-        if ext in (".txt", ".md"):
-            with open(event.src_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+        print(f"Checking {len(pending)} new file(s)")
+        items = []
+        for path, ext in pending.items():
+            # Read file content (text-based only for now)
+            content = ""
+            if ext in (".txt", ".md"):
+                try:
+                    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                        content = f.read()
+                except OSError:
+                    pass
+            items.append({
+                "content": content or f"[File: {os.path.basename(path)}]",
+                "title": os.path.basename(path),
+                "channel": "file",
+            })
 
         try:
-            r = requests.post(f"{ELAINE_URL}/api/gatekeeper/check", json={
-                "content": content or f"[File: {os.path.basename(event.src_path)}]",
-                "title": os.path.basename(event.src_path),
-                "channel": "file",
-            }, timeout=5)
-            result = r.json()
-            verdict = result.get("verdict", "clear")
-
-            if verdict == "hold":
-                print(f"  ⛔ HOLD: {result.get('summary', '')}")
-            elif verdict == "review":
-                print(f"  ⚠️  REVIEW: {result.get('summary', '')}")
-            else:
-                print(f"  ✅ CLEAR")
+            r = requests.post(f"{ELAINE_URL}/api/gatekeeper/check-batch",
+                              json={"items": items}, timeout=60)
+            for item, result in zip(items, r.json().get("results", [])):
+                verdict = result.get("verdict", "clear")
+                if verdict == "hold":
+                    print(f"  ⛔ HOLD: {item['title']} — {result.get('summary', '')}")
+                elif verdict == "review":
+                    print(f"  ⚠️  REVIEW: {item['title']} — {result.get('summary', '')}")
+                else:
+                    print(f"  ✅ CLEAR: {item['title']}")
         except Exception as e:
             print(f"  Gatekeeper unavailable: {e}")
 
@@ -630,6 +762,7 @@ if __name__ == "__main__":
             "verdicts": {"clear": clear_count, "review": review_count, "hold": hold_count},
             "watched_folders": len(self._watched_folders),
             "outlook_rules": len(self._outlook_rules),
+            "cache": {"entries": len(self._cache), "hits": self._cache_hits},
         }
 
     def get_history(self, limit: int = 20) -> list[dict]:
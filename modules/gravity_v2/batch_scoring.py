@@ -0,0 +1,97 @@
+"""
+Gravity Batch Scoring
+Columnar evaluation of the gravity equation for many items at once.
+
+Packs active items into NumPy arrays (mass, days-to-due, charge, Kq,
+momentum, energy fit) and applies the cliff curve and governors in
+vectorised form. Produces the same normalised scores as
+GravityField.calculate_gravity, without building a GravityBreakdown per
+item — explanations are generated lazily for items actually displayed.
+
+NumPy is optional: without it GravityField stays on the scalar path.
+
+Benchmark (scalar vs batch at 1k / 10k / 100k items):
+    python -m modules.gravity_v2.benchmark
+
+Almost Magic Tech Lab — Patentable IP
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger("elaine.gravity.batch")
+
+
+def score_batch(field, items: list, now: Optional[datetime] = None) -> list[float]:
+    """
+    Normalised gravity scores (0-100, one decimal) for active items.
+
+    G = clamp( (M × P × C × Kq) + Mo + B + E, 0, 100 ), with the Damping
+    and Moral governors applied — identical to the scalar path.
+    """
+    if not items:
+        return []
+    now = now or datetime.now()
+    n = len(items)
+
+    # ── Pack columns ──
+    mass = np.empty(n)
+    pcm = np.empty(n)
+    days = np.full(n, np.nan)
+    charge = np.empty(n)
+    kq = np.empty(n)
+    momentum = np.empty(n)
+    progress = np.empty(n)
+    energy = np.empty(n)
+    okr = np.zeros(n, dtype=bool)
+
+    momentum_map = field.MOMENTUM_ADJUSTMENT
+    energy_fit = {
+        ctx: next((m for first, last, m in windows if first <= now.hour <= last), 0.0)
+        for ctx, windows in field.ENERGY_WINDOWS.items()
+    }
+
+    for k, item in enumerate(items):
+        mass[k] = item.mass * item.learned_mass_adjustment
+        pcm[k] = item.personal_cliff_multiplier
+        if item.proximity_date:
+            days[k] = (item.proximity_date - now).total_seconds() / 86400
+        charge[k] = item.charge.charge_multiplier
+        kq[k] = item.consequence.kq_multiplier
+        momentum[k] = momentum_map.get(item.momentum, 0.0)
+        progress[k] = item.progress_percent
+        energy[k] = energy_fit.get(item.context_type, 0.0)
+        okr[k] = bool(item.okr_alignment)
+
+    # ── P — proximity cliff curve ──
+    has_due = ~np.isnan(days)
+    conditions = [days > threshold for threshold, _ in field.PROXIMITY_STEPS]
+    choices = [multiplier * pcm for _, multiplier in field.PROXIMITY_STEPS]
+    conditions += [-days <= limit for limit, _ in field.OVERDUE_STEPS]
+    choices += [np.full(n, multiplier) for _, multiplier in field.OVERDUE_STEPS]
+    proximity = np.select(conditions, choices, default=field.OVERDUE_SATURATED)
+    proximity = np.where(has_due, proximity, 1.0)
+
+    # ── Mo — momentum with progress bonus ──
+    momentum += np.where(progress > 75, 10.0, np.where(progress > 50, 5.0, 0.0))
+
+    # ── The Equation (B — burst — is 0 until fed by external systems) ──
+    raw = mass * proximity * charge * kq + momentum + energy
+
+    # ── Governors ──
+    governors = field.governors
+    damped = has_due & (-days > governors.OVERDUE_SATURATION_DAY)
+    raw = np.where(damped, raw * 0.95, raw)
+    raw = np.where(okr & (raw < governors.STRATEGIC_FLOOR), governors.STRATEGIC_FLOOR, raw)
+
+    normalised = np.clip(raw / field.NORMALISATION_DIVISOR * 100, 0, 100)
+    return [round(v, 1) for v in normalised.tolist()]
+
@@ -0,0 +1,74 @@
+"""
+Gravity Scoring Benchmark
+Scalar calculate_gravity vs the NumPy batch path at 1k / 10k / 100k items.
+
+    python -m modules.gravity_v2.benchmark
+
+Almost Magic Tech Lab — Patentable IP
+"""
+
+import time
+from datetime import datetime, timedelta
+
+from .batch_scoring import HAS_NUMPY, score_batch
+from .gravity_field import GravityField
+from .models import (
+    GravityItem, ChargeData, ConsequenceData, MomentumState, EnergyCategory,
+)
+
+
+def _synthetic_items(n: int, now: datetime) -> list:
+    momenta = list(MomentumState)[:5]
+    contexts = list(EnergyCategory)
+    items = []
+    for k in range(n):
+        items.append(GravityItem(
+            title=f"Item {k}",
+            mass=10 + (k * 37) % 90,
+            # Half-hour offset keeps due dates off the cliff boundaries, so the
+            # scalar path's later clock reads land in the same step
+            proximity_date=now + timedelta(hours=(k * 53) % 720 - 120, minutes=30) if k % 7 else None,
+            charge=ChargeData(tier=k % 4, prior_misses=k % 3),
+            consequence=ConsequenceData(revenue_at_risk=(k * 977) % 80_000),
+            momentum=momenta[k % len(momenta)],
+            progress_percent=(k * 13) % 100,
+            context_type=contexts[k % len(contexts)],
+            okr_alignment=["growth"] if k % 11 == 0 else [],
+        ))
+    return items
+
+
+def benchmark(sizes: tuple = (1_000, 10_000, 100_000)) -> list[dict]:
+    """Time the scalar and batch paths over synthetic fields of each size."""
+    field = GravityField()
+    now = datetime.now()
+    results = []
+    for n in sizes:
+        items = _synthetic_items(n, now)
+
+        start = time.perf_counter()
+        scalar = [field.calculate_gravity(i).normalised_score for i in items]
+        scalar_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = score_batch(field, items, now)
+        batch_s = time.perf_counter() - start
+
+        mismatches = sum(1 for a, b in zip(scalar, batch) if abs(a - b) > 0.1)
+        results.append({
+            "items": n,
+            "scalar_ms": round(scalar_s * 1000, 1),
+            "batch_ms": round(batch_s * 1000, 1),
+            "speedup": round(scalar_s / batch_s, 1) if batch_s else None,
+            "mismatches": mismatches,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    if not HAS_NUMPY:
+        raise SystemExit("numpy is required for the batch scoring benchmark")
+    print(f"{'items':>8} {'scalar ms':>10} {'batch ms':>10} {'speedup':>8} {'mismatch':>9}")
+    for row in benchmark():
+        print(f"{row['items']:>8} {row['scalar_ms']:>10} {row['batch_ms']:>10} "
+              f"{row['speedup']:>8} {row['mismatches']:>9}")
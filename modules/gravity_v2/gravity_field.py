@@ -9,9 +9,12 @@ Almost Magic Tech Lab — Patentable IP
 """
 
 import math
+import heapq
 import logging
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from .models import (
     GravityItem, GravityFieldSnapshot, GravityBreakdown,
@@ -19,10 +22,26 @@ from .models import (
     AlertLevel, MomentumState, EnergyCategory, TrajectoryDirection,
 )
 from .governors import GovernorSystem
+from .batch_scoring import HAS_NUMPY, score_batch
 
 logger = logging.getLogger("elaine.gravity")
 
 
+class _Contribution(NamedTuple):
+    """What one item currently adds to the field's running aggregates."""
+    active: bool
+    score: float = 0.0
+    alert: AlertLevel = AlertLevel.NORMAL
+    revenue_at_risk: float = 0.0
+    blocked: int = 0
+    trust_cost: float = 0.0
+    hours: float = 0.0
+    okrs_at_risk: tuple = ()
+    cooling_people: tuple = ()
+    context: Optional[EnergyCategory] = None
+    ungraviton_tags: tuple = ()
+
+
 class GravityField:
     """
     The Gravity Field: a multi-body physics model for decision-making.
@@ -49,7 +68,36 @@ class GravityField:
 
     NORMALISATION_DIVISOR = 350.0  # Tuned so typical max raw ≈ 350 → score 100
 
-    def __init__(self):
+    # Days-until-due values where proximity, damping or trajectory change
+    TIME_BOUNDARY_DAYS = (14, 7, 3, 1, 0, -1, -2, -3)
+    # Days-untouched values where alert levels change
+    UNTOUCHED_BOUNDARY_DAYS = (5, 7)
+    # Proximity cliff: (days-until-due exceeded, multiplier before personal cliff)
+    PROXIMITY_STEPS = ((14, 1.0), (7, 1.3), (3, 1.8), (1, 3.0), (0, 5.0))
+    # Overdue: (days overdue at most, multiplier); beyond these it saturates
+    OVERDUE_STEPS = ((1, 8.0), (2, 8.5))
+    OVERDUE_SATURATED = 9.0  # Governor caps here
+    MOMENTUM_ADJUSTMENT = {
+        MomentumState.NOT_STARTED: -5.0,
+        MomentumState.STARTED: 5.0,
+        MomentumState.IN_PROGRESS: 15.0,
+        MomentumState.BLOCKED: -10.0,
+        MomentumState.NEAR_COMPLETE: 25.0,
+        MomentumState.COMPLETE: 0.0,
+        MomentumState.ABANDONED: 0.0,
+    }
+    # Completed items older than this move to the archive
+    ARCHIVE_AFTER_DAYS = 7
+    # Dirty sets at least this large are scored through the NumPy batch path
+    BATCH_THRESHOLD = 256
+    # Energy-task fit windows: (first hour, last hour inclusive, modifier)
+    ENERGY_WINDOWS = {
+        EnergyCategory.DEEP_COGNITIVE: ((7, 11, 5.0), (14, 16, -5.0)),
+        EnergyCategory.ADMINISTRATIVE: ((16, 18, 5.0),),
+        EnergyCategory.CREATIVE: ((9, 12, 3.0),),
+    }
+
+    def __init__(self, journal=None, archive=None):
         self.items: dict[str, GravityItem] = {}
         self.governors = GovernorSystem()
         self.personal_cliff = dict(self.DEFAULT_CLIFF)
@@ -57,11 +105,40 @@ class GravityField:
         self._recalc_count_this_hour: int = 0
         self._snapshot_history: list[GravityFieldSnapshot] = []
 
+        # ── Incremental engine state ──
+        self._dirty: set[str] = set()           # changed since last pass
+        self._full_pending: bool = False        # dampened full pass, deferred
+        self._boundary_heap: list[tuple[datetime, str]] = []
+        self._next_boundary: dict[str, datetime] = {}
+        self._rank: list[tuple[float, str]] = []  # (-score, id), active items only
+        self._contrib: dict[str, _Contribution] = {}
+        self._alert_counts: Counter = Counter()
+        self._okr_counts: Counter = Counter()
+        self._cooling_counts: Counter = Counter()
+        self._context_counts: Counter = Counter()
+        self._ungraviton_tags: Counter = Counter()
+        self._ungraviton_count: int = 0
+        self._revenue_at_risk: float = 0.0
+        self._blocked_total: int = 0
+        self._trust_debt: float = 0.0
+        self._trust_items: int = 0
+        self._red_giant_hours: float = 0.0
+
+        # ── Persistence (modules.persistence.RecordJournal / RecordArchive) ──
+        self._journal = journal
+        self._archive = archive
+        if journal is not None:
+            self.items.update(journal.load())
+            journal.bind(self.items)
+            self._dirty.update(self.items)
+            self.archive_completed()
+
     # ── Item Management ────────────────────────────────────────────
 
     def add_item(self, item: GravityItem) -> GravityItem:
         """Add a gravity item to the field."""
         self.items[item.id] = item
+        self._touch(item.id)
         logger.info(f"Added gravity item: {item.id} — {item.title}")
         return item
 
@@ -75,6 +152,7 @@ class GravityField:
             if hasattr(item, key):
                 setattr(item, key, value)
         item.last_touched = datetime.now()
+        self._touch(item_id)
         return item
 
     def complete_item(self, item_id: str) -> Optional[GravityItem]:
@@ -86,6 +164,7 @@ class GravityField:
         item.completed_at = datetime.now()
         item.progress_percent = 100.0
         item.gravity_score = 0.0
+        self._touch(item_id)
         self._propagate_completion(item)
         logger.info(f"Completed: {item.id} — {item.title}")
         return item
@@ -97,6 +176,7 @@ class GravityField:
             return None
         item.deprioritised = True
         item.deprioritised_since = datetime.now()
+        self._touch(item_id)
         logger.info(f"Deprioritised: {item.id} — {item.title}")
         return item
 
@@ -107,6 +187,7 @@ class GravityField:
             return None
         item.deprioritised = False
         item.deprioritised_since = None
+        self._touch(item_id)
         logger.info(f"Revived: {item.id} — {item.title}")
         return item
 
@@ -115,6 +196,46 @@ class GravityField:
         item = self.items.get(item_id)
         if item:
             item.avoidance_count += 1
+            self._touch(item_id)
+
+    def mark_dirty(self, item_id: str):
+        """Flag an item whose fields were changed outside the field's own methods."""
+        if item_id in self.items:
+            self._touch(item_id)
+
+    def _touch(self, item_id: str):
+        """Queue an item for rescoring and journal its new state."""
+        self._dirty.add(item_id)
+        if self._journal is not None:
+            self._journal.put(item_id, self.items[item_id])
+
+    def archive_completed(self, older_than_days: Optional[float] = None) -> int:
+        """
+        Move items completed more than ARCHIVE_AFTER_DAYS ago out of the live
+        field into the archive, keeping memory bounded. Needs an archive.
+        """
+        if self._archive is None:
+            return 0
+        cutoff = datetime.now() - timedelta(days=older_than_days or self.ARCHIVE_AFTER_DAYS)
+        done = [
+            i for i in self.items.values()
+            if i.momentum == MomentumState.COMPLETE and i.completed_at and i.completed_at < cutoff
+        ]
+        for item in done:
+            self._archive.put(item.id, item)
+            del self.items[item.id]
+            self._dirty.add(item.id)
+            if self._journal is not None:
+                self._journal.delete(item.id)
+        if done:
+            logger.info(f"Archived {len(done)} completed gravity items")
+        return len(done)
+
+    def get_archived_item(self, item_id: str) -> Optional[GravityItem]:
+        """Look up a completed item that has been moved to the archive."""
+        if self._archive is None:
+            return None
+        return self._archive.get(item_id)
 
     # ── The Core Gravity Equation ──────────────────────────────────
 
@@ -210,38 +331,20 @@ class GravityField:
         # Personal cliff multiplier adjusts the curve
         pcm = item.personal_cliff_multiplier
 
-        if days > 14:
-            return 1.0 * pcm
-        elif days > 7:
-            return 1.3 * pcm
-        elif days > 3:
-            return 1.8 * pcm
-        elif days > 1:
-            return 3.0 * pcm
-        elif days > 0:
-            return 5.0 * pcm
-        else:
-            # Overdue — saturates at day 3 (Damping Governor)
-            overdue_days = abs(days)
-            if overdue_days <= 1:
-                return 8.0
-            elif overdue_days <= 2:
-                return 8.5
-            else:
-                return 9.0  # Saturated — Governor caps here
+        for threshold, multiplier in self.PROXIMITY_STEPS:
+            if days > threshold:
+                return multiplier * pcm
+
+        # Overdue — saturates at day 3 (Damping Governor)
+        overdue_days = abs(days)
+        for limit, multiplier in self.OVERDUE_STEPS:
+            if overdue_days <= limit:
+                return multiplier
+        return self.OVERDUE_SATURATED
 
     def _calculate_momentum(self, item: GravityItem) -> float:
         """Momentum: work in progress gets a boost. Inertia protects it."""
-        momentum_map = {
-            MomentumState.NOT_STARTED: -5.0,
-            MomentumState.STARTED: 5.0,
-            MomentumState.IN_PROGRESS: 15.0,
-            MomentumState.BLOCKED: -10.0,
-            MomentumState.NEAR_COMPLETE: 25.0,
-            MomentumState.COMPLETE: 0.0,
-            MomentumState.ABANDONED: 0.0,
-        }
-        base = momentum_map.get(item.momentum, 0.0)
+        base = self.MOMENTUM_ADJUSTMENT.get(item.momentum, 0.0)
 
         # Progress bonus
         if item.progress_percent > 75:
@@ -259,18 +362,11 @@ class GravityField:
         """
         hour = datetime.now().hour
 
-        # Simple heuristic until learning kicks in
-        if item.context_type == EnergyCategory.DEEP_COGNITIVE:
-            if 7 <= hour <= 11:
-                return 5.0   # Morning = good for deep work
-            elif 14 <= hour <= 16:
-                return -5.0  # Post-lunch slump
-        elif item.context_type == EnergyCategory.ADMINISTRATIVE:
-            if 16 <= hour <= 18:
-                return 5.0   # End of day = good for admin
-        elif item.context_type == EnergyCategory.CREATIVE:
-            if 9 <= hour <= 12:
-                return 3.0
+        # Simple heuristic until learning kicks in: mornings suit deep work,
+        # post-lunch slumps hurt it, end of day suits admin.
+        for first, last, modifier in self.ENERGY_WINDOWS.get(item.context_type, ()):
+            if first <= hour <= last:
+                return modifier
 
         return 0.0
 
@@ -302,32 +398,180 @@ class GravityField:
 
     # ── Field Operations ───────────────────────────────────────────
 
-    def recalculate(self):
+    def recalculate(self, full: bool = False):
         """
-        Recalculate gravity for ALL active items.
-        Event-driven: called when items change, not on a timer.
+        Bring gravity scores up to date.
+        Event-driven and incremental: only items that changed (add, update,
+        complete, propagation) or crossed a time boundary — a proximity cliff,
+        the damping point, an untouched threshold, an energy window — since
+        the last pass are recomputed.
+
+        full=True recomputes every active item. Full passes are what the
+        Damping Governor rate-limits; a dampened full pass is deferred to the
+        next allowed call instead of being dropped.
         """
-        # Damping Governor: limit recalc frequency
-        if not self.governors.allow_recalculation(self._last_recalc, self._recalc_count_this_hour):
-            logger.debug("Recalculation dampened — too frequent")
+        now = datetime.now()
+        if full or self._full_pending:
+            if (self._last_recalc is None or now - self._last_recalc > timedelta(hours=1)):
+                self._recalc_count_this_hour = 0
+            if self.governors.allow_recalculation(self._last_recalc, self._recalc_count_this_hour):
+                self._recalc_count_this_hour += 1
+                self._last_recalc = now
+                self._full_pending = False
+                self.archive_completed()
+                self._dirty.update(self.items)
+            else:
+                logger.debug("Full recalculation dampened — deferred")
+                self._full_pending = True
+
+        # Items whose next time boundary has passed
+        heap = self._boundary_heap
+        while heap and heap[0][0] <= now:
+            when, item_id = heapq.heappop(heap)
+            if self._next_boundary.get(item_id) == when:
+                del self._next_boundary[item_id]
+                self._dirty.add(item_id)
+
+        if not self._dirty:
             return
 
-        self._recalc_count_this_hour += 1
-        self._last_recalc = datetime.now()
-
-        active_items = [
-            item for item in self.items.values()
-            if not item.deprioritised and item.momentum != MomentumState.COMPLETE
+        dirty, self._dirty = self._dirty, set()
+        for item_id in dirty - self.items.keys():
+            self._unindex(item_id)
+        changed = [self.items[item_id] for item_id in dirty if item_id in self.items]
+        live = [
+            i for i in changed
+            if not i.deprioritised and i.momentum != MomentumState.COMPLETE
         ]
 
-        for item in active_items:
-            breakdown = self.calculate_gravity(item)
-            item.gravity_score = breakdown.normalised_score
-            item.breakdown = breakdown
-            item.alert_level = self._determine_alert_level(item)
+        if HAS_NUMPY and len(live) >= self.BATCH_THRESHOLD:
+            # Columnar path: scores only; breakdowns are built on demand
+            for item, score in zip(live, score_batch(self, live, now)):
+                item.gravity_score = score
+                item.breakdown = None
+        else:
+            for item in live:
+                breakdown = self.calculate_gravity(item)
+                item.gravity_score = breakdown.normalised_score
+                item.breakdown = breakdown
+
+        for item in live:
             item.trajectory = self._calculate_trajectory(item)
+            item.alert_level = self._determine_alert_level(item)
+        for item in changed:
+            self._reindex(item, now)
+
+        logger.debug(f"Recalculated gravity for {len(dirty)} items")
+
+    # ── Incremental Index ──────────────────────────────────────────
+
+    def _unindex(self, item_id: str):
+        """Remove an item's contribution from the rank and aggregates."""
+        c = self._contrib.pop(item_id, None)
+        if c is None:
+            return
+        if not c.active:
+            self._ungraviton_count -= 1
+            self._ungraviton_tags.subtract(c.ungraviton_tags)
+            return
+        key = (-c.score, item_id)
+        i = bisect_left(self._rank, key)
+        if i < len(self._rank) and self._rank[i] == key:
+            del self._rank[i]
+        self._alert_counts[c.alert] -= 1
+        self._okr_counts.subtract(c.okrs_at_risk)
+        self._cooling_counts.subtract(c.cooling_people)
+        if c.context is not None:
+            self._context_counts[c.context] -= 1
+        self._revenue_at_risk -= c.revenue_at_risk
+        self._blocked_total -= c.blocked
+        self._trust_debt -= c.trust_cost
+        self._trust_items -= 1 if c.trust_cost > 0 else 0
+        if c.alert == AlertLevel.RED_GIANT:
+            self._red_giant_hours -= c.hours
+
+    def _reindex(self, item: GravityItem, now: datetime):
+        """Replace an item's contribution and schedule its next time boundary."""
+        self._unindex(item.id)
+        if item.deprioritised:
+            tags = tuple(item.tags)
+            self._contrib[item.id] = _Contribution(active=False, ungraviton_tags=tags)
+            self._ungraviton_count += 1
+            self._ungraviton_tags.update(tags)
+            self._next_boundary.pop(item.id, None)
+            return
+        if item.momentum == MomentumState.COMPLETE:
+            self._next_boundary.pop(item.id, None)
+            return
+
+        c = _Contribution(
+            active=True,
+            score=item.gravity_score,
+            alert=item.alert_level,
+            revenue_at_risk=item.consequence.revenue_at_risk,
+            blocked=len(item.consequence.blocked_items),
+            trust_cost=item.charge.trust_cost_aud if item.charge.trust_cost_aud > 0 else 0.0,
+            hours=item.estimated_hours,
+            okrs_at_risk=tuple(item.okr_alignment) if item.days_untouched >= 7 else (),
+            cooling_people=tuple(item.charge.people) if item.charge.prior_misses >= 2 else (),
+            context=item.context_type if item.gravity_score >= 40 else None,
+        )
+        self._contrib[item.id] = c
+        insort(self._rank, (-c.score, item.id))
+        self._alert_counts[c.alert] += 1
+        self._okr_counts.update(c.okrs_at_risk)
+        self._cooling_counts.update(c.cooling_people)
+        if c.context is not None:
+            self._context_counts[c.context] += 1
+        self._revenue_at_risk += c.revenue_at_risk
+        self._blocked_total += c.blocked
+        self._trust_debt += c.trust_cost
+        self._trust_items += 1 if c.trust_cost > 0 else 0
+        if c.alert == AlertLevel.RED_GIANT:
+            self._red_giant_hours += c.hours
+
+        when = self._next_time_boundary(item, now)
+        if when is None:
+            self._next_boundary.pop(item.id, None)
+        else:
+            self._next_boundary[item.id] = when
+            heapq.heappush(self._boundary_heap, (when, item.id))
 
-        logger.info(f"Recalculated gravity for {len(active_items)} items")
+    def _next_time_boundary(self, item: GravityItem, now: datetime) -> Optional[datetime]:
+        """
+        Earliest moment the item's score, trajectory or alert could change
+        without anyone touching it. A one-second slack puts us safely past
+        boundaries that flip on strict comparisons.
+        """
+        slack = timedelta(seconds=1)
+        candidates = []
+        if item.proximity_date:
+            for d in self.TIME_BOUNDARY_DAYS:
+                t = item.proximity_date - timedelta(days=d) + slack
+                if t > now:
+                    candidates.append(t)
+                    break  # boundaries are in time order
+        touched = item.last_touched or item.created_at
+        for d in self.UNTOUCHED_BOUNDARY_DAYS:
+            t = touched + timedelta(days=d) + slack
+            if t > now:
+                candidates.append(t)
+                break
+        windows = self.ENERGY_WINDOWS.get(item.context_type)
+        if windows:
+            hours = sorted({h for first, last, _ in windows for h in (first, (last + 1) % 24)})
+            today = now.replace(minute=0, second=0, microsecond=0)
+            upcoming = [h for h in hours if h > now.hour]
+            if upcoming:
+                candidates.append(today.replace(hour=upcoming[0]) + slack)
+            else:
+                candidates.append(today.replace(hour=hours[0]) + timedelta(days=1) + slack)
+        return min(candidates) if candidates else None
+
+    def _ranked_above(self, threshold: float) -> list[GravityItem]:
+        """Active items scoring at least threshold, highest first."""
+        end = bisect_left(self._rank, (-threshold, chr(0x10FFFF)))
+        return [self.items[item_id] for _, item_id in self._rank[:end]]
 
     def _determine_alert_level(self, item: GravityItem) -> AlertLevel:
         """Determine the alert level for an item."""
@@ -359,34 +603,84 @@ class GravityField:
     def detect_collisions(self, available_hours: float = 8.0) -> list[Collision]:
         """
         Detect when two high-gravity items can't both be done today.
-        Returns collision objects with resolution options.
+        Sort-and-sweep: with items ordered by estimated hours, every partner
+        that overflows the day alongside an item sits in one suffix found by
+        bisect, so cost is O(n log n + collisions) rather than all pairs.
+        Resolution options are built on demand by collision_options().
         """
-        collisions = []
-        red_and_approaching = sorted(
-            [i for i in self.items.values()
-             if i.alert_level in (AlertLevel.RED_GIANT, AlertLevel.APPROACHING_MASS)
-             and not i.deprioritised and i.momentum != MomentumState.COMPLETE],
-            key=lambda x: x.gravity_score,
-            reverse=True,
-        )
+        self.recalculate()
+        red_and_approaching = self._ranked_above(70)
 
         total_hours_needed = sum(i.estimated_hours for i in red_and_approaching)
         if total_hours_needed <= available_hours:
             return []
 
-        # Find pairs that can't coexist
-        for i, item_a in enumerate(red_and_approaching):
-            for item_b in red_and_approaching[i + 1:]:
-                combined_hours = item_a.estimated_hours + item_b.estimated_hours
-                if combined_hours > available_hours:
-                    collision = Collision(
-                        item_a_id=item_a.id,
-                        item_b_id=item_b.id,
-                        options=self._generate_resolution_options(item_a, item_b),
-                    )
-                    collisions.append(collision)
+        # Rank position doubles as gravity order: lower = heavier
+        by_hours = sorted(enumerate(red_and_approaching), key=lambda p: p[1].estimated_hours)
+        hours = [item.estimated_hours for _, item in by_hours]
+
+        pairs = []
+        for a, (rank_a, item_a) in enumerate(by_hours):
+            start = bisect_right(hours, available_hours - item_a.estimated_hours, a + 1)
+            for rank_b, _ in by_hours[start:]:
+                pairs.append((rank_a, rank_b) if rank_a < rank_b else (rank_b, rank_a))
+
+        pairs.sort()
+        return [
+            Collision(
+                item_a_id=red_and_approaching[i].id,
+                item_b_id=red_and_approaching[j].id,
+            )
+            for i, j in pairs
+        ]
+
+    def collision_options(self, collision: Collision) -> list[CollisionOption]:
+        """Resolution options for a collision, built the first time they're asked for."""
+        if not collision.options:
+            item_a = self.items.get(collision.item_a_id)
+            item_b = self.items.get(collision.item_b_id)
+            if item_a and item_b:
+                collision.options = self._generate_resolution_options(item_a, item_b)
+        return collision.options
+
+    def best_feasible_set(
+        self, available_hours: float = 8.0, slot_minutes: int = 15
+    ) -> list[GravityItem]:
+        """
+        The set of red giants and approaching items that fits in the day with
+        the most total gravity: a 0/1 knapsack over time slots, with each
+        item's estimate rounded up to whole slots. Returned heaviest first.
+        Capacity is capped at what the candidates could fill, so a huge
+        available_hours doesn't size the table; none at all plans nothing.
+        """
+        if not available_hours > 0:  # also rejects NaN
+            return []
+        self.recalculate()
+        candidates = self._ranked_above(70)
+        weights = [math.ceil(i.estimated_hours * 60 / slot_minutes - 1e-9) for i in candidates]
+        capacity = int(min(available_hours * 60 / slot_minutes, sum(weights)))
+        if capacity <= 0:
+            return []
 
-        return collisions
+        best = [0.0] * (capacity + 1)
+        taken = []
+        for item, weight in zip(candidates, weights):
+            row = [False] * (capacity + 1)
+            for c in range(capacity, weight - 1, -1):
+                value = best[c - weight] + item.gravity_score
+                if value > best[c]:
+                    best[c] = value
+                    row[c] = True
+            taken.append(row)
+
+        chosen = []
+        c = capacity
+        for k in range(len(candidates) - 1, -1, -1):
+            if taken[k][c]:
+                chosen.append(candidates[k])
+                c -= weights[k]
+        chosen.reverse()
+        return chosen
 
     def _generate_resolution_options(
         self, item_a: GravityItem, item_b: GravityItem
@@ -442,6 +736,7 @@ class GravityField:
             elif effect.on_complete_delta:
                 target.mass += effect.on_complete_delta
                 logger.info(f"Propagated +{effect.on_complete_delta} mass to {target.id}")
+            self._touch(target.id)
 
     # ── Context Collapse Detection ─────────────────────────────────
 
@@ -450,15 +745,10 @@ class GravityField:
         Detect when a day requires too many mental modes.
         Context switching costs ~40% cognitive efficiency.
         """
-        active = [
-            i for i in self.items.values()
-            if i.gravity_score >= 40 and not i.deprioritised
-            and i.momentum != MomentumState.COMPLETE
-        ]
-
-        context_types = set(i.context_type for i in active)
+        context_types = +self._context_counts
         if len(context_types) <= 3:
             return None
+        active = self._ranked_above(40)
 
         # Estimate switching cost: ~25 min per switch
         num_switches = len(context_types) - 1
@@ -490,66 +780,34 @@ class GravityField:
         """Produce a complete field snapshot for the morning briefing."""
         self.recalculate()
 
-        active = [
-            i for i in self.items.values()
-            if not i.deprioritised and i.momentum != MomentumState.COMPLETE
-        ]
-        deprioritised = [i for i in self.items.values() if i.deprioritised]
-
-        red_giants = [i for i in active if i.alert_level == AlertLevel.RED_GIANT]
-        approaching = [i for i in active if i.alert_level == AlertLevel.APPROACHING_MASS]
-        stable = [i for i in active if i.alert_level == AlertLevel.NORMAL]
-        peripheral = [i for i in active if i.gravity_score < 30]
-
-        top_3 = sorted(active, key=lambda x: x.gravity_score, reverse=True)[:3]
-
-        # Consequence exposure
-        total_revenue_risk = sum(i.consequence.revenue_at_risk for i in active)
-        total_blocked = sum(len(i.consequence.blocked_items) for i in active)
-        okrs_at_risk = list(set(
-            okr for i in active
-            if i.days_untouched >= 7
-            for okr in i.okr_alignment
-        ))
-
-        # Trust debt
-        trust_debt = sum(i.charge.trust_cost_aud for i in active if i.charge.trust_cost_aud > 0)
-        trust_items = len([i for i in active if i.charge.trust_cost_aud > 0])
-        cooling = list(set(
-            person for i in active
-            if i.charge.prior_misses >= 2
-            for person in i.charge.people
-        ))
+        top_3 = self.get_top_items(3)
 
         # Ungraviton pattern analysis
-        ungrav_tags = [tag for i in deprioritised for tag in i.tags]
         ungrav_pattern = None
-        if ungrav_tags:
-            from collections import Counter
-            most_common = Counter(ungrav_tags).most_common(1)
-            if most_common and most_common[0][1] >= 2:
-                ungrav_pattern = f"{most_common[0][0]}_avoidance"
+        most_common = (+self._ungraviton_tags).most_common(1)
+        if most_common and most_common[0][1] >= 2:
+            ungrav_pattern = f"{most_common[0][0]}_avoidance"
 
         snap = GravityFieldSnapshot(
-            total_items=len(active),
-            red_giants=len(red_giants),
-            approaching=len(approaching),
-            stable=len(stable),
-            peripheral=len(peripheral),
+            total_items=len(self._rank),
+            red_giants=self._alert_counts[AlertLevel.RED_GIANT],
+            approaching=self._alert_counts[AlertLevel.APPROACHING_MASS],
+            stable=self._alert_counts[AlertLevel.NORMAL],
+            peripheral=len(self._rank) - bisect_left(self._rank, (-30, chr(0x10FFFF))),
             collisions=self.detect_collisions(),
             top_3_ids=[i.id for i in top_3],
-            trust_debt_total_aud=trust_debt,
-            trust_debt_items=trust_items,
-            relationships_cooling=cooling,
+            trust_debt_total_aud=self._trust_debt,
+            trust_debt_items=self._trust_items,
+            relationships_cooling=list(+self._cooling_counts),
             consequence_exposure={
-                "total_revenue_at_risk": total_revenue_risk,
-                "total_blocked_items": total_blocked,
-                "okrs_at_risk": okrs_at_risk,
+                "total_revenue_at_risk": self._revenue_at_risk,
+                "total_blocked_items": self._blocked_total,
+                "okrs_at_risk": list(+self._okr_counts),
             },
             context_collapse=self.detect_context_collapse(),
-            required_hours_red_giant=sum(i.estimated_hours for i in red_giants),
+            required_hours_red_giant=self._red_giant_hours,
             governor_status=self.governors.status(),
-            ungraviton_count=len(deprioritised),
+            ungraviton_count=self._ungraviton_count,
             ungraviton_pattern=ungrav_pattern,
         )
 
@@ -558,23 +816,31 @@ class GravityField:
 
     def get_top_items(self, n: int = 5) -> list[GravityItem]:
         """Get top N items by gravity score."""
-        active = [
-            i for i in self.items.values()
-            if not i.deprioritised and i.momentum != MomentumState.COMPLETE
-        ]
-        return sorted(active, key=lambda x: x.gravity_score, reverse=True)[:n]
+        self.recalculate()
+        return [self.items[item_id] for _, item_id in self._rank[:n]]
 
     def get_ungraviton(self) -> list[GravityItem]:
         """Get all deprioritised items."""
         return [i for i in self.items.values() if i.deprioritised]
 
+    def get_breakdown(self, item_id: str) -> Optional[GravityBreakdown]:
+        """
+        Score breakdown and explanation for one item.
+        Built lazily — batch-scored items only pay for it when displayed.
+        """
+        item = self.items.get(item_id)
+        if item is None:
+            return None
+        if item.breakdown is None:
+            self.recalculate()
+            item.breakdown = self.calculate_gravity(item)
+        return item.breakdown
+
     def get_item(self, item_id: str) -> Optional[GravityItem]:
         """Get a specific item by ID."""
         return self.items.get(item_id)
 
     def active_item_count(self) -> int:
         """Number of active (non-deprioritised, non-complete) items."""
-        return len([
-            i for i in self.items.values()
-            if not i.deprioritised and i.momentum != MomentumState.COMPLETE
-        ])
+        self.recalculate()
+        return len(self._rank)
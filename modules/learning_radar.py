@@ -21,12 +21,16 @@ Patentable: Passive Intellectual Interest Detection from Professional Activity
 """
 
 import logging
+import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 import uuid
 
+from modules.text_matcher import MultiPatternMatcher
+
 logger = logging.getLogger("elaine.learning_radar")
 
 
@@ -308,10 +312,23 @@ class LearningRadar:
     then connects the dots and suggests where to go deeper.
     """
 
-    def __init__(self):
+    def __init__(self, journal=None):
         self.interests: dict[str, IntellectualInterest] = {}
         self.connections: list[Connection] = []
-        self._seed()
+        self._index = None  # compiled topic matcher, see _topic_index()
+
+        # Persistence (modules.persistence.RecordJournal): a warm start
+        # restores interests instead of re-seeding them
+        self._journal = journal
+        if journal is not None and journal.has_state:
+            self.interests.update(journal.load())
+        else:
+            self._seed()
+        if journal is not None:
+            journal.bind(self.interests)
+            if not journal.has_state:
+                journal.compact()
+        self._seed_connections()
 
     def _seed(self):
         """Seed with Mani's known interests."""
@@ -325,7 +342,13 @@ class LearningRadar:
             interest.strength = self._calculate_strength(interest)
             self.interests[interest.interest_id] = interest
 
-        # Seed connections
+    def _persist(self, interest: IntellectualInterest):
+        """Journal an interest after it changes."""
+        if self._journal is not None:
+            self._journal.put(interest.interest_id, interest)
+
+    def _seed_connections(self):
+        """Seed known connections, resolved by topic against current interests."""
         for conn in SEED_CONNECTIONS:
             topic_ids = []
             topic_names = conn["topics"]
@@ -360,38 +383,85 @@ class LearningRadar:
         Called by Orchestrator when meetings/content/conversations happen.
         """
         signal = InterestSignal(text=text, source=source, context=context)
+        found = self._topic_index().find(text.lower())
 
         # Check against existing interests
-        matched = self._match_existing(text)
+        matched = self._match_found(found)
         if matched:
             matched.signals.append(signal)
             matched.last_detected = datetime.now()
             matched.strength = self._calculate_strength(matched)
+            self._persist(matched)
             logger.info(f"Interest signal: '{matched.topic}' ({matched.strength.value}) from {source.value}")
             return matched
 
         # Check against known topic patterns
-        new_interest = self._detect_new_topic(text, signal)
+        new_interest = self._detect_new_topic(text, signal, found)
         if new_interest:
             self.interests[new_interest.interest_id] = new_interest
+            self._index = None
+            self._persist(new_interest)
             logger.info(f"New interest detected: '{new_interest.topic}' from {source.value}")
             return new_interest
 
         return None
 
+    def detect_interests(self, texts: Iterable[str], source: InterestSource,
+                          context: str = "") -> list[Optional[IntellectualInterest]]:
+        """
+        Backfill: run detection over many texts (e.g. a whole conversation
+        history). The matcher is only recompiled when a text adds a topic.
+        """
+        return [self.detect_interest(text, source, context) for text in texts]
+
+    # ── Topic Matching ───────────────────────────────────────────
+
+    def _topic_index(self) -> MultiPatternMatcher:
+        """
+        One Aho-Corasick automaton over every tracked interest's topic and
+        keywords plus TOPIC_PATTERNS, so a text is scanned once however many
+        interests exist. Rebuilt when interests or patterns change.
+        """
+        size = (len(self.interests), len(self.TOPIC_PATTERNS))
+        if self._index is not None and self._index_size == size:
+            return self._index
+
+        self._index_interests = list(self.interests.values())
+        self._keyword_owners: dict[str, list[int]] = {}
+        self._topic_owners: dict[str, list[int]] = {}
+        for pos, interest in enumerate(self._index_interests):
+            topic = interest.topic.lower()
+            self._topic_owners.setdefault(topic, []).append(pos)
+            for word in topic.split():
+                if len(word) > 3:
+                    self._keyword_owners.setdefault(word, []).append(pos)
+        self._pattern_order = {p: n for n, p in enumerate(self.TOPIC_PATTERNS)}
+
+        self._index = MultiPatternMatcher(
+            list(self._keyword_owners) + list(self._topic_owners) + list(self.TOPIC_PATTERNS)
+        )
+        self._index_size = size
+        return self._index
+
     def _match_existing(self, text: str) -> Optional[IntellectualInterest]:
         """Match text against existing tracked interests."""
-        text_lower = text.lower()
-        for interest in self.interests.values():
-            keywords = interest.topic.lower().split()
-            # Match if 2+ significant words appear
-            matches = sum(1 for w in keywords if len(w) > 3 and w in text_lower)
-            if matches >= 2:
-                return interest
-            # Exact topic mention
-            if interest.topic.lower() in text_lower:
-                return interest
-        return None
+        return self._match_found(self._topic_index().find(text.lower()))
+
+    def _match_found(self, found: set[str]) -> Optional[IntellectualInterest]:
+        """
+        First tracked interest (in insertion order) with 2+ significant
+        keyword hits or an exact topic mention, given the matcher's hits.
+        """
+        hits = Counter()
+        for word in found:
+            for pos in self._keyword_owners.get(word, ()):
+                hits[pos] += 1
+        candidates = [pos for pos, n in hits.items() if n >= 2]
+        for topic in found:
+            candidates.extend(self._topic_owners.get(topic, ()))
+        if not candidates:
+            return None
+        return self._index_interests[min(candidates)]
 
     # Known intellectual patterns to watch for
     TOPIC_PATTERNS = {
@@ -463,24 +533,29 @@ class LearningRadar:
         "north star metric": ("Product strategy", "strategy"),
     }
 
-    def _detect_new_topic(self, text: str, signal: InterestSignal) -> Optional[IntellectualInterest]:
+    def _detect_new_topic(self, text: str, signal: InterestSignal,
+                          found: Optional[set[str]] = None) -> Optional[IntellectualInterest]:
         """Detect a new topic from known intellectual patterns."""
-        text_lower = text.lower()
-        for pattern, (topic, domain) in self.TOPIC_PATTERNS.items():
-            if pattern in text_lower:
-                # Check if already tracked
-                existing = self._match_existing(topic)
-                if existing:
-                    existing.signals.append(signal)
-                    existing.last_detected = datetime.now()
-                    existing.strength = self._calculate_strength(existing)
-                    return existing  # Return existing with new signal added
-                return IntellectualInterest(
-                    topic=topic,
-                    domain=domain,
-                    signals=[signal],
-                )
-        return None
+        if found is None:
+            found = self._topic_index().find(text.lower())
+        hits = [p for p in found if p in self._pattern_order]
+        if not hits:
+            return None
+
+        # Earliest-listed pattern wins, as if checked in order
+        topic, domain = self.TOPIC_PATTERNS[min(hits, key=self._pattern_order.get)]
+        # Check if already tracked
+        existing = self._match_existing(topic)
+        if existing:
+            existing.signals.append(signal)
+            existing.last_detected = datetime.now()
+            existing.strength = self._calculate_strength(existing)
+            return existing  # Return existing with new signal added
+        return IntellectualInterest(
+            topic=topic,
+            domain=domain,
+            signals=[signal],
+        )
 
     # ── Manual Interest Registration ─────────────────────────────
 
@@ -494,6 +569,8 @@ class LearningRadar:
             suggested_reading=reading or [],
         )
         self.interests[interest.interest_id] = interest
+        self._index = None
+        self._persist(interest)
         logger.info(f"Interest added: '{topic}' ({domain})")
         return interest
 
@@ -625,3 +702,64 @@ class LearningRadar:
             "deepening": len([i for i in self.interests.values()
                              if i.strength in (InterestStrength.DEEPENING, InterestStrength.PASSIONATE)]),
         }
+
+
+# ── Benchmark ────────────────────────────────────────────────────
+
+def benchmark(sizes: tuple = (10, 100, 1_000, 5_000), messages: int = 200) -> list[dict]:
+    """
+    Per-message detection cost as tracked interests grow, compared with
+    scanning every interest and pattern with `in` checks.
+    Run: python -m modules.learning_radar
+    """
+    sample = [
+        "Been rereading Marcus Aurelius on the train this morning",
+        "The board wants a SWOT before we commit to the new market",
+        "Quick note on the invoice for last week's workshop",
+        "Complexity and emergence keep coming up in client conversations",
+    ] * (messages // 4)
+
+    def scan_every_interest(radar, text):
+        text_lower = text.lower()
+        for interest in radar.interests.values():
+            keywords = interest.topic.lower().split()
+            if sum(1 for w in keywords if len(w) > 3 and w in text_lower) >= 2:
+                return interest
+            if interest.topic.lower() in text_lower:
+                return interest
+        for pattern in radar.TOPIC_PATTERNS:
+            if pattern in text_lower:
+                return pattern
+        return None
+
+    results = []
+    for n in sizes:
+        radar = LearningRadar()
+        for k in range(n - len(radar.interests)):
+            radar.add_interest(f"Synthetic topic {k} lattice{k} theory{k}")
+
+        start = time.perf_counter()
+        for text in sample:
+            scan_every_interest(radar, text)
+        naive_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+        radar._topic_index()  # compile once, as a warm engine would have
+        start = time.perf_counter()
+        for text in sample:
+            found = radar._topic_index().find(text.lower())
+            radar._match_found(found) or [p for p in found if p in radar._pattern_order]
+        matcher_us = (time.perf_counter() - start) / len(sample) * 1e6
+
+        results.append({
+            "interests": len(radar.interests),
+            "scan_us_per_message": round(naive_us, 1),
+            "matcher_us_per_message": round(matcher_us, 1),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'interests':>10} {'scan µs/msg':>12} {'matcher µs/msg':>15}")
+    for row in benchmark():
+        print(f"{row['interests']:>10} {row['scan_us_per_message']:>12} "
+              f"{row['matcher_us_per_message']:>15}")
@@ -201,12 +201,12 @@ class Orchestrator:
             return
 
         # Check if POI exists, update last contact
-        for poi in self.constellation.pois.values():
-            if poi.name.lower() == participant_name.lower():
-                poi.last_contact = datetime.now()
-                self._log("chronicle", "constellation", "poi_updated",
-                           f"'{participant_name}' last contact updated")
-                return
+        poi = self.constellation.find_poi(name=participant_name)
+        if poi:
+            poi.last_contact = datetime.now()
+            self._log("chronicle", "constellation", "poi_updated",
+                       f"'{participant_name}' last contact updated")
+            return
 
         self._log("chronicle", "constellation", "poi_not_found",
                    f"'{participant_name}' — consider adding as POI")
@@ -0,0 +1,322 @@
+"""
+Engine Persistence
+Snapshot-plus-journal durability for Elaine's in-memory engines.
+
+Each engine keeps its working set in a plain dict. Mutations are appended
+to a write-ahead journal as length-prefixed pickle frames of
+(op, key, record); once the journal grows past a threshold it is compacted
+into a single snapshot (pickle protocol 5) and truncated. A warm restart
+reads one snapshot and replays a short journal tail instead of re-seeding.
+
+Records that leave an engine's working set go to a RecordArchive instead:
+the same frame format, but only a key → file offset index is held in
+memory and lookups read a single frame.
+
+Almost Magic Tech Lab
+"""
+
+import logging
+import os
+import pickle
+import struct
+import threading
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("elaine.persistence")
+
+_FRAME = struct.Struct(">I")
+_PROTOCOL = 5
+
+
+class RecordJournal:
+    """
+    Durable backing for one engine's record dict.
+
+    Usage:
+        journal = RecordJournal(state_dir, "meetings")
+        records = journal.load()          # snapshot + journal replay
+        journal.bind(records)             # enables compaction
+        journal.put(key, record)          # after every mutation
+    """
+
+    def __init__(self, directory, name: str, compact_every: int = 500):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.compact_every = compact_every
+        self.snapshot_path = self.directory / f"{name}.snapshot"
+        self.journal_path = self.directory / f"{name}.journal"
+        self._records: Optional[dict] = None
+        self._lock = threading.RLock()
+        self._fh = None
+        self._pending = 0
+
+    @property
+    def has_state(self) -> bool:
+        """True if anything has ever been persisted under this name."""
+        return self.snapshot_path.exists() or (
+            self.journal_path.exists() and self.journal_path.stat().st_size > 0
+        )
+
+    def load(self) -> dict:
+        """Read the snapshot, then replay the journal on top of it."""
+        records: dict = {}
+        with self._lock:
+            if self.snapshot_path.exists():
+                with open(self.snapshot_path, "rb") as f:
+                    records = pickle.load(f)
+
+            self._pending = 0
+            if self.journal_path.exists():
+                good = 0
+                with open(self.journal_path, "rb") as f:
+                    while (entry := _read_frame(f)) is not None:
+                        op, key, record = entry
+                        if op == "put":
+                            records[key] = record
+                        else:
+                            records.pop(key, None)
+                        good = f.tell()
+                        self._pending += 1
+                _drop_torn_tail(self.journal_path, good, self.name)
+        return records
+
+    def bind(self, records: dict):
+        """Attach the live dict so the journal can compact it into a snapshot."""
+        self._records = records
+
+    def put(self, key, record):
+        """Journal the current state of one record."""
+        self._append(("put", key, record))
+
+    def delete(self, key):
+        """Journal the removal of one record."""
+        self._append(("del", key, None))
+
+    def _append(self, entry: tuple):
+        data = pickle.dumps(entry, protocol=_PROTOCOL)
+        with self._lock:
+            if self._fh is None:
+                self._fh = open(self.journal_path, "ab")
+            self._fh.write(_FRAME.pack(len(data)) + data)
+            self._fh.flush()
+            self._pending += 1
+            if self._records is not None and self._pending >= self.compact_every:
+                self.compact()
+
+    def compact(self):
+        """Write the bound dict as a fresh snapshot and truncate the journal."""
+        if self._records is None:
+            return
+        with self._lock:
+            tmp = self.snapshot_path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(dict(self._records), f, protocol=_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            open(self.journal_path, "wb").close()
+            self._pending = 0
+        logger.debug(f"Compacted {self.name}: {len(self._records)} records")
+
+    def close(self):
+        with self._lock:
+            self.compact()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+class RecordArchive:
+    """
+    Append-only store for records moved out of an engine's working set.
+
+    Frames are the same as RecordJournal's, but records stay on disk: only
+    a key → offset index is kept in memory, built by one scan at startup,
+    and get() seeks straight to the record's latest frame. Superseded and
+    deleted frames are dropped by compact(), which runs once they reach
+    compact_every and outnumber the live records.
+
+    Usage:
+        archive = RecordArchive(state_dir, "gravity_archive")
+        archive.put(key, record)
+        archive.get(key)
+    """
+
+    def __init__(self, directory, name: str, compact_every: int = 500):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.compact_every = compact_every
+        self.path = self.directory / f"{name}.journal"
+        self._index: dict = {}  # key → offset of its latest put frame
+        self._dead = 0  # frames compact() would drop
+        self._lock = threading.RLock()
+        self._fh = None
+        self._scan()
+
+    def _scan(self):
+        if not self.path.exists():
+            return
+        good = 0
+        with open(self.path, "rb") as f:
+            while (entry := _read_frame(f)) is not None:
+                op, key, _ = entry
+                self._note(op, key, good)
+                good = f.tell()
+        _drop_torn_tail(self.path, good, self.name)
+
+    def _note(self, op: str, key, offset: int):
+        if key in self._index:
+            self._dead += 1
+        if op == "put":
+            self._index[key] = offset
+        else:
+            self._index.pop(key, None)
+            self._dead += 1
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key, default=None):
+        """Read one record from disk, or ``default`` if it was never archived."""
+        with self._lock:
+            offset = self._index.get(key)
+            if offset is None:
+                return default
+            f = self._handle()
+            f.seek(offset)
+            return _read_frame(f)[2]
+
+    def put(self, key, record):
+        self._append("put", key, record)
+
+    def delete(self, key):
+        self._append("del", key, None)
+
+    def _handle(self):
+        if self._fh is None:
+            self._fh = open(self.path, "a+b")
+        return self._fh
+
+    def _append(self, op: str, key, record):
+        data = pickle.dumps((op, key, record), protocol=_PROTOCOL)
+        with self._lock:
+            f = self._handle()
+            offset = f.seek(0, os.SEEK_END)
+            f.write(_FRAME.pack(len(data)) + data)
+            f.flush()
+            self._note(op, key, offset)
+            if self._dead >= self.compact_every and self._dead > len(self._index):
+                self.compact()
+
+    def compact(self):
+        """Rewrite the file with only the latest frame of each live key."""
+        with self._lock:
+            if not self._dead:
+                return
+            src = self._handle()
+            tmp = self.path.with_suffix(".tmp")
+            index = {}
+            with open(tmp, "wb") as out:
+                for key, offset in sorted(self._index.items(), key=lambda kv: kv[1]):
+                    src.seek(offset)
+                    (length,) = _FRAME.unpack(src.read(_FRAME.size))
+                    index[key] = out.tell()
+                    out.write(_FRAME.pack(length) + src.read(length))
+                out.flush()
+                os.fsync(out.fileno())
+            src.close()
+            self._fh = None
+            os.replace(tmp, self.path)
+            dropped, self._index, self._dead = self._dead, index, 0
+        logger.debug(f"Compacted archive {self.name}: {len(index)} records, {dropped} frames dropped")
+
+    def close(self):
+        with self._lock:
+            self.compact()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+class EngineStore:
+    """
+    One state directory holding a journal per engine collection, with a
+    background checkpoint that also captures records mutated in place
+    without going through an engine method.
+    """
+
+    def __init__(self, directory, compact_every: int = 500):
+        self.directory = Path(directory).expanduser()
+        self.compact_every = compact_every
+        self._journals: dict[str, RecordJournal] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def journal(self, name: str) -> RecordJournal:
+        if name not in self._journals:
+            self._journals[name] = RecordJournal(self.directory, name, self.compact_every)
+        return self._journals[name]
+
+    def archive(self, name: str) -> RecordArchive:
+        if name not in self._journals:
+            self._journals[name] = RecordArchive(self.directory, name, self.compact_every)
+        return self._journals[name]
+
+    def compact_all(self):
+        for journal in self._journals.values():
+            try:
+                journal.compact()
+            except Exception as e:
+                logger.warning(f"Checkpoint of {journal.name} failed: {e}")
+
+    def start_checkpointer(self, interval_s: float = 300):
+        """Compact every bound journal on a fixed interval (daemon thread)."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        def _loop():
+            while not self._stop.wait(interval_s):
+                self.compact_all()
+
+        self._thread = threading.Thread(target=_loop, daemon=True, name="engine-checkpoint")
+        self._thread.start()
+
+    def close(self):
+        self._stop.set()
+        for journal in self._journals.values():
+            try:
+                journal.close()
+            except Exception as e:
+                logger.warning(f"Closing {journal.name} failed: {e}")
+
+
+def _read_frame(f) -> Optional[tuple]:
+    """Next (op, key, record) frame, or None at the end or at a torn frame."""
+    header = f.read(_FRAME.size)
+    if len(header) < _FRAME.size:
+        return None
+    (length,) = _FRAME.unpack(header)
+    data = f.read(length)
+    if len(data) < length:
+        return None
+    try:
+        return pickle.loads(data)
+    except Exception:
+        return None
+
+
+def _drop_torn_tail(path: Path, good: int, name: str):
+    if good < path.stat().st_size:
+        # Torn tail from a crash mid-write — drop it
+        logger.warning(f"Journal {name}: truncating torn tail at byte {good}")
+        with open(path, "r+b") as f:
+            f.truncate(good)
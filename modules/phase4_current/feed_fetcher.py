@@ -0,0 +1,199 @@
+"""
+ELAINE Phase 4: The Current — Feed Fetcher
+Concurrent, polite HTTP fetching for The Current's scanners.
+
+- One pooled session shared by a worker pool
+- Per-host concurrency limits and minimum spacing between requests
+  (replaces the fixed sleeps after every Reddit / Scholar / Books call)
+- Conditional GETs: ETag / Last-Modified validators are sent when known,
+  and a 304 comes back as not_modified with no body
+- Bodies are streamed and capped at MAX_BODY_BYTES; a cut-off body is
+  flagged as truncated
+
+Results are yielded as each fetch completes, so the caller can parse one
+feed while the others are still downloading.
+"""
+
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlencode, urlsplit
+
+try:
+    import requests
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+USER_AGENT = "ELAINE/1.0 (Almost Magic Tech Lab)"
+MAX_WORKERS = 16
+MAX_BODY_BYTES = 2 * 1024 * 1024
+
+# host → (max concurrent requests, minimum seconds between request starts)
+HOST_LIMITS = {
+    "www.reddit.com": (2, 0.5),
+    "api.semanticscholar.org": (1, 1.0),
+    "www.googleapis.com": (4, 0.0),
+}
+DEFAULT_HOST_LIMIT = (4, 0.0)
+
+
+@dataclass
+class FetchJob:
+    """One URL to fetch, plus whatever the caller needs to parse it."""
+    url: str
+    params: Optional[dict] = None
+    timeout: float = 15
+    context: dict = field(default_factory=dict)
+
+    @property
+    def full_url(self) -> str:
+        if not self.params:
+            return self.url
+        return f"{self.url}{'&' if '?' in self.url else '?'}{urlencode(self.params)}"
+
+
+@dataclass
+class FetchResult:
+    job: FetchJob
+    status: int = 0
+    body: bytes = b""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    truncated: bool = False
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200 and self.error is None
+
+
+class _HostGate:
+    """Concurrency cap plus start-time spacing for one host."""
+
+    def __init__(self, concurrency: int, interval: float):
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.slots.acquire()
+        if self.interval:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next)
+                self._next = start + self.interval
+            if start > now:
+                time.sleep(start - now)
+        return self
+
+    def __exit__(self, *exc):
+        self.slots.release()
+        return False
+
+
+class FeedFetcher:
+    """
+    Usage:
+        fetcher = FeedFetcher()
+        for result in fetcher.fetch_all(jobs, validators):
+            ...  # parse result.body while the rest keep downloading
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, user_agent: str = USER_AGENT,
+                 host_limits: Optional[dict] = None):
+        self.max_workers = max_workers
+        self.user_agent = user_agent
+        self.host_limits = {**HOST_LIMITS, **(host_limits or {})}
+        self._gates: dict[str, _HostGate] = {}
+        self._lock = threading.Lock()
+        self._session = None
+        if HAS_REQUESTS:
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=max_workers)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+    def _gate(self, url: str) -> _HostGate:
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            gate = self._gates.get(host)
+            if gate is None:
+                gate = self._gates[host] = _HostGate(*self.host_limits.get(host, DEFAULT_HOST_LIMIT))
+            return gate
+
+    def fetch(self, job: FetchJob, validators: Optional[dict] = None) -> FetchResult:
+        """Fetch one URL, sending If-None-Match / If-Modified-Since when known."""
+        headers = {"User-Agent": self.user_agent}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        result = FetchResult(job=job)
+        start = time.time()
+        try:
+            with self._gate(job.url):
+                if self._session is not None:
+                    self._fetch_requests(job, headers, result)
+                else:
+                    self._fetch_urllib(job, headers, result)
+        except Exception as e:
+            result.error = str(e)
+        result.elapsed = time.time() - start
+        return result
+
+    def _fetch_requests(self, job: FetchJob, headers: dict, result: FetchResult):
+        with self._session.get(job.url, params=job.params, headers=headers,
+                               timeout=job.timeout, stream=True) as resp:
+            result.status = resp.status_code
+            result.etag = resp.headers.get("ETag")
+            result.last_modified = resp.headers.get("Last-Modified")
+            if resp.status_code == 200:
+                result.body, result.truncated = _read_capped(resp.iter_content(64 * 1024))
+
+    def _fetch_urllib(self, job: FetchJob, headers: dict, result: FetchResult):
+        req = urllib.request.Request(job.full_url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=job.timeout) as resp:
+                result.status = resp.status
+                result.etag = resp.headers.get("ETag")
+                result.last_modified = resp.headers.get("Last-Modified")
+                result.body, result.truncated = _read_capped(iter(lambda: resp.read(64 * 1024), b""))
+        except urllib.error.HTTPError as e:
+            result.status = e.code
+
+    def fetch_all(self, jobs: Iterable[FetchJob],
+                  validators: Optional[dict] = None) -> Iterator[FetchResult]:
+        """Fetch concurrently; yield each result as it completes."""
+        jobs = list(jobs)
+        if not jobs:
+            return
+        validators = validators or {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs)),
+                                thread_name_prefix="current-fetch") as pool:
+            futures = [pool.submit(self.fetch, job, validators.get(job.full_url)) for job in jobs]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def _read_capped(chunks) -> tuple[bytes, bool]:
+    """(body cut to MAX_BODY_BYTES, whether anything was cut off)."""
+    parts, size = [], 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            break
+    return b"".join(parts)[:MAX_BODY_BYTES], size > MAX_BODY_BYTES
@@ -17,18 +17,15 @@ from pathlib import Path
 from urllib.parse import quote_plus
 
 # Optional imports — graceful fallback
-try:
-    import requests
-    HAS_REQUESTS = True
-except ImportError:
-    HAS_REQUESTS = False
-
 try:
     import feedparser
     HAS_FEEDPARSER = True
 except ImportError:
     HAS_FEEDPARSER = False
 
+from modules.sqlite_pool import get_pool
+from .feed_fetcher import HAS_REQUESTS, FeedFetcher, FetchJob
+
 
 # ─── Default Interest Areas for Almost Magic ───
 DEFAULT_INTEREST_AREAS = [
@@ -111,6 +108,12 @@ CONTENT_FORMATS = [
     "infographic_idea", "case_study_seed", "workshop_topic",
 ]
 
+# ─── Trend Windows ───
+# Mentions are counted per (area, keyword) in hourly buckets as discoveries
+# are stored; trends are read off rolling windows over those buckets.
+TREND_WINDOWS_HOURS = {'1d': 24, '7d': 168, '30d': 720}
+TREND_THRESHOLD = 3          # Mentions in the 7-day window to count as a trend
+
 
 class TheCurrentEngine:
     """
@@ -121,13 +124,20 @@ class TheCurrentEngine:
     def __init__(self, db_path=None):
         self.db_path = db_path or str(Path.home() / ".elaine" / "the_current.db")
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = get_pool(self.db_path)
         self._init_db()
+        self._fetcher = FeedFetcher()
+        self._seen_hashes = None
+        self._seen_lock = threading.Lock()
+        self._trend_dirty = set()      # (area, keyword) with new mentions since last refresh
+        self._trend_hour = None        # Hour of the last full window refresh
+        self._trend_lock = threading.Lock()
         self.interest_areas = DEFAULT_INTEREST_AREAS
         self._scan_thread = None
         self._running = False
 
     def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
 
         # Interest areas configuration
@@ -227,272 +237,314 @@ class TheCurrentEngine:
             scanned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )""")
 
+        # Rolling mention counts per (area, keyword) — hourly buckets
+        c.execute("SELECT 1 FROM sqlite_master WHERE name = 'trend_buckets'")
+        backfill = c.fetchone() is None
+        c.execute("""CREATE TABLE IF NOT EXISTS trend_buckets (
+            interest_area TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            hour TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (interest_area, keyword, hour)
+        )""")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_trend_buckets_hour ON trend_buckets(hour)")
+        self._migrate_trends(c)
+        if backfill:
+            self._backfill_trend_buckets(c)
+
+        # Conditional-GET validators per fetched URL
+        c.execute("""CREATE TABLE IF NOT EXISTS feed_state (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at TIMESTAMP
+        )""")
+
         conn.commit()
         conn.close()
 
-    # ─── RSS / News Scanning ───
-    def scan_rss_feeds(self, interest_area=None):
-        """Scan RSS feeds for new content in interest areas."""
-        if not HAS_FEEDPARSER:
-            return {"error": "feedparser not installed. Run: pip install feedparser"}
+    def _migrate_trends(self, c):
+        """Window columns and a (topic, area) key for bulk upserts."""
+        c.execute("PRAGMA table_info(trends)")
+        columns = {r[1] for r in c.fetchall()}
+        for name, ddl in (("mentions_1d", "INTEGER DEFAULT 0"),
+                          ("mentions_7d", "INTEGER DEFAULT 0"),
+                          ("acceleration", "REAL DEFAULT 0")):
+            if name not in columns:
+                c.execute(f"ALTER TABLE trends ADD COLUMN {name} {ddl}")
+        c.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_trends_topic_area'")
+        if c.fetchone() is None:
+            c.execute("""DELETE FROM trends WHERE id NOT IN
+                (SELECT MIN(id) FROM trends GROUP BY topic, interest_area)""")
+            c.execute("CREATE UNIQUE INDEX idx_trends_topic_area ON trends(topic, interest_area)")
+
+    def _backfill_trend_buckets(self, c):
+        """One-off: bucket the mentions of discoveries stored before buckets existed."""
+        counts = {}
+        c.execute("""SELECT interest_area, keywords_matched,
+            strftime('%Y-%m-%d %H:00', discovered_at) FROM discoveries""")
+        for area, keywords, hour in c.fetchall():
+            try:
+                keywords = json.loads(keywords) or []
+            except (json.JSONDecodeError, TypeError):
+                keywords = []
+            for kw in keywords:
+                key = (area, kw, hour)
+                counts[key] = counts.get(key, 0) + 1
+        c.executemany("""INSERT INTO trend_buckets (interest_area, keyword, hour, count)
+            VALUES (?, ?, ?, ?)""", [(*key, n) for key, n in counts.items()])
 
-        results = []
-        areas = [interest_area] if interest_area else self.interest_areas
+    # ─── Scan Jobs ───
+    # Each scanner turns interest areas into FetchJobs; _run_scan fetches
+    # them concurrently (per-host limits, conditional GETs), parses each
+    # response as it lands and stores all new discoveries in one transaction.
 
+    def _resolve_areas(self, interest_area=None):
+        areas = [interest_area] if interest_area else self.interest_areas
+        resolved = []
         for area in areas:
             if isinstance(area, str):
                 area = next((a for a in self.interest_areas if a['name'] == area), None)
                 if not area:
                     continue
-
-            for feed_url in area.get('rss_feeds', []):
+            resolved.append(area)
+        return resolved
+
+    def _rss_jobs(self, areas):
+        return [FetchJob(feed_url, context={'kind': 'rss', 'area': area, 'label': feed_url})
+                for area in areas for feed_url in area.get('rss_feeds', [])]
+
+    def _reddit_jobs(self, areas):
+        return [FetchJob(f"https://www.reddit.com/r/{subreddit}/hot.json?limit=15", timeout=10,
+                         context={'kind': 'reddit', 'area': area, 'label': f"r/{subreddit}"})
+                for area in areas for subreddit in area.get('subreddits', [])]
+
+    def _academic_jobs(self, areas):
+        year = datetime.now().year
+        return [FetchJob("https://api.semanticscholar.org/graph/v1/paper/search",
+                         params={'query': query, 'limit': 10,
+                                 'fields': 'title,abstract,authors,year,url,citationCount',
+                                 'year': f"{year - 1}-{year}"},
+                         context={'kind': 'academic', 'area': area, 'label': query})
+                for area in areas for query in area.get('scholar_queries', [])]
+
+    def _book_jobs(self, areas):
+        return [FetchJob("https://www.googleapis.com/books/v1/volumes", timeout=10,
+                         params={'q': keyword, 'orderBy': 'newest',
+                                 'maxResults': 5, 'langRestrict': 'en'},
+                         context={'kind': 'books', 'area': area, 'label': keyword})
+                for area in areas for keyword in area.get('keywords', [])[:3]]
+
+    # ─── Response Parsers ───
+    # Each returns discovery candidates (keyword arguments for the store).
+
+    def _parse_rss(self, area, label, body):
+        feed = feedparser.parse(body)
+        found = []
+        for entry in feed.entries[:10]:
+            title = entry.get('title', '')
+            link = entry.get('link', '')
+            summary = entry.get('summary', '')[:500]
+
+            # Check keyword relevance
+            text = f"{title} {summary}".lower()
+            matched = [k for k in area['keywords'] if k.lower() in text]
+            if matched:
+                found.append(dict(
+                    source='rss', source_url=link, title=title, summary=summary,
+                    author=entry.get('author', ''), interest_area=area['name'],
+                    keywords_matched=matched,
+                    content_hash=hashlib.md5(f"{title}{link}".encode()).hexdigest(),
+                ))
+        return found
+
+    def _parse_reddit(self, area, label, body):
+        found = []
+        for post in json.loads(body).get('data', {}).get('children', []):
+            pd = post.get('data', {})
+            title = pd.get('title', '')
+            selftext = pd.get('selftext', '')[:500]
+            permalink = f"https://reddit.com{pd.get('permalink', '')}"
+            score = pd.get('score', 0)
+
+            text = f"{title} {selftext}".lower()
+            matched = [k for k in area['keywords'] if k.lower() in text]
+            if matched and score > 5:
+                found.append(dict(
+                    source='reddit', source_url=permalink, title=title, summary=selftext,
+                    author=f"u/{pd.get('author', '')}", interest_area=area['name'],
+                    keywords_matched=matched, relevance_score=min(1.0, score / 100),
+                    content_hash=hashlib.md5(permalink.encode()).hexdigest(),
+                ))
+        return found
+
+    def _parse_academic(self, area, label, body):
+        found = []
+        for paper in json.loads(body).get('data', []) or []:
+            title = paper.get('title', '')
+            authors = ", ".join(a.get('name', '') for a in (paper.get('authors') or [])[:3])
+            found.append(dict(
+                source='academic', source_url=paper.get('url', ''), title=title,
+                summary=(paper.get('abstract') or '')[:500], author=authors,
+                interest_area=area['name'], keywords_matched=[label],
+                relevance_score=min(1.0, ((paper.get('citationCount') or 0) + 1) / 50),
+                content_hash=hashlib.md5(title.encode()).hexdigest(),
+            ))
+        return found
+
+    def _parse_books(self, area, label, body):
+        found = []
+        for item in json.loads(body).get('items', []):
+            info = item.get('volumeInfo', {})
+            title = info.get('title', '')
+            authors = ", ".join(info.get('authors', []))
+            found.append(dict(
+                source='books', source_url=info.get('infoLink', ''), title=f"📚 {title}",
+                summary=(info.get('description') or '')[:500], author=authors,
+                interest_area=area['name'], keywords_matched=[label],
+                content_hash=hashlib.md5(f"book:{title}:{authors}".encode()).hexdigest(),
+            ))
+        return found
+
+    # ─── Scan Pipeline ───
+    def _run_scan(self, jobs):
+        """Fetch, parse and store a batch of scan jobs. Returns new discoveries."""
+        parsers = {'rss': self._parse_rss, 'reddit': self._parse_reddit,
+                   'academic': self._parse_academic, 'books': self._parse_books}
+        seen = self._known_hashes()
+        candidates, logs, validators = [], [], []
+
+        for result in self._fetcher.fetch_all(jobs, self._feed_validators(jobs)):
+            job = result.job
+            kind, area, label = job.context['kind'], job.context['area'], job.context['label']
+            if result.error or not (result.ok or result.not_modified):
+                logs.append((kind, area['name'], label, 0, result.elapsed,
+                             result.error or f"HTTP {result.status}"))
+                continue
+            found = []
+            if result.ok:
                 try:
-                    start = time.time()
-                    feed = feedparser.parse(feed_url)
-                    for entry in feed.entries[:10]:
-                        title = entry.get('title', '')
-                        link = entry.get('link', '')
-                        summary = entry.get('summary', '')[:500]
-                        author = entry.get('author', '')
-
-                        # Check keyword relevance
-                        text = f"{title} {summary}".lower()
-                        matched = [k for k in area['keywords']
-                                   if k.lower() in text]
-
-                        if matched:
-                            content_hash = hashlib.md5(
-                                f"{title}{link}".encode()
-                            ).hexdigest()
-
-                            discovery = self._save_discovery(
-                                source='rss',
-                                source_url=link,
-                                title=title,
-                                summary=summary,
-                                author=author,
-                                interest_area=area['name'],
-                                keywords_matched=matched,
-                                content_hash=content_hash
-                            )
-                            if discovery:
-                                results.append(discovery)
-
-                    duration = time.time() - start
-                    self._log_scan('rss', area['name'], feed_url,
-                                   len(results), duration)
+                    found = parsers[kind](area, label, result.body)
                 except Exception as e:
-                    self._log_scan('rss', area['name'], feed_url,
-                                   0, 0, str(e))
+                    logs.append((kind, area['name'], label, 0, result.elapsed, str(e)))
+                    continue
+            # Keep validators only for a complete body that parsed (or a 304): once
+            # stored, every later scan gets a 304 until the feed itself changes
+            if (result.etag or result.last_modified) and not result.truncated:
+                validators.append((job.full_url, result.etag, result.last_modified))
+            fresh = [d for d in found if d['content_hash'] not in seen]
+            seen.update(d['content_hash'] for d in fresh)
+            candidates.extend(fresh)
+            logs.append((kind, area['name'], label, len(fresh), result.elapsed, None))
+
+        return self._store_scan(candidates, logs, validators)
+
+    def _known_hashes(self):
+        """content_hash of every stored discovery, loaded once per engine."""
+        with self._seen_lock:
+            if self._seen_hashes is None:
+                conn = self._db.connect()
+                self._seen_hashes = {r[0] for r in conn.execute(
+                    "SELECT content_hash FROM discoveries WHERE content_hash IS NOT NULL")}
+                conn.close()
+            return set(self._seen_hashes)
+
+    def _feed_validators(self, jobs):
+        urls = [job.full_url for job in jobs]
+        if not urls:
+            return {}
+        conn = self._db.connect()
+        rows = conn.execute(f"""SELECT url, etag, last_modified FROM feed_state
+            WHERE url IN ({",".join("?" * len(urls))})""", urls).fetchall()
+        conn.close()
+        return {url: {'etag': etag, 'last_modified': lm} for url, etag, lm in rows}
+
+    def _store_scan(self, candidates, logs, validators):
+        """Insert discoveries, trend buckets, scan log rows and feed validators in one transaction."""
+        results, mentions = [], []
+        with self._db.connect() as conn:
+            c = conn.cursor()
+            for d in candidates:
+                c.execute("""INSERT OR IGNORE INTO discoveries
+                    (source, source_url, title, summary, content, author,
+                     interest_area, keywords_matched, relevance_score, content_hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (d['source'], d['source_url'], d['title'], d['summary'],
+                     d.get('content'), d['author'], d['interest_area'],
+                     json.dumps(d['keywords_matched']), d.get('relevance_score', 0.5),
+                     d['content_hash']))
+                if c.rowcount > 0:
+                    results.append({'id': c.lastrowid, 'title': d['title'],
+                                    'source': d['source'], 'interest_area': d['interest_area']})
+                    mentions.extend((d['interest_area'], kw) for kw in d['keywords_matched'])
+            c.executemany("""INSERT INTO trend_buckets (interest_area, keyword, hour, count)
+                VALUES (?, ?, strftime('%Y-%m-%d %H:00', 'now'), 1)
+                ON CONFLICT(interest_area, keyword, hour) DO UPDATE SET count = count + 1""",
+                mentions)
+            c.executemany("""INSERT INTO scan_log
+                (scan_type, interest_area, source, items_found,
+                 status, duration_seconds, error_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                [(kind, area, label, n, 'error' if err else 'completed', dur, err)
+                 for kind, area, label, n, dur, err in logs])
+            c.executemany("""INSERT INTO feed_state (url, etag, last_modified, fetched_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(url) DO UPDATE SET etag = excluded.etag,
+                    last_modified = excluded.last_modified, fetched_at = excluded.fetched_at""",
+                validators)
+        with self._seen_lock:
+            if self._seen_hashes is not None:
+                self._seen_hashes.update(d['content_hash'] for d in candidates)
+        with self._trend_lock:
+            self._trend_dirty.update(mentions)
         return results
 
-    # ─── Reddit Scanning ───
+    # ─── Scanners ───
+    def scan_rss_feeds(self, interest_area=None):
+        """Scan RSS feeds for new content in interest areas."""
+        if not HAS_FEEDPARSER:
+            return {"error": "feedparser not installed. Run: pip install feedparser"}
+        return self._run_scan(self._rss_jobs(self._resolve_areas(interest_area)))
+
     def scan_reddit(self, interest_area=None):
         """Scan Reddit for trending discussions in interest areas."""
         if not HAS_REQUESTS:
             return {"error": "requests not installed. Run: pip install requests"}
+        return self._run_scan(self._reddit_jobs(self._resolve_areas(interest_area)))
 
-        results = []
-        areas = [interest_area] if interest_area else self.interest_areas
-
-        headers = {'User-Agent': 'ELAINE/1.0 (Almost Magic Tech Lab)'}
-
-        for area in areas:
-            if isinstance(area, str):
-                area = next((a for a in self.interest_areas if a['name'] == area), None)
-                if not area:
-                    continue
-
-            for subreddit in area.get('subreddits', []):
-                try:
-                    start = time.time()
-                    url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit=15"
-                    resp = requests.get(url, headers=headers, timeout=10)
-
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        posts = data.get('data', {}).get('children', [])
-
-                        for post in posts:
-                            pd = post.get('data', {})
-                            title = pd.get('title', '')
-                            selftext = pd.get('selftext', '')[:500]
-                            permalink = f"https://reddit.com{pd.get('permalink', '')}"
-                            author = pd.get('author', '')
-                            score = pd.get('score', 0)
-
-                            text = f"{title} {selftext}".lower()
-                            matched = [k for k in area['keywords']
-                                       if k.lower() in text]
-
-                            if matched and score > 5:
-                                content_hash = hashlib.md5(
-                                    permalink.encode()
-                                ).hexdigest()
-
-                                discovery = self._save_discovery(
-                                    source='reddit',
-                                    source_url=permalink,
-                                    title=title,
-                                    summary=selftext,
-                                    author=f"u/{author}",
-                                    interest_area=area['name'],
-                                    keywords_matched=matched,
-                                    relevance_score=min(1.0, score / 100),
-                                    content_hash=content_hash
-                                )
-                                if discovery:
-                                    results.append(discovery)
-
-                    duration = time.time() - start
-                    self._log_scan('reddit', area['name'],
-                                   f"r/{subreddit}", len(results), duration)
-                    time.sleep(2)  # Rate limiting
-                except Exception as e:
-                    self._log_scan('reddit', area['name'],
-                                   f"r/{subreddit}", 0, 0, str(e))
-        return results
-
-    # ─── Academic Paper Scanning ───
     def scan_academic(self, interest_area=None):
         """Scan Semantic Scholar for recent academic papers."""
         if not HAS_REQUESTS:
             return {"error": "requests not installed"}
+        return self._run_scan(self._academic_jobs(self._resolve_areas(interest_area)))
 
-        results = []
-        areas = [interest_area] if interest_area else self.interest_areas
-
-        for area in areas:
-            if isinstance(area, str):
-                area = next((a for a in self.interest_areas if a['name'] == area), None)
-                if not area:
-                    continue
-
-            for query in area.get('scholar_queries', []):
-                try:
-                    start = time.time()
-                    url = "https://api.semanticscholar.org/graph/v1/paper/search"
-                    params = {
-                        'query': query,
-                        'limit': 10,
-                        'fields': 'title,abstract,authors,year,url,citationCount',
-                        'year': f"{datetime.now().year - 1}-{datetime.now().year}"
-                    }
-                    resp = requests.get(url, params=params, timeout=15)
-
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        for paper in data.get('data', []):
-                            title = paper.get('title', '')
-                            abstract = (paper.get('abstract') or '')[:500]
-                            authors = ", ".join(
-                                a.get('name', '') for a in
-                                (paper.get('authors') or [])[:3]
-                            )
-                            paper_url = paper.get('url', '')
-
-                            content_hash = hashlib.md5(
-                                title.encode()
-                            ).hexdigest()
-
-                            discovery = self._save_discovery(
-                                source='academic',
-                                source_url=paper_url,
-                                title=title,
-                                summary=abstract,
-                                author=authors,
-                                interest_area=area['name'],
-                                keywords_matched=[query],
-                                relevance_score=min(1.0,
-                                    (paper.get('citationCount', 0) + 1) / 50
-                                ),
-                                content_hash=content_hash
-                            )
-                            if discovery:
-                                results.append(discovery)
-
-                    duration = time.time() - start
-                    self._log_scan('academic', area['name'], query,
-                                   len(results), duration)
-                    time.sleep(3)  # Rate limiting
-                except Exception as e:
-                    self._log_scan('academic', area['name'], query,
-                                   0, 0, str(e))
-        return results
-
-    # ─── Google Books Scanning ───
     def scan_books(self, interest_area=None):
         """Scan Google Books API for new publications in interest areas."""
         if not HAS_REQUESTS:
             return {"error": "requests not installed"}
-
-        results = []
-        areas = [interest_area] if interest_area else self.interest_areas
-
-        for area in areas:
-            if isinstance(area, str):
-                area = next((a for a in self.interest_areas if a['name'] == area), None)
-                if not area:
-                    continue
-
-            for keyword in area.get('keywords', [])[:3]:
-                try:
-                    start = time.time()
-                    url = "https://www.googleapis.com/books/v1/volumes"
-                    params = {
-                        'q': keyword,
-                        'orderBy': 'newest',
-                        'maxResults': 5,
-                        'langRestrict': 'en'
-                    }
-                    resp = requests.get(url, params=params, timeout=10)
-
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        for item in data.get('items', []):
-                            info = item.get('volumeInfo', {})
-                            title = info.get('title', '')
-                            authors = ", ".join(info.get('authors', []))
-                            desc = (info.get('description') or '')[:500]
-                            link = info.get('infoLink', '')
-
-                            content_hash = hashlib.md5(
-                                f"book:{title}:{authors}".encode()
-                            ).hexdigest()
-
-                            discovery = self._save_discovery(
-                                source='books',
-                                source_url=link,
-                                title=f"📚 {title}",
-                                summary=desc,
-                                author=authors,
-                                interest_area=area['name'],
-                                keywords_matched=[keyword],
-                                content_hash=content_hash
-                            )
-                            if discovery:
-                                results.append(discovery)
-
-                    duration = time.time() - start
-                    self._log_scan('books', area['name'], keyword,
-                                   len(results), duration)
-                    time.sleep(1)
-                except Exception as e:
-                    self._log_scan('books', area['name'], keyword,
-                                   0, 0, str(e))
-        return results
+        return self._run_scan(self._book_jobs(self._resolve_areas(interest_area)))
 
     # ─── Full Scan ───
     def run_full_scan(self):
-        """Run all scanners across all interest areas."""
-        results = {
-            'rss': self.scan_rss_feeds(),
-            'reddit': self.scan_reddit(),
-            'academic': self.scan_academic(),
-            'books': self.scan_books(),
-            'timestamp': datetime.now().isoformat()
-        }
-        total = sum(len(v) for v in results.values() if isinstance(v, list))
+        """Run all scanners across all interest areas in one concurrent pass."""
+        areas = self._resolve_areas()
+        results = {}
+        jobs = []
+        if HAS_FEEDPARSER:
+            jobs += self._rss_jobs(areas)
+        else:
+            results['rss'] = {"error": "feedparser not installed. Run: pip install feedparser"}
+        if HAS_REQUESTS:
+            jobs += self._reddit_jobs(areas) + self._academic_jobs(areas) + self._book_jobs(areas)
+        else:
+            for kind in ('reddit', 'academic', 'books'):
+                results[kind] = {"error": "requests not installed"}
+
+        discoveries = self._run_scan(jobs)
+        for kind in ('rss', 'reddit', 'academic', 'books'):
+            results.setdefault(kind, [d for d in discoveries if d['source'] == kind])
+        results['timestamp'] = datetime.now().isoformat()
+        total = len(discoveries)
         results['total_new'] = total
 
         # After scanning, generate content opportunities
@@ -529,7 +581,7 @@ class TheCurrentEngine:
     # ─── Content Opportunity Generator ───
     def generate_content_opportunities(self, limit=20):
         """Analyse recent discoveries and suggest content formats."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
 
@@ -639,62 +691,78 @@ class TheCurrentEngine:
 
     # ─── Trend Detection ───
     def detect_trends(self):
-        """Analyse discoveries for emerging trends."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        c = conn.cursor()
-
-        # Get recent discoveries (last 7 days)
-        week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-        c.execute("""SELECT interest_area, keywords_matched, title
-            FROM discoveries WHERE discovered_at >= ?""", (week_ago,))
-        rows = c.fetchall()
-
-        # Count keyword frequencies
-        keyword_counts = {}
-        for row in rows:
-            area = row['interest_area']
-            try:
-                keywords = json.loads(row['keywords_matched'])
-            except (json.JSONDecodeError, TypeError):
-                keywords = []
-
-            for kw in keywords:
-                key = f"{area}::{kw}"
-                keyword_counts[key] = keyword_counts.get(key, 0) + 1
-
-        # Update or create trends
-        for key, count in keyword_counts.items():
-            if count >= 3:  # Threshold for trend
-                area, topic = key.split("::", 1)
-                c.execute("""SELECT id, mention_count FROM trends
-                    WHERE topic = ? AND interest_area = ?""", (topic, area))
-                existing = c.fetchone()
-
-                if existing:
-                    new_count = existing['mention_count'] + count
-                    velocity = count / 7  # mentions per day
-                    c.execute("""UPDATE trends
-                        SET mention_count = ?, velocity = ?,
-                            last_seen = ?, status = ?
-                        WHERE id = ?""",
-                        (new_count, velocity,
-                         datetime.now().isoformat(),
-                         'accelerating' if velocity > 1 else 'steady',
-                         existing['id']))
+        """
+        Refresh trend rows from the rolling mention buckets.
+
+        Only (area, keyword) pairs with new mentions are recomputed, plus a
+        full pass over the 30-day window once per hour as windows slide.
+        Never rescans discoveries. Per pair:
+          mention_count — mentions in 30 days; mentions_1d / mentions_7d
+          velocity      — mentions per day over 7 days
+          acceleration  — 7-day daily rate minus the 30-day daily rate
+        """
+        hour = datetime.utcnow().strftime('%Y-%m-%d %H:00')
+        with self._trend_lock:
+            dirty, self._trend_dirty = self._trend_dirty, set()
+            full = hour != self._trend_hour
+            self._trend_hour = hour
+        if not full and not dirty:
+            return {'updated': 0, 'full': False}
+
+        cutoffs = [f"-{hours - 1} hours" for hours in TREND_WINDOWS_HOURS.values()]
+        query = """SELECT interest_area, keyword,
+                SUM(CASE WHEN hour >= strftime('%Y-%m-%d %H:00', 'now', ?) THEN count ELSE 0 END),
+                SUM(CASE WHEN hour >= strftime('%Y-%m-%d %H:00', 'now', ?) THEN count ELSE 0 END),
+                SUM(count)
+            FROM trend_buckets WHERE hour >= strftime('%Y-%m-%d %H:00', 'now', ?)"""
+        params = list(cutoffs)
+        if not full:
+            query += f""" AND (interest_area, keyword) IN (VALUES {",".join(["(?, ?)"] * len(dirty))})"""
+            params += [v for key in dirty for v in key]
+        query += " GROUP BY interest_area, keyword"
+
+        now = datetime.now().isoformat()
+        upserts, fading = [], []
+        with self._db.connect() as conn:
+            c = conn.cursor()
+            c.execute(query, params)
+            for area, topic, day, week, month in c.fetchall():
+                velocity = week / 7
+                acceleration = round(velocity - month / 30, 4)
+                if week >= TREND_THRESHOLD:
+                    status = 'accelerating' if velocity > 1 else 'steady'
+                    upserts.append((topic, area, month, day, week, velocity, acceleration, now, status))
                 else:
-                    c.execute("""INSERT INTO trends
-                        (topic, interest_area, mention_count, velocity, status)
-                        VALUES (?, ?, ?, ?, ?)""",
-                        (topic, area, count, count / 7, 'emerging'))
-
-        conn.commit()
-        conn.close()
+                    fading.append((month, day, week, velocity, acceleration, topic, area))
+
+            c.executemany("""INSERT INTO trends
+                (topic, interest_area, mention_count, mentions_1d, mentions_7d,
+                 velocity, acceleration, last_seen, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'emerging')
+                ON CONFLICT(topic, interest_area) DO UPDATE SET
+                    mention_count = excluded.mention_count,
+                    mentions_1d = excluded.mentions_1d,
+                    mentions_7d = excluded.mentions_7d,
+                    velocity = excluded.velocity,
+                    acceleration = excluded.acceleration,
+                    last_seen = excluded.last_seen,
+                    status = ?""", upserts)
+            c.executemany("""UPDATE trends SET mention_count = ?, mentions_1d = ?,
+                    mentions_7d = ?, velocity = ?, acceleration = ?, status = 'fading'
+                WHERE topic = ? AND interest_area = ?""", fading)
+            if full:
+                # Pairs with no mentions left in the 30-day window
+                c.execute("""UPDATE trends SET mention_count = 0, mentions_1d = 0,
+                        mentions_7d = 0, velocity = 0, acceleration = 0, status = 'fading'
+                    WHERE status != 'fading' AND (interest_area, topic) NOT IN (
+                        SELECT interest_area, keyword FROM trend_buckets
+                        WHERE hour >= strftime('%Y-%m-%d %H:00', 'now', ?))""", (cutoffs[-1],))
+        return {'updated': len(upserts) + len(fading), 'full': full}
 
     # ─── Competitor Tracking ───
     def add_competitor(self, name, website=None, linkedin_url=None,
                        services=None, region='AU'):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("""INSERT INTO competitors
             (name, website, linkedin_url, services, region)
@@ -707,7 +775,7 @@ class TheCurrentEngine:
         return comp_id
 
     def get_competitors(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         c.execute("SELECT * FROM competitors ORDER BY name")
@@ -715,50 +783,10 @@ class TheCurrentEngine:
         conn.close()
         return [dict(r) for r in rows]
 
-    # ─── Persistence Helpers ───
-    def _save_discovery(self, source, source_url, title, summary,
-                        author, interest_area, keywords_matched,
-                        content_hash, relevance_score=0.5, content=None):
-        try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            c.execute("""INSERT OR IGNORE INTO discoveries
-                (source, source_url, title, summary, content, author,
-                 interest_area, keywords_matched, relevance_score, content_hash)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (source, source_url, title, summary, content, author,
-                 interest_area, json.dumps(keywords_matched),
-                 relevance_score, content_hash))
-            disc_id = c.lastrowid if c.rowcount > 0 else None
-            conn.commit()
-            conn.close()
-            if disc_id:
-                return {'id': disc_id, 'title': title, 'source': source,
-                        'interest_area': interest_area}
-        except Exception:
-            pass
-        return None
-
-    def _log_scan(self, scan_type, interest_area, source,
-                  items_found, duration, error=None):
-        try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            c.execute("""INSERT INTO scan_log
-                (scan_type, interest_area, source, items_found,
-                 status, duration_seconds, error_message)
-                VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (scan_type, interest_area, source, items_found,
-                 'error' if error else 'completed', duration, error))
-            conn.commit()
-            conn.close()
-        except Exception:
-            pass
-
     # ─── Query Methods ───
     def get_discoveries(self, interest_area=None, source=None,
                         unread_only=False, starred_only=False, limit=50):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         where = ["archived = 0"]
@@ -784,7 +812,7 @@ class TheCurrentEngine:
 
     def get_content_opportunities(self, format_type=None,
                                   status='idea', limit=30):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         where = []
@@ -808,7 +836,7 @@ class TheCurrentEngine:
         return [dict(r) for r in rows]
 
     def get_trends(self, status=None, limit=20):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         if status:
@@ -825,7 +853,7 @@ class TheCurrentEngine:
         """Generate the morning briefing data."""
         yesterday = (datetime.now() - timedelta(days=1)).isoformat()
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
 
@@ -875,7 +903,7 @@ class TheCurrentEngine:
 
     def get_dashboard_data(self):
         """Get summary data for UI dashboard."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
 
         c.execute("SELECT COUNT(*) FROM discoveries WHERE read = 0")
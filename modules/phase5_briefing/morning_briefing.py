@@ -4,6 +4,12 @@ Aggregates emails, LinkedIn, news, deadlines, meetings, prep questions,
 and People of Interest tracking into a unified morning briefing.
 
 "Good morning, Mani. Here's what needs your attention."
+
+Sections are generated concurrently, each with its own time budget: a
+slow feed or mail server leaves its section marked "timeout" and the rest
+of the briefing still arrives. Email sync is incremental — one batched
+UID FETCH of headers plus the first 2 KB of text for mail not seen
+before, cached per folder so the briefing reads from SQLite.
 """
 
 import json
@@ -12,6 +18,8 @@ import imaplib
 import email
 import re
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as SectionTimeout
 from datetime import datetime, timedelta
 from pathlib import Path
 from email.header import decode_header
@@ -28,6 +36,17 @@ try:
 except ImportError:
     HAS_FEEDPARSER = False
 
+from modules.phase4_current.feed_fetcher import FeedFetcher, FetchJob
+from modules.sqlite_pool import get_pool
+
+SECTION_TIMEOUT_S = 6.0             # Per-section budget, from the start of the briefing
+SECTION_TIMEOUTS = {"emails": 12.0, "linkedin": 8.0, "news": 8.0}
+FEED_TIMEOUT_S = 6.0
+IMAP_TIMEOUT_S = 10.0
+IMAP_BATCH = 50                     # Newest unseen messages fetched per folder per sync
+SNIPPET_BYTES = 2048                # Partial body fetched for the snippet
+HEADER_FIELDS = "FROM SUBJECT DATE MESSAGE-ID CONTENT-TYPE CONTENT-TRANSFER-ENCODING"
+
 
 class MorningBriefingEngine:
     """
@@ -36,11 +55,13 @@ class MorningBriefingEngine:
     Tracks People of Interest and learns who matters over time.
     """
 
-    def __init__(self, config_path=None):
+    def __init__(self, config_path=None, db_path=None):
         self.home = Path.home() / ".elaine"
         self.home.mkdir(exist_ok=True)
         self.config_path = config_path or str(self.home / "briefing_config.json")
-        self.db_path = str(self.home / "briefing.db")
+        self.db_path = db_path or str(self.home / "briefing.db")
+        self._db = get_pool(self.db_path)
+        self._fetcher = None
         self.config = self._load_config()
         self._init_db()
 
@@ -50,6 +71,7 @@ class MorningBriefingEngine:
                 "enabled": False,
                 "imap_server": "",
                 "imap_port": 993,
+                "use_ssl": True,
                 "username": "",
                 "password": "",
                 "folders": ["INBOX"],
@@ -124,7 +146,7 @@ class MorningBriefingEngine:
             json.dump(self.config, f, indent=2)
 
     def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("""CREATE TABLE IF NOT EXISTS briefings (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -144,6 +166,14 @@ class MorningBriefingEngine:
             is_read INTEGER DEFAULT 0,
             cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )""")
+        self._migrate_email_cache(c)
+        # Last UID seen per folder; a new UIDVALIDITY means start over
+        c.execute("""CREATE TABLE IF NOT EXISTS email_sync (
+            folder TEXT PRIMARY KEY,
+            uidvalidity INTEGER,
+            last_uid INTEGER DEFAULT 0,
+            synced_at TIMESTAMP
+        )""")
         # People of Interest — Elaine learns who matters
         c.execute("""CREATE TABLE IF NOT EXISTS people_of_interest (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -188,6 +218,15 @@ class MorningBriefingEngine:
         conn.commit()
         conn.close()
 
+    def _migrate_email_cache(self, c):
+        c.execute("PRAGMA table_info(email_cache)")
+        have = {r[1] for r in c.fetchall()}
+        for col, decl in (("sender_email", "TEXT"), ("folder", "TEXT"),
+                          ("uid", "INTEGER"), ("received_ts", "REAL")):
+            if col not in have:
+                c.execute(f"ALTER TABLE email_cache ADD COLUMN {col} {decl}")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_email_cache_received ON email_cache(received_ts)")
+
     # ═══════════════════════════════════════════
     #  PEOPLE OF INTEREST
     # ═══════════════════════════════════════════
@@ -197,7 +236,7 @@ class MorningBriefingEngine:
                                 website=None, email_addr=None,
                                 why_important=None, category='general',
                                 interest_level=5):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         search_queries = self._build_poi_search_queries(name, company, role)
         c.execute("""INSERT INTO people_of_interest
@@ -213,7 +252,7 @@ class MorningBriefingEngine:
         return pid
 
     def get_people_of_interest(self, category=None, min_level=0):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         if category:
@@ -229,7 +268,7 @@ class MorningBriefingEngine:
         return rows
 
     def update_person(self, person_id, **kwargs):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         allowed = ['name', 'role', 'company', 'linkedin_url', 'twitter_handle',
                     'website', 'email', 'why_important', 'category',
@@ -244,7 +283,7 @@ class MorningBriefingEngine:
         conn.close()
 
     def remove_person(self, person_id):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("DELETE FROM poi_activity WHERE person_id = ?", (person_id,))
         c.execute("DELETE FROM poi_interactions WHERE person_id = ?", (person_id,))
@@ -253,7 +292,7 @@ class MorningBriefingEngine:
         conn.close()
 
     def log_poi_interaction(self, person_id, interaction_type, notes=None):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("""INSERT INTO poi_interactions
             (person_id, interaction_type, notes) VALUES (?, ?, ?)""",
@@ -277,7 +316,7 @@ class MorningBriefingEngine:
             clients = biz.get_all_clients()
         except Exception:
             return []
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         discovered = []
         for client in clients:
@@ -309,11 +348,11 @@ class MorningBriefingEngine:
             chron = ChronicleEngine()
         except Exception:
             return []
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         discovered = []
         try:
-            chron_conn = sqlite3.connect(chron.db_path)
+            chron_conn = get_pool(chron.db_path).connect()
             chron_conn.row_factory = sqlite3.Row
             cc = chron_conn.cursor()
             cc.execute("SELECT * FROM meetings WHERE created_at >= ?",
@@ -345,7 +384,7 @@ class MorningBriefingEngine:
         return discovered
 
     def discover_people_from_emails(self, emails_data):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         discovered = []
         for em in emails_data:
@@ -394,7 +433,7 @@ class MorningBriefingEngine:
     def scan_poi_activity(self, max_people=10):
         if not HAS_REQUESTS or not HAS_FEEDPARSER:
             return {"error": "feedparser/requests not installed"}
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         c.execute("""SELECT * FROM people_of_interest WHERE interest_level >= 3
@@ -444,7 +483,7 @@ class MorningBriefingEngine:
         return {"scanned": len(people), "with_activity": len(results), "results": results}
 
     def get_poi_recent_activity(self, hours=24, min_interest=3):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         since = (datetime.now() - timedelta(hours=hours)).isoformat()
@@ -459,7 +498,7 @@ class MorningBriefingEngine:
         return rows
 
     def get_poi_stats(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("SELECT COUNT(*) FROM people_of_interest")
         total = c.fetchone()[0]
@@ -493,34 +532,29 @@ class MorningBriefingEngine:
             "health": {}
         }
 
-        meetings = self._get_meetings()
-        briefing["sections"]["meetings"] = meetings
-        briefing["health"]["calendar"] = "ok" if meetings.get("items") else "no_meetings"
-
-        emails = self._get_important_emails()
-        briefing["sections"]["emails"] = emails
-        briefing["health"]["email"] = emails.get("source", "disabled")
-
-        prep = self._generate_prep_questions(meetings.get("items", []))
-        briefing["sections"]["prep_questions"] = prep
-
-        poi = self._get_poi_briefing()
-        briefing["sections"]["people"] = poi
-        briefing["health"]["people"] = "ok" if poi.get("items") else "no_activity"
-
-        linkedin = self._get_linkedin_relevant()
-        briefing["sections"]["linkedin"] = linkedin
-        briefing["health"]["linkedin"] = "ok" if linkedin.get("items") else "no_data"
-
-        news = self._get_relevant_news()
-        briefing["sections"]["news"] = news
-        briefing["health"]["news"] = "ok" if news.get("items") else "no_data"
-
-        deadlines = self._get_deadlines()
-        briefing["sections"]["deadlines"] = deadlines
-
-        actions = self._get_pending_actions()
-        briefing["sections"]["action_items"] = actions
+        sections = self._run_sections(
+            ("meetings", "Today's Meetings", self._get_meetings),
+            ("emails", "Important Emails", self._get_important_emails),
+            ("prep_questions", "Preparation Questions", None),
+            ("people", "People of Interest", self._get_poi_briefing),
+            ("linkedin", "LinkedIn & Industry", self._get_linkedin_relevant),
+            ("news", "News & Intelligence", self._get_relevant_news),
+            ("deadlines", "Deadlines & Due Dates", self._get_deadlines),
+            ("action_items", "Pending Action Items", self._get_pending_actions),
+        )
+        briefing["sections"] = sections
+        meetings, emails = sections["meetings"], sections["emails"]
+        health = briefing["health"]
+        health["calendar"] = "ok" if meetings.get("items") else "no_meetings"
+        health["email"] = emails.get("source", "disabled")
+        health["people"] = "ok" if sections["people"].get("items") else "no_activity"
+        health["linkedin"] = "ok" if sections["linkedin"].get("items") else "no_data"
+        health["news"] = "ok" if sections["news"].get("items") else "no_data"
+        briefing["timed_out"] = [k for k, v in sections.items() if v.get("status") == "timeout"]
+        for key, area in (("meetings", "calendar"), ("emails", "email"), ("people", "people"),
+                          ("linkedin", "linkedin"), ("news", "news")):
+            if sections[key].get("status") in ("timeout", "error"):
+                health[area] = sections[key]["status"]
 
         total = sum(len(s.get("items", [])) for s in briefing["sections"].values())
         briefing["total_items"] = total
@@ -530,6 +564,62 @@ class MorningBriefingEngine:
         self._store_briefing(briefing)
         return briefing
 
+    def _run_sections(self, *specs):
+        """
+        Run every section generator at once. Each section gets its own
+        deadline measured from the start; a section that misses it, or
+        raises, becomes an empty placeholder with status "timeout"/"error"
+        and the briefing goes out with whatever else is ready. Prep
+        questions wait on the meetings section rather than re-fetching it.
+        """
+        start = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=len(specs), thread_name_prefix="briefing")
+        futures = {}
+        for key, _, fn in specs:
+            if fn is None:  # prep_questions
+                meetings = futures["meetings"]
+                fn = lambda: self._generate_prep_questions(meetings.result().get("items", []))
+            futures[key] = pool.submit(self._timed, fn)
+        sections = {}
+        try:
+            for key, title, _ in specs:
+                budget = SECTION_TIMEOUTS.get(key, SECTION_TIMEOUT_S)
+                try:
+                    section, elapsed = futures[key].result(
+                        timeout=max(0.0, start + budget - time.monotonic()))
+                    section["elapsed_ms"] = elapsed
+                except SectionTimeout:
+                    section = {"title": title, "items": [], "status": "timeout",
+                               "message": f"Still loading after {budget:.0f}s — skipped this time."}
+                except Exception as e:
+                    section = {"title": title, "items": [], "status": "error", "error": str(e)}
+                sections[key] = section
+        finally:
+            # Stragglers finish in the background; their results are dropped
+            pool.shutdown(wait=False, cancel_futures=True)
+        return sections
+
+    @staticmethod
+    def _timed(fn):
+        t0 = time.monotonic()
+        result = fn()
+        return result, round((time.monotonic() - t0) * 1000)
+
+    def _parse_feeds(self, urls):
+        """Fetch RSS feeds concurrently; parsed feeds come back in config order."""
+        if self._fetcher is None:
+            self._fetcher = FeedFetcher()
+        jobs = [FetchJob(url, timeout=FEED_TIMEOUT_S, context={"order": i})
+                for i, url in enumerate(urls)]
+        parsed = {}
+        for res in self._fetcher.fetch_all(jobs):
+            if res.ok:
+                try:
+                    parsed[res.job.context["order"]] = feedparser.parse(res.body)
+                except Exception:
+                    continue
+        return [parsed[i] for i in sorted(parsed)]
+
     # ═══════════════════════════════════════════
     #  SECTION GENERATORS
     # ═══════════════════════════════════════════
@@ -610,75 +700,160 @@ class MorningBriefingEngine:
 
     def _get_important_emails(self):
         result = {"title": "Important Emails", "items": [], "source": "disabled"}
-        if not self.config["email"]["enabled"]:
+        cfg = self.config["email"]
+        if not cfg["enabled"]:
             result["message"] = "Email not configured. Go to Settings to connect."
             return result
         try:
-            srv = self.config["email"]["imap_server"]
-            usr = self.config["email"]["username"]
-            pwd = self.config["email"]["password"]
-            if not all([srv, usr, pwd]):
+            if not all([cfg["imap_server"], cfg["username"], cfg["password"]]):
                 result["source"] = "not_configured"
                 result["message"] = "Email credentials incomplete."
                 return result
-            mail = imaplib.IMAP4_SSL(srv, self.config["email"]["imap_port"])
-            mail.login(usr, pwd)
-            hours = self.config["email"]["hours_lookback"]
-            since = (datetime.now() - timedelta(hours=hours)).strftime("%d-%b-%Y")
-            pri_senders = [s.lower() for s in self.config["email"].get("priority_senders", [])]
-            pri_kw = [k.lower() for k in self.config["email"].get("priority_keywords", [])]
-            poi_emails = self._get_poi_emails()
-            pri_senders.extend(poi_emails)
-            for folder in self.config["email"]["folders"]:
-                try:
-                    mail.select(folder)
-                    _, msgs = mail.search(None, f'(SINCE "{since}")')
-                    for mid in msgs[0].split()[-50:]:
-                        _, data = mail.fetch(mid, "(RFC822)")
-                        msg = email.message_from_bytes(data[0][1])
-                        sender_raw = msg.get("From", "")
-                        sender = self._decode_hdr(sender_raw)
-                        sender_email = self._extract_email(sender_raw)
-                        subject = self._decode_hdr(msg.get("Subject", "(no subject)"))
-                        snippet = self._get_snippet(msg)
-                        recv = self._parse_email_date(msg.get("Date", ""))
-                        score = self._score_priority(sender_email, subject, snippet, pri_senders, pri_kw)
-                        self._cache_email(sender, sender_email, subject, snippet, recv)
-                        result["items"].append({
-                            "sender": sender, "sender_email": sender_email,
-                            "subject": subject, "snippet": snippet[:200],
-                            "received_at": recv, "priority_score": score,
-                            "is_poi": sender_email.lower() in [e.lower() for e in poi_emails]
-                        })
-                except Exception:
-                    continue
-            mail.logout()
+            since = datetime.now() - timedelta(hours=cfg["hours_lookback"])
+            mail = self._imap_connect()
+            try:
+                mail.login(cfg["username"], cfg["password"])
+                result["fetched"] = self.sync_emails(mail, since)
+            finally:
+                try: mail.logout()
+                except Exception: pass
             result["source"] = "imap"
-            result["items"].sort(key=lambda x: x.get("priority_score", 0), reverse=True)
-            result["items"] = result["items"][:self.config["email"]["max_emails"]]
         except Exception as e:
+            # Keep serving what's already cached
             result["source"] = "error"
             result["message"] = str(e)
+        pri_senders = [s.lower() for s in cfg.get("priority_senders", [])]
+        pri_kw = [k.lower() for k in cfg.get("priority_keywords", [])]
+        poi_emails = {e.lower() for e in self._get_poi_emails()}
+        pri_senders.extend(poi_emails)
+        for em in self._cached_emails(since):
+            score = self._score_priority(em["sender_email"], em["subject"], em["snippet"],
+                                         pri_senders, pri_kw)
+            result["items"].append({
+                "sender": em["sender"], "sender_email": em["sender_email"],
+                "subject": em["subject"], "snippet": em["snippet"][:200],
+                "received_at": em["received_at"], "priority_score": score,
+                "is_poi": em["sender_email"] in poi_emails
+            })
+        result["items"].sort(key=lambda x: x.get("priority_score", 0), reverse=True)
+        result["items"] = result["items"][:cfg["max_emails"]]
         return result
 
+    def _imap_connect(self):
+        cfg = self.config["email"]
+        cls = imaplib.IMAP4_SSL if cfg.get("use_ssl", True) else imaplib.IMAP4
+        return cls(cfg["imap_server"], cfg["imap_port"], timeout=IMAP_TIMEOUT_S)
+
+    def sync_emails(self, mail, since):
+        """
+        Pull mail not seen before into email_cache. Per folder: UID SEARCH
+        above the last synced UID, then one UID FETCH of headers plus a
+        BODY.PEEK[TEXT]<0.2048> partial (PEEK leaves messages unread).
+        Returns the number of messages downloaded.
+        """
+        conn = self._db.connect()
+        c = conn.cursor()
+        c.execute("SELECT folder, uidvalidity, last_uid FROM email_sync")
+        state = {r[0]: (r[1], r[2]) for r in c.fetchall()}
+        conn.close()
+        since_imap = since.strftime("%d-%b-%Y")
+        rows, sync_rows = [], []
+        for folder in self.config["email"]["folders"]:
+            try:
+                typ, _ = mail.select(folder, readonly=True)
+                if typ != "OK":
+                    continue
+                validity = self._uidvalidity(mail)
+                known_validity, last_uid = state.get(folder, (None, 0))
+                if validity != known_validity:
+                    last_uid = 0
+                typ, data = mail.uid("SEARCH", None, f'UID {last_uid + 1}:* SINCE "{since_imap}"')
+                uids = sorted(u for u in (int(x) for x in (data[0] or b"").split()) if u > last_uid)
+                uids = uids[-IMAP_BATCH:]
+                if uids:
+                    typ, data = mail.uid("FETCH", ",".join(map(str, uids)),
+                        f"(UID BODY.PEEK[HEADER.FIELDS ({HEADER_FIELDS})] "
+                        f"BODY.PEEK[TEXT]<0.{SNIPPET_BYTES}>)")
+                    for uid, header, text in self._split_fetch(data):
+                        rows.append(self._email_row(folder, uid, header, text))
+                    last_uid = uids[-1]
+                sync_rows.append((folder, validity, last_uid, datetime.now().isoformat()))
+            except Exception:
+                continue
+        with self._db.transaction() as c:
+            c.executemany("""INSERT OR IGNORE INTO email_cache
+                (message_id, sender, sender_email, subject, snippet, received_at,
+                 received_ts, folder, uid) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""", rows)
+            c.executemany("""INSERT INTO email_sync (folder, uidvalidity, last_uid, synced_at)
+                VALUES (?, ?, ?, ?) ON CONFLICT(folder) DO UPDATE SET
+                uidvalidity = excluded.uidvalidity, last_uid = excluded.last_uid,
+                synced_at = excluded.synced_at""", sync_rows)
+        return len(rows)
+
+    def _uidvalidity(self, mail):
+        _, data = mail.response("UIDVALIDITY")
+        try: return int(data[0])
+        except (TypeError, ValueError, IndexError): return None
+
+    def _split_fetch(self, data):
+        """Group a UID FETCH response into (uid, header bytes, text bytes) per message."""
+        messages, cur = [], None
+        for part in data or []:
+            desc, payload = (part[0], part[1]) if isinstance(part, tuple) else (part, None)
+            if not isinstance(desc, bytes):
+                continue
+            if re.match(rb"\d+ \(", desc):
+                cur = {"uid": None, "header": b"", "text": b""}
+                messages.append(cur)
+            if cur is None:
+                continue
+            m = re.search(rb"UID (\d+)", desc)
+            if m:
+                cur["uid"] = int(m.group(1))
+            if payload is not None:
+                cur["header" if b"HEADER" in desc.upper() else "text"] = payload
+        return [(m["uid"], m["header"], m["text"]) for m in messages if m["uid"] is not None]
+
+    def _email_row(self, folder, uid, header, text):
+        msg = email.message_from_bytes(header.rstrip(b"\r\n") + b"\r\n\r\n" + text)
+        sender_raw = msg.get("From", "")
+        sender = self._decode_hdr(sender_raw)
+        sender_email = self._extract_email(sender_raw)
+        subject = self._decode_hdr(msg.get("Subject", "(no subject)"))
+        snippet = self._get_snippet(msg)
+        recv = self._parse_email_date(msg.get("Date", ""))
+        try: recv_ts = datetime.fromisoformat(recv).timestamp()
+        except (TypeError, ValueError): recv_ts = time.time()
+        message_id = (msg.get("Message-ID") or "").strip() or f"{sender_email}:{subject}:{recv}"
+        return (message_id, sender, sender_email, subject,
+                snippet[:300], recv, recv_ts, folder, uid)
+
+    def _cached_emails(self, since):
+        conn = self._db.connect()
+        conn.row_factory = sqlite3.Row
+        c = conn.cursor()
+        c.execute("""SELECT sender, sender_email, subject, snippet, received_at
+            FROM email_cache WHERE received_ts >= ? ORDER BY received_ts DESC""",
+            (since.timestamp(),))
+        rows = []
+        for r in c.fetchall():
+            em = dict(r)
+            em["sender"] = em["sender"] or ""
+            em["sender_email"] = (em["sender_email"] or "").lower()
+            em["subject"] = em["subject"] or ""
+            em["snippet"] = em["snippet"] or ""
+            rows.append(em)
+        conn.close()
+        return rows
+
     def _get_poi_emails(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("SELECT email FROM people_of_interest WHERE email IS NOT NULL AND email != ''")
         emails = [r[0] for r in c.fetchall()]
         conn.close()
         return emails
 
-    def _cache_email(self, sender, sender_email, subject, snippet, recv):
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        try:
-            c.execute("INSERT OR IGNORE INTO email_cache (message_id, sender, subject, snippet, received_at) VALUES (?, ?, ?, ?, ?)",
-                (f"{sender_email}:{subject}:{recv}", f"{sender} <{sender_email}>", subject, snippet[:200], recv))
-            conn.commit()
-        except Exception: pass
-        conn.close()
-
     def _decode_hdr(self, h):
         if not h: return ""
         parts = decode_header(h)
@@ -793,7 +968,7 @@ class MorningBriefingEngine:
         return result
 
     def _match_poi(self, attendees):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         matched = []
@@ -830,7 +1005,7 @@ class MorningBriefingEngine:
             return result
         kws = [k.lower() for k in self.config["linkedin"]["keywords"]]
         poi_names = []
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("SELECT name, company FROM people_of_interest WHERE interest_level >= 5")
         for r in c.fetchall():
@@ -838,9 +1013,8 @@ class MorningBriefingEngine:
             if r[1]: poi_names.append(r[1].lower())
         conn.close()
         seen = set()
-        for url in self.config["linkedin"]["rss_feeds"]:
+        for feed in self._parse_feeds(self.config["linkedin"]["rss_feeds"]):
             try:
-                feed = feedparser.parse(url)
                 for e in feed.entries[:5]:
                     link = e.get("link", "")
                     if link in seen: continue
@@ -886,9 +1060,8 @@ class MorningBriefingEngine:
                         "from_current": True
                     })
         except Exception: pass
-        for url in self.config["news"]["feeds"]:
+        for feed in self._parse_feeds(self.config["news"]["feeds"]):
             try:
-                feed = feedparser.parse(url)
                 for e in feed.entries[:4]:
                     link = e.get("link", "")
                     if link in seen: continue
@@ -932,7 +1105,7 @@ class MorningBriefingEngine:
                             result["items"].append({"title": f"Project: {proj.get('name', '')}",
                                 "due": dl, "urgency": urg, "type": "project"})
                     except Exception: pass
-            conn = sqlite3.connect(biz.db_path)
+            conn = get_pool(biz.db_path).connect()
             conn.row_factory = sqlite3.Row
             c = conn.cursor()
             c.execute("SELECT name, company, next_followup FROM clients WHERE next_followup IS NOT NULL AND next_followup <= ?",
@@ -998,7 +1171,7 @@ class MorningBriefingEngine:
         return " \u00b7 ".join(parts) if parts else "Clear schedule. Good time for deep work."
 
     def _store_briefing(self, briefing):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("INSERT INTO briefings (briefing_data, sections_count, total_items) VALUES (?, ?, ?)",
             (json.dumps(briefing, default=str), len(briefing.get("sections", {})), briefing.get("total_items", 0)))
@@ -1006,7 +1179,7 @@ class MorningBriefingEngine:
         conn.close()
 
     def get_briefing_history(self, limit=10):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         c.execute("SELECT id, generated_at, sections_count, total_items FROM briefings ORDER BY generated_at DESC LIMIT ?", (limit,))
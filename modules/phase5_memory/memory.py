@@ -2,13 +2,59 @@
 ELAINE Phase 5: Memory & Conversation Continuity
 Persistent chat history, user preferences, and session state.
 Elaine remembers across restarts.
+
+Conversation and command search run on SQLite FTS5 indexes kept in step by
+triggers: BM25 ranking, highlighted snippets, "phrase" and prefix* queries.
+Falls back to LIKE scans if the SQLite build lacks FTS5.
 """
 
 import json
+import re
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from modules.sqlite_pool import get_pool
+
+_QUERY_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+SNIPPET_OPEN = "<mark>"
+SNIPPET_CLOSE = "</mark>"
+
+
+def _has_fts5() -> bool:
+    try:
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        conn.close()
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+HAS_FTS5 = _has_fts5()
+
+
+def fts_query(text: str, prefix_last: bool = False) -> str:
+    """
+    Turn user input into a safe FTS5 MATCH expression.
+    "quoted phrases" stay phrases, word* is a prefix query, other words are
+    ANDed. Every term is quoted, so FTS5 operators in the input are literal.
+    """
+    terms = []
+    for phrase, word in _QUERY_TERM.findall(text or ""):
+        if phrase:
+            if phrase.strip():
+                terms.append('"' + phrase.strip() + '"')
+            continue
+        is_prefix = word.endswith("*")
+        word = word.strip('*"').replace('"', '""')
+        if word:
+            terms.append('"' + word + '"' + ("*" if is_prefix else ""))
+    if prefix_last and terms and not terms[-1].endswith("*") and text.rstrip()[-1:] != '"':
+        terms[-1] += "*"
+    return " ".join(terms)
+
 
 class MemoryEngine:
     """
@@ -19,14 +65,18 @@ class MemoryEngine:
     - Context awareness (Elaine remembers what you asked before)
     """
 
-    def __init__(self):
+    RANK_WINDOW = 5000   # Newest matches considered for BM25 ranking
+
+    def __init__(self, db_path=None):
         self.home = Path.home() / ".elaine"
         self.home.mkdir(exist_ok=True)
-        self.db_path = str(self.home / "memory.db")
+        self.db_path = str(db_path or self.home / "memory.db")
+        self.fts_enabled = HAS_FTS5
+        self._db = get_pool(self.db_path)
         self._init_db()
 
     def _init_db(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
 
         # Conversation history
@@ -73,16 +123,72 @@ class MemoryEngine:
             FOREIGN KEY (conversation_id) REFERENCES conversations(id)
         )""")
 
+        if self.fts_enabled:
+            self._init_search_index(c)
+
         conn.commit()
         conn.close()
 
+    def _init_search_index(self, c):
+        """FTS5 indexes over conversations and commands, maintained by triggers."""
+        c.execute("SELECT name FROM sqlite_master WHERE name IN ('conversations_fts', 'command_stats')")
+        existing = {r[0] for r in c.fetchall()}
+
+        # Conversations — external-content index, rowid = conversations.id
+        c.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS conversations_fts USING fts5(
+            content, content='conversations', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )""")
+        c.execute("""CREATE TRIGGER IF NOT EXISTS conversations_fts_ai AFTER INSERT ON conversations BEGIN
+            INSERT INTO conversations_fts(rowid, content) VALUES (new.id, new.content);
+        END""")
+        c.execute("""CREATE TRIGGER IF NOT EXISTS conversations_fts_ad AFTER DELETE ON conversations BEGIN
+            INSERT INTO conversations_fts(conversations_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        END""")
+        c.execute("""CREATE TRIGGER IF NOT EXISTS conversations_fts_au AFTER UPDATE OF content ON conversations BEGIN
+            INSERT INTO conversations_fts(conversations_fts, rowid, content) VALUES ('delete', old.id, old.content);
+            INSERT INTO conversations_fts(rowid, content) VALUES (new.id, new.content);
+        END""")
+
+        # Commands — one row per distinct successful command with its frequency
+        c.execute("""CREATE TABLE IF NOT EXISTS command_stats (
+            command TEXT PRIMARY KEY,
+            freq INTEGER NOT NULL DEFAULT 0,
+            last_used TIMESTAMP
+        )""")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_command_stats_freq ON command_stats(freq DESC)")
+        c.execute("""CREATE VIRTUAL TABLE IF NOT EXISTS commands_fts USING fts5(
+            command, content='command_stats', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2', prefix='1 2 3'
+        )""")
+        c.execute("""CREATE TRIGGER IF NOT EXISTS command_history_stats AFTER INSERT ON command_history
+            WHEN new.success = 1 AND new.command IS NOT NULL BEGIN
+            INSERT INTO command_stats (command, freq, last_used) VALUES (new.command, 1, new.created_at)
+            ON CONFLICT(command) DO UPDATE SET freq = freq + 1, last_used = excluded.last_used;
+        END""")
+        c.execute("""CREATE TRIGGER IF NOT EXISTS command_stats_fts_ai AFTER INSERT ON command_stats BEGIN
+            INSERT INTO commands_fts(rowid, command) VALUES (new.rowid, new.command);
+        END""")
+        c.execute("""CREATE TRIGGER IF NOT EXISTS command_stats_fts_ad AFTER DELETE ON command_stats BEGIN
+            INSERT INTO commands_fts(commands_fts, rowid, command) VALUES ('delete', old.rowid, old.command);
+        END""")
+
+        # Existing databases: index what was stored before the indexes existed
+        if "conversations_fts" not in existing:
+            c.execute("INSERT INTO conversations_fts(conversations_fts) VALUES ('rebuild')")
+        if "command_stats" not in existing:
+            c.execute("""INSERT INTO command_stats (command, freq, last_used)
+                SELECT command, COUNT(*), MAX(created_at) FROM command_history
+                WHERE success = 1 AND command IS NOT NULL GROUP BY command""")
+            c.execute("INSERT INTO commands_fts(commands_fts) VALUES ('rebuild')")
+
     # ═══════════════════════════════════════════
     #  CONVERSATION HISTORY
     # ═══════════════════════════════════════════
 
     def add_message(self, role, content, intent=None, entities=None, panel=None):
         """Store a conversation message."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("""INSERT INTO conversations
             (role, content, intent, entities, panel)
@@ -93,10 +199,8 @@ class MemoryEngine:
 
         # Auto-extract context tags
         if content:
-            tags = self._extract_tags(content)
-            for tag in tags:
-                c.execute("""INSERT INTO context_tags (tag, conversation_id)
-                    VALUES (?, ?)""", (tag, msg_id))
+            c.executemany("""INSERT INTO context_tags (tag, conversation_id)
+                VALUES (?, ?)""", [(tag, msg_id) for tag in self._extract_tags(content)])
 
         conn.commit()
         conn.close()
@@ -104,7 +208,7 @@ class MemoryEngine:
 
     def get_history(self, limit=50, since=None):
         """Get conversation history."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         if since:
@@ -120,7 +224,7 @@ class MemoryEngine:
 
     def get_recent_context(self, n=10):
         """Get the last N messages as context for Elaine's responses."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         c.execute("SELECT role, content, intent, panel FROM conversations ORDER BY id DESC LIMIT ?", (n,))
@@ -129,20 +233,49 @@ class MemoryEngine:
         return list(reversed(rows))
 
     def search_history(self, query, limit=20):
-        """Search conversation history."""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Search conversation history, best matches first (BM25).
+        Supports "exact phrases" and prefix* terms; each row carries a
+        highlighted snippet and its score (lower is better).
+        """
+        match = fts_query(query) if self.fts_enabled else ""
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
-        c.execute("""SELECT * FROM conversations
-            WHERE content LIKE ? ORDER BY created_at DESC LIMIT ?""",
-            (f"%{query}%", limit))
+        if match:
+            # Rank the newest RANK_WINDOW matches by BM25, then build snippets
+            # for the winners only — bounded work however common the terms.
+            c.execute("""SELECT id, score FROM (
+                    SELECT rowid AS id, bm25(conversations_fts) AS score
+                    FROM conversations_fts WHERE conversations_fts MATCH ?
+                    ORDER BY rowid DESC LIMIT ?
+                ) ORDER BY score LIMIT ?""",
+                (match, self.RANK_WINDOW, limit))
+            scores = dict(c.fetchall())
+            rows = []
+            if scores:
+                c.execute(f"""SELECT c.*,
+                        snippet(conversations_fts, 0, ?, ?, '…', 16) AS snippet
+                    FROM conversations_fts
+                    JOIN conversations c ON c.id = conversations_fts.rowid
+                    WHERE conversations_fts MATCH ?
+                      AND conversations_fts.rowid IN ({",".join("?" * len(scores))})""",
+                    (SNIPPET_OPEN, SNIPPET_CLOSE, match, *scores))
+                rows = [dict(r, score=scores[r["id"]]) for r in c.fetchall()]
+                rows.sort(key=lambda r: r["score"])
+            conn.close()
+            return rows
+        else:
+            c.execute("""SELECT * FROM conversations
+                WHERE content LIKE ? ORDER BY created_at DESC LIMIT ?""",
+                (f"%{query}%", limit))
         rows = [dict(r) for r in c.fetchall()]
         conn.close()
         return rows
 
     def get_conversation_stats(self):
         """Get conversation statistics."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
 
         c.execute("SELECT COUNT(*) FROM conversations")
@@ -179,7 +312,7 @@ class MemoryEngine:
 
     def clear_history(self, before=None):
         """Clear conversation history, optionally before a date."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         if before:
             c.execute("DELETE FROM context_tags WHERE conversation_id IN (SELECT id FROM conversations WHERE created_at < ?)", (before,))
@@ -196,7 +329,7 @@ class MemoryEngine:
 
     def set_preference(self, key, value):
         """Set a user preference."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("""INSERT OR REPLACE INTO preferences (key, value, updated_at)
             VALUES (?, ?, ?)""",
@@ -207,7 +340,7 @@ class MemoryEngine:
 
     def get_preference(self, key, default=None):
         """Get a user preference."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("SELECT value FROM preferences WHERE key = ?", (key,))
         row = c.fetchone()
@@ -221,7 +354,7 @@ class MemoryEngine:
 
     def get_all_preferences(self):
         """Get all preferences."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         c.execute("SELECT key, value, updated_at FROM preferences ORDER BY key")
@@ -235,7 +368,7 @@ class MemoryEngine:
         return prefs
 
     def delete_preference(self, key):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("DELETE FROM preferences WHERE key = ?", (key,))
         conn.commit()
@@ -247,7 +380,7 @@ class MemoryEngine:
 
     def set_state(self, key, value):
         """Set session state (UI state that persists across restarts)."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("""INSERT OR REPLACE INTO session_state (key, value, updated_at)
             VALUES (?, ?, ?)""",
@@ -258,7 +391,7 @@ class MemoryEngine:
 
     def get_state(self, key, default=None):
         """Get session state."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("SELECT value FROM session_state WHERE key = ?", (key,))
         row = c.fetchone()
@@ -272,7 +405,7 @@ class MemoryEngine:
 
     def get_all_state(self):
         """Get all session state."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("SELECT key, value FROM session_state")
         state = {}
@@ -290,7 +423,7 @@ class MemoryEngine:
 
     def log_command(self, command, intent=None, success=True):
         """Log a command for history and autocomplete."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         c.execute("""INSERT INTO command_history (command, intent, success)
             VALUES (?, ?, ?)""", (command, intent, 1 if success else 0))
@@ -298,10 +431,24 @@ class MemoryEngine:
         conn.close()
 
     def get_command_suggestions(self, prefix="", limit=10):
-        """Get command suggestions based on history."""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Get command suggestions based on history.
+        With the search index, the prefix may match the start of any word;
+        commands that start with it rank first, then by frequency.
+        """
+        match = fts_query(prefix, prefix_last=True) if self.fts_enabled else ""
+        conn = self._db.connect()
         c = conn.cursor()
-        if prefix:
+        if match:
+            c.execute("""SELECT s.command, s.freq FROM commands_fts
+                JOIN command_stats s ON s.rowid = commands_fts.rowid
+                WHERE commands_fts MATCH ?
+                ORDER BY (s.command LIKE ?) DESC, s.freq DESC LIMIT ?""",
+                (match, f"{prefix}%", limit))
+        elif self.fts_enabled and not prefix:
+            c.execute("""SELECT command, freq FROM command_stats
+                ORDER BY freq DESC LIMIT ?""", (limit,))
+        elif prefix:
             c.execute("""SELECT command, COUNT(*) as freq FROM command_history
                 WHERE command LIKE ? AND success = 1
                 GROUP BY command ORDER BY freq DESC LIMIT ?""",
@@ -324,7 +471,7 @@ class MemoryEngine:
 
     def get_active_topics(self, hours=24):
         """Get topics discussed in recent conversations."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         c = conn.cursor()
         since = (datetime.now() - timedelta(hours=hours)).isoformat()
         c.execute("""SELECT tag, SUM(weight) as total FROM context_tags
@@ -359,7 +506,7 @@ class MemoryEngine:
 
     def get_last_topic_context(self):
         """Get the context of the last conversation topic."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._db.connect()
         conn.row_factory = sqlite3.Row
         c = conn.cursor()
         c.execute("""SELECT * FROM conversations
@@ -0,0 +1,126 @@
+"""
+Sentinel v2 — Rule Scanner
+One pass over a document feeds every Sentinel detector.
+
+A RuleScanner is compiled once from the cue lists its detectors own
+(see trust_engine.py) and runs once per review, whatever the number of rules:
+  - an Aho-Corasick automaton over every literal cue the detectors consult
+  - one compiled regex per structured token kind: prices, percentages,
+    timelines, year references and ISO standard numbers. The kinds overlap
+    ("2024 monthly" is a year and a timeline, "$2024" a price and a year),
+    so each is scanned on its own rather than as one alternation, which
+    would hand the shared text to whichever branch comes first
+
+Detectors then query the resulting ContentScan instead of re-running
+their own regexes and substring checks. Querying a cue the scanner was not
+built with raises, so a new term can't quietly read as "not present".
+
+Almost Magic Tech Lab — Patentable IP
+"""
+
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from modules.text_matcher import MultiPatternMatcher
+
+# Trend words percent_then_trend() looks for; always part of the cue set
+TREND_CUES = ("growing", "increasing", "trending")
+
+PRICE_PATTERN = re.compile(r"\$[\d,]+")
+PERCENT_PATTERN = re.compile(r"\d+%")
+TIMELINE_PATTERN = re.compile(r"\d+[\s-]*(?:day|week|month)")
+YEAR_PATTERN = re.compile(r"\b(?:2022|2023|2024)\b")
+ISO_PATTERN = re.compile(r"iso \d{5}")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def normalise_price(price: str) -> str:
+    """'$12,500' and '$12500' are the same price."""
+    return price.replace(",", "")
+
+
+@dataclass
+class ContentScan:
+    """Everything the detectors need, gathered in one pass over the text."""
+    text: str                                   # lowercased content
+    cues: frozenset = frozenset()               # every cue the scanner matched for
+    hits: dict[str, list[int]] = field(default_factory=dict)   # cue → start offsets
+    prices: list[str] = field(default_factory=list)
+    percents: list[tuple[int, int]] = field(default_factory=list)  # (start, end)
+    timelines: list[tuple[int, str]] = field(default_factory=list)
+    years: list[str] = field(default_factory=list)
+    iso_refs: int = 0
+
+    def _starts(self, cue: str) -> list[int]:
+        if cue not in self.cues:
+            raise KeyError(f"Cue {cue!r} is not registered with the RuleScanner")
+        return self.hits.get(cue, [])
+
+    def has(self, cue: str) -> bool:
+        """Cue appears anywhere (substring semantics)."""
+        return bool(self._starts(cue))
+
+    def has_any(self, *cues: str) -> bool:
+        return any(self._starts(c) for c in cues)
+
+    def count(self, cue: str) -> int:
+        return len(self._starts(cue))
+
+    def has_word(self, cue: str) -> bool:
+        """Cue appears as a whole word, like r'\\bcue\\b'."""
+        n = len(self.text)
+        for start in self._starts(cue):
+            end = start + len(cue)
+            if (start == 0 or not _is_word_char(self.text[start - 1])) and (
+                end == n or not _is_word_char(self.text[end])
+            ):
+                return True
+        return False
+
+    def has_before(self, cue: str, position: int, window: int) -> bool:
+        """Cue appears entirely within the `window` characters before position."""
+        return any(
+            position - window <= start and start + len(cue) <= position
+            for start in self._starts(cue)
+        )
+
+    def percent_then_trend(self) -> bool:
+        """A percentage followed later on the same line by a trend word."""
+        trends = sorted(s for cue in TREND_CUES for s in self._starts(cue))
+        for _, end in self.percents:
+            i = bisect_left(trends, end)
+            if i < len(trends) and "\n" not in self.text[end:trends[i]]:
+                return True
+        return False
+
+
+class RuleScanner:
+    """
+    Scanner compiled once over a fixed set of literal cues.
+
+    Usage:
+        scanner = RuleScanner(["guarantee", "confidential"])
+        scan = scanner.scan(content)
+        scan.has_word("guarantee")
+    """
+
+    def __init__(self, cues):
+        self.cues = frozenset(cues) | frozenset(TREND_CUES)
+        self._literals = MultiPatternMatcher(sorted(self.cues))
+
+    def scan(self, content: str) -> ContentScan:
+        """Run the literal matcher and each token regex once over the document."""
+        text = content.lower()
+        scan = ContentScan(text=text, cues=self.cues)
+        for start, cue in self._literals.spans(text):
+            scan.hits.setdefault(cue, []).append(start)
+        scan.prices = PRICE_PATTERN.findall(text)
+        scan.percents = [m.span() for m in PERCENT_PATTERN.finditer(text)]
+        scan.timelines = [(m.start(), m.group()) for m in TIMELINE_PATTERN.finditer(text)]
+        scan.years = YEAR_PATTERN.findall(text)
+        scan.iso_refs = sum(1 for _ in ISO_PATTERN.finditer(text))
+        return scan
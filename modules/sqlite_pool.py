@@ -0,0 +1,265 @@
+"""
+Elaine v4 — SQLite Pool
+Shared, thread-safe access to Elaine's SQLite databases.
+
+One SQLitePool per database file (see get_pool). Connections are opened
+once with WAL journaling, a busy timeout and tuned pragmas, then handed
+out as leases: `pool.connect()` returns a drop-in stand-in for
+`sqlite3.connect(path)` whose close() returns the connection to the pool
+instead of closing it. Idle connections sit on a LIFO stack, so a thread
+that works in bursts keeps getting its own warm connection — and its
+prepared-statement cache — back.
+
+    pool = get_pool(db_path)
+    conn = pool.connect()
+    conn.execute(...)
+    conn.commit()
+    conn.close()            # back to the pool
+
+    pool.write_many("INSERT INTO t VALUES (?, ?)", rows)   # one transaction
+
+Benchmark (connect-per-call vs pooled):
+    python -m modules.sqlite_pool
+
+Almost Magic Tech Lab
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger("elaine.sqlite")
+
+PRAGMAS = (
+    ("journal_mode", "WAL"),        # Readers never block the writer
+    ("synchronous", "NORMAL"),      # Durable at checkpoints; safe with WAL
+    ("foreign_keys", "ON"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", "-8000"),        # 8 MB page cache per connection
+)
+BUSY_TIMEOUT_S = 5.0                # Wait for a lock instead of failing
+STATEMENT_CACHE = 256               # Prepared statements kept per connection
+MAX_IDLE = 8                        # Idle connections kept per database
+
+
+class PooledConnection:
+    """
+    Lease on a pooled sqlite3.Connection.
+    Behaves like the connection; close() hands it back to the pool.
+    """
+
+    __slots__ = ("_pool", "_conn")
+
+    def __init__(self, pool: "SQLitePool", conn: sqlite3.Connection):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_conn", conn)
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._conn, name, value)
+
+    def close(self):
+        conn = self._conn
+        if conn is not None:
+            object.__setattr__(self, "_conn", None)
+            self._pool._release(conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Commit (or roll back on error), then return to the pool."""
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self.close()
+        return False
+
+
+class SQLitePool:
+    """Connection pool for one SQLite database file."""
+
+    def __init__(self, path, max_idle: int = MAX_IDLE):
+        self.path = str(path)
+        self.max_idle = max_idle
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.opened = 0
+        self.reused = 0
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_S,
+            check_same_thread=False,     # Leases move between threads; one user at a time
+            cached_statements=STATEMENT_CACHE,
+        )
+        for name, value in PRAGMAS:
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    def connect(self) -> PooledConnection:
+        """Lease a connection — a drop-in for sqlite3.connect(path)."""
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return PooledConnection(self, self._idle.pop())
+            self.opened += 1
+        return PooledConnection(self, self._open())
+
+    def _release(self, conn: sqlite3.Connection):
+        try:
+            if conn.in_transaction:
+                conn.rollback()          # Same as closing without commit
+            conn.row_factory = None
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def transaction(self, row_factory=None):
+        """Lease a cursor inside one transaction: commit on success, roll back on error."""
+        with self.connect() as conn:
+            conn.row_factory = row_factory
+            yield conn.cursor()
+
+    def write_many(self, sql: str, rows: Iterable) -> int:
+        """Run one statement over many parameter rows in a single transaction."""
+        with self.transaction() as c:
+            c.executemany(sql, rows)
+            return c.rowcount
+
+    def write_script(self, statements: Iterable[tuple[str, tuple]]) -> int:
+        """Run a batch of (sql, params) writes in a single transaction."""
+        n = 0
+        with self.transaction() as c:
+            for sql, params in statements:
+                c.execute(sql, params)
+                n += 1
+        return n
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> dict:
+        return {"path": self.path, "opened": self.opened,
+                "reused": self.reused, "idle": len(self._idle)}
+
+
+_pools: dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(path) -> SQLitePool:
+    """The shared pool for a database file (one per resolved path)."""
+    key = str(Path(path).expanduser().resolve())
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                Path(key).parent.mkdir(parents=True, exist_ok=True)
+                pool = _pools[key] = SQLitePool(key)
+    return pool
+
+
+def close_all():
+    """Close every pooled connection (process shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+# ── Benchmark ────────────────────────────────────────────────────
+
+def benchmark(ops: int = 5000, threads: int = 8, directory: Optional[str] = None) -> dict:
+    """
+    Ops/sec for a small insert + indexed lookup, per call:
+      before — sqlite3.connect() per call, default journal, no busy timeout
+      after  — pooled lease, WAL, statement cache
+    Run single-threaded and with concurrent writers.
+    """
+    import tempfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    results = {}
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        schema = ("CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY KEY, "
+                  "kind TEXT, body TEXT)")
+
+        def op_before(path, i):
+            for attempt in range(50):
+                conn = sqlite3.connect(path)
+                try:
+                    c = conn.cursor()
+                    c.execute("INSERT INTO events (kind, body) VALUES (?, ?)", ("note", f"event {i}"))
+                    c.execute("SELECT body FROM events WHERE id = ?", (c.lastrowid,))
+                    c.fetchone()
+                    conn.commit()
+                    conn.close()
+                    return attempt
+                except sqlite3.OperationalError:
+                    conn.close()
+                    time.sleep(0.001)
+            return attempt
+
+        def op_after(pool, i):
+            conn = pool.connect()
+            c = conn.cursor()
+            c.execute("INSERT INTO events (kind, body) VALUES (?, ?)", ("note", f"event {i}"))
+            c.execute("SELECT body FROM events WHERE id = ?", (c.lastrowid,))
+            c.fetchone()
+            conn.commit()
+            conn.close()
+            return 0
+
+        for label, workers in (("1 thread", 1), (f"{threads} threads", threads)):
+            before_path = f"{tmp}/before-{workers}.db"
+            conn = sqlite3.connect(before_path)
+            conn.execute(schema)
+            conn.close()
+            pool = SQLitePool(f"{tmp}/after-{workers}.db")
+            with pool.connect() as conn:
+                conn.execute(schema)
+
+            row = {}
+            for name, fn, target in (("before", op_before, before_path), ("after", op_after, pool)):
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    retries = sum(ex.map(lambda i: fn(target, i), range(ops)))
+                elapsed = time.perf_counter() - start
+                row[name] = {"ops_per_s": round(ops / elapsed), "lock_retries": retries}
+            pool.close()
+            results[label] = row
+    return results
+
+
+if __name__ == "__main__":
+    for label, row in benchmark().items():
+        b, a = row["before"], row["after"]
+        print(f"{label:>10}: before {b['ops_per_s']:>7,} ops/s ({b['lock_retries']} lock retries)"
+              f"   after {a['ops_per_s']:>7,} ops/s ({a['lock_retries']} lock retries)"
+              f"   ×{a['ops_per_s'] / max(1, b['ops_per_s']):.1f}")
@@ -0,0 +1,188 @@
+"""
+Elaine v4 — Template Registry
+One process-wide Jinja2 environment per template directory.
+
+Every template is compiled once — at startup via precompile() — and then
+served from the environment's in-memory cache, instead of building a new
+Environment (and recompiling from disk) for every render. Optionally the
+compiled bytecode is also written to disk so a restart skips parsing.
+
+In development (auto_reload=True) Jinja checks each template's mtime on
+use and recompiles only the files that changed; in production it never
+touches the disk after startup.
+
+    registry = get_registry(BRIEFING_TEMPLATE_DIR)
+    registry.precompile()
+    prompt = registry.render("morning_brief.j2", **data)
+    registry.stats()        # per-template render count / avg / max ms
+
+Benchmark (fresh Environment per render vs registry):
+    python -m modules.template_registry
+
+Almost Magic Tech Lab
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+logger = logging.getLogger("elaine.templates")
+
+TEMPLATE_EXTENSIONS = ("j2", "jinja", "jinja2", "txt")
+
+
+class TemplateRegistry:
+    """Compiled-template cache and render timings for one directory."""
+
+    def __init__(self, directory, auto_reload: bool = False,
+                 bytecode_dir: Optional[str] = None):
+        self.directory = str(directory)
+        bytecode_cache = None
+        if bytecode_dir:
+            path = Path(bytecode_dir).expanduser()
+            path.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(path))
+        self.env = Environment(
+            loader=FileSystemLoader(self.directory),
+            auto_reload=auto_reload,
+            bytecode_cache=bytecode_cache,
+            cache_size=-1,              # Never evict a compiled template
+        )
+        self._timings: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.compiled = 0
+        self.compile_ms = 0.0
+
+    @property
+    def auto_reload(self) -> bool:
+        return self.env.auto_reload
+
+    def names(self) -> list[str]:
+        return self.env.list_templates(extensions=TEMPLATE_EXTENSIONS)
+
+    def precompile(self) -> int:
+        """Compile every template in the directory now; returns how many."""
+        start = time.perf_counter()
+        count = 0
+        for name in self.names():
+            try:
+                self.env.get_template(name)
+                count += 1
+            except Exception as exc:
+                logger.error("Template %s failed to compile: %s", name, exc)
+        self.compiled = count
+        self.compile_ms = round((time.perf_counter() - start) * 1000, 2)
+        logger.info("Precompiled %d templates from %s in %.1f ms",
+                    count, self.directory, self.compile_ms)
+        return count
+
+    def render(self, template_name: str, **context) -> str:
+        start = time.perf_counter()
+        text = self.env.get_template(template_name).render(**context)
+        self._record(template_name, (time.perf_counter() - start) * 1000)
+        return text
+
+    def _record(self, name: str, ms: float):
+        with self._lock:
+            t = self._timings.setdefault(name, {"renders": 0, "total_ms": 0.0,
+                                                "last_ms": 0.0, "max_ms": 0.0})
+            t["renders"] += 1
+            t["total_ms"] += ms
+            t["last_ms"] = ms
+            t["max_ms"] = max(t["max_ms"], ms)
+
+    def stats(self) -> dict:
+        with self._lock:
+            timings = {
+                name: {"renders": t["renders"],
+                       "avg_ms": round(t["total_ms"] / t["renders"], 3),
+                       "last_ms": round(t["last_ms"], 3),
+                       "max_ms": round(t["max_ms"], 3)}
+                for name, t in sorted(self._timings.items())
+            }
+        return {"directory": self.directory, "auto_reload": self.auto_reload,
+                "bytecode_cache": self.env.bytecode_cache is not None,
+                "precompiled": self.compiled, "precompile_ms": self.compile_ms,
+                "templates": timings}
+
+
+_registries: dict[str, TemplateRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(directory, auto_reload: bool = False,
+                 bytecode_dir: Optional[str] = None) -> TemplateRegistry:
+    """The shared registry for a template directory (options apply on first use)."""
+    key = str(Path(directory).resolve())
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = _registries[key] = TemplateRegistry(key, auto_reload, bytecode_dir)
+        return registry
+
+
+# ── Benchmark ────────────────────────────────────────────────────
+
+def _sample_context() -> dict:
+    items = [{"title": f"Item {i}", "url": f"https://example.com/{i}", "source": "News",
+              "summary": "Summary text " * 5, "due": "2026-01-01", "urgency": "today",
+              "action": f"Action {i}", "meeting": "Weekly sync"} for i in range(6)]
+    section = {"items": items}
+    return {
+        "current_date": "01 January 2026", "day_of_week": "Thursday",
+        "date_formatted": "01 January 2026", "week_start_date": "29 December 2025",
+        "week_end_date": "02 January 2026",
+        "news": section, "linkedin": section, "deadlines": section,
+        "action_items": section, "people": section,
+        "chronicle": {"today_schedule": items}, "security": {"alerts": items},
+        "question": "What is virtue?", "filter_category": "stoic",
+        "passages": [{"text": "Passage " * 20, "score": 0.82, "author": "Marcus Aurelius",
+                      "work": "Meditations"}] * 5,
+    }
+
+
+def benchmark(directory=None, rounds: int = 200) -> dict:
+    """
+    Render every briefing template back to back, `rounds` times:
+      before — new Environment per render (what app.py used to do)
+      after  — shared, precompiled registry
+    """
+    directory = str(directory or Path(__file__).resolve().parent.parent / "templates" / "briefing")
+    context = _sample_context()
+    registry = TemplateRegistry(directory)
+    registry.precompile()
+    names = registry.names()
+
+    def before():
+        for name in names:
+            Environment(loader=FileSystemLoader(directory)).get_template(name).render(**context)
+
+    def after():
+        for name in names:
+            registry.render(name, **context)
+
+    results = {"templates": names, "rounds": rounds}
+    for label, fn in (("before", before), ("after", after)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        elapsed = time.perf_counter() - start
+        results[label] = {"ms_per_round": round(elapsed * 1000 / rounds, 3),
+                          "renders_per_s": round(rounds * len(names) / elapsed)}
+    results["per_template"] = registry.stats()["templates"]
+    return results
+
+
+if __name__ == "__main__":
+    r = benchmark()
+    b, a = r["before"], r["after"]
+    print(f"{len(r['templates'])} templates × {r['rounds']} rounds")
+    print(f"  before: {b['ms_per_round']:>8} ms/round  {b['renders_per_s']:>8,} renders/s")
+    print(f"   after: {a['ms_per_round']:>8} ms/round  {a['renders_per_s']:>8,} renders/s"
+          f"   ×{a['renders_per_s'] / max(1, b['renders_per_s']):.1f}")
+    for name, t in r["per_template"].items():
+        print(f"    {name:<28} avg {t['avg_ms']:.3f} ms  max {t['max_ms']:.3f} ms")
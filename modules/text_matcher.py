@@ -0,0 +1,93 @@
+"""
+Elaine v4 — Text Matcher
+Aho-Corasick multi-pattern matching: one linear pass over a text finds
+every occurrence of every pattern, however many patterns there are.
+
+Matching is plain substring semantics — the same answers as
+`pattern in text` for each pattern — so it can replace loops of `in`
+checks without changing behaviour.
+
+Almost Magic Tech Lab
+"""
+
+from collections import deque
+from typing import Iterable
+
+
+class MultiPatternMatcher:
+    """
+    Compiled automaton over a fixed set of patterns.
+
+    Usage:
+        matcher = MultiPatternMatcher(["stoic", "marcus aurelius"])
+        matcher.find("Reading Marcus Aurelius".lower())  # → {"marcus aurelius"}
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        self.patterns: set[str] = set()
+        for pattern in patterns:
+            if pattern:
+                self._insert(pattern)
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _insert(self, pattern: str):
+        if pattern in self.patterns:
+            return
+        self.patterns.add(pattern)
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (pattern,)
+
+    def _link(self):
+        """Breadth-first failure links; outputs inherit along the fail chain."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> set[str]:
+        """Every pattern that occurs anywhere in text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def spans(self, text: str) -> list[tuple[int, str]]:
+        """Every occurrence as (start index, pattern), overlaps included."""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: list[tuple[int, str]] = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern in out[state]:
+                hits.append((i - len(pattern) + 1, pattern))
+        return hits
+
@@ -197,9 +197,135 @@ def test_gravity_governors():
     gov = GovernorSystem()
     assert gov is not None
 
+def test_gravity_incremental_recalc():
+    from modules.gravity_v2.gravity_field import GravityField
+    from modules.gravity_v2.models import GravityItem
+    g = GravityField()
+    items = [g.add_item(GravityItem(title=f"Task {n}", mass=10 + n * 8,
+                                    proximity_date=datetime.now() + timedelta(days=n + 1)))
+             for n in range(10)]
+    g.recalculate()
+    calls = []
+    original = g.calculate_gravity
+    g.calculate_gravity = lambda item: calls.append(item.id) or original(item)
+    g.recalculate()
+    assert calls == []  # nothing changed, nothing recomputed
+    g.update_item(items[0].id, mass=100)
+    g.recalculate()
+    assert calls == [items[0].id]
+    assert g.get_top_items(10) == sorted(items, key=lambda i: i.gravity_score, reverse=True)
+
+def test_gravity_snapshot_aggregates():
+    from modules.gravity_v2.gravity_field import GravityField
+    from modules.gravity_v2.models import GravityItem, AlertLevel
+    g = GravityField()
+    for n in range(12):
+        item = GravityItem(title=f"Task {n}", mass=30 + n * 6,
+                           proximity_date=datetime.now() + timedelta(days=n - 2),
+                           tags=["admin"])
+        item.consequence.revenue_at_risk = 1000.0 * n
+        g.add_item(item)
+    ids = list(g.items)
+    g.deprioritise_item(ids[1])
+    g.deprioritise_item(ids[2])
+    g.complete_item(ids[3])
+    snap = g.snapshot()
+    active = [i for i in g.items.values() if not i.deprioritised and i.completed_at is None]
+    assert snap.total_items == len(active) == 9
+    assert snap.red_giants == sum(1 for i in active if i.alert_level == AlertLevel.RED_GIANT)
+    assert snap.peripheral == sum(1 for i in active if i.gravity_score < 30)
+    assert snap.consequence_exposure["total_revenue_at_risk"] == sum(i.consequence.revenue_at_risk for i in active)
+    assert snap.ungraviton_count == 2 and snap.ungraviton_pattern == "admin_avoidance"
+    g.revive_item(ids[1])
+    assert g.snapshot().total_items == 10
+
+def test_gravity_dampened_full_recalc_deferred():
+    from modules.gravity_v2.gravity_field import GravityField
+    from modules.gravity_v2.models import GravityItem
+    g = GravityField()
+    item = g.add_item(GravityItem(title="Task", mass=50))
+    for _ in range(3):
+        g.recalculate(full=True)
+    g.recalculate(full=True)  # over the hourly budget
+    assert g._full_pending
+    g._last_recalc = datetime.now() - timedelta(hours=2)
+    g.recalculate()
+    assert not g._full_pending and item.breakdown is not None
+
+def test_gravity_time_boundary():
+    from modules.gravity_v2.gravity_field import GravityField
+    from modules.gravity_v2.models import GravityItem, EnergyCategory
+    g = GravityField()
+    now = datetime.now()
+    item = GravityItem(title="Call", mass=50, context_type=EnergyCategory.COLLABORATIVE,
+                       proximity_date=now + timedelta(days=10), last_touched=now)
+    assert g._next_time_boundary(item, now) == item.proximity_date - timedelta(days=7, seconds=-1)
+
+def test_gravity_batch_scoring():
+    from modules.gravity_v2.batch_scoring import HAS_NUMPY, score_batch
+    from modules.gravity_v2.benchmark import _synthetic_items
+    from modules.gravity_v2.gravity_field import GravityField
+    if not HAS_NUMPY:
+        return  # optional dependency — scalar path only
+    g = GravityField()
+    items = _synthetic_items(500, datetime.now())
+    scalar = [g.calculate_gravity(i).normalised_score for i in items]
+    assert score_batch(g, items) == scalar
+    for item in items:
+        g.add_item(item)
+    top = g.get_top_items(3)  # 500 dirty items → batch path
+    assert all(i.breakdown is None for i in items)  # explanations not built yet
+    bd = g.get_breakdown(top[0].id)
+    assert bd.normalised_score == top[0].gravity_score and bd.explanation
+
+def _busy_gravity_field(n, seed):
+    import random
+    from modules.gravity_v2.gravity_field import GravityField
+    from modules.gravity_v2.models import GravityItem
+    rng = random.Random(seed)
+    g = GravityField()
+    for k in range(n):
+        g.add_item(GravityItem(title=f"Task {k}", mass=rng.randint(80, 100),
+                               proximity_date=datetime.now() + timedelta(hours=rng.randint(2, 20)),
+                               estimated_hours=rng.choice([0.5, 1, 2, 3, 4.5, 5, 6])))
+    return g
+
+def test_gravity_collision_sweep():
+    g = _busy_gravity_field(60, seed=7)
+    hot = [i for i in g.get_top_items(60) if i.gravity_score >= 70]
+    expected = {(a.id, b.id) for k, a in enumerate(hot) for b in hot[k + 1:]
+                if a.estimated_hours + b.estimated_hours > 8.0}
+    collisions = g.detect_collisions(8.0)
+    assert expected and {(c.item_a_id, c.item_b_id) for c in collisions} == expected
+    assert all(not c.options for c in collisions)  # built lazily
+    assert len(g.collision_options(collisions[0])) == 3
+
+def test_gravity_best_feasible_set():
+    from itertools import combinations
+    g = _busy_gravity_field(12, seed=3)
+    hot = [i for i in g.get_top_items(12) if i.gravity_score >= 70]
+    best = max(
+        (sum(i.gravity_score for i in combo) for r in range(len(hot) + 1)
+         for combo in combinations(hot, r) if sum(i.estimated_hours for i in combo) <= 8.0),
+    )
+    plan = g.best_feasible_set(8.0)
+    assert sum(i.estimated_hours for i in plan) <= 8.0
+    assert abs(sum(i.gravity_score for i in plan) - best) < 1e-6
+    # No time plans nothing; unbounded time plans every candidate
+    assert g.best_feasible_set(0) == [] and g.best_feasible_set(-2) == []
+    assert g.best_feasible_set(float("nan")) == []
+    assert {i.id for i in g.best_feasible_set(float("inf"))} == {i.id for i in hot}
+
 test("Gravity: add item + score", test_gravity_add_and_score)
 test("Gravity: snapshot", test_gravity_snapshot)
 test("Gravity: governors init", test_gravity_governors)
+test("Gravity: incremental recalculation", test_gravity_incremental_recalc)
+test("Gravity: snapshot aggregates", test_gravity_snapshot_aggregates)
+test("Gravity: dampened full recalc deferred", test_gravity_dampened_full_recalc_deferred)
+test("Gravity: next time boundary", test_gravity_time_boundary)
+test("Gravity: NumPy batch scoring", test_gravity_batch_scoring)
+test("Gravity: collision sweep", test_gravity_collision_sweep)
+test("Gravity: best feasible set", test_gravity_best_feasible_set)
 
 # ── Constellation v2 ──
 
@@ -215,8 +341,51 @@ def test_constellation_network_intel():
     n = NetworkIntelligence()
     assert n is not None
 
+def test_constellation_indexed_resolution_at_scale():
+    import logging
+    import time as _time
+    from modules.constellation.poi_engine import POIEngine
+    from modules.constellation.models import POITier, NetworkConnection
+    from modules.constellation.network_intelligence import NetworkIntelligence
+    log = logging.getLogger("elaine.constellation.poi")
+    level, log.level = log.level, logging.WARNING
+    try:
+        e = POIEngine()
+        t0 = _time.perf_counter()
+        for i in range(20000):  # 20k contacts, each seen twice
+            e.process_email_signal(f"Contact {i}", f"contact{i}@firm{i % 500}.com.au")
+            e.process_email_signal(f"Contact {i}", f"Contact{i}@Firm{i % 500}.com.au ")
+        ingest = _time.perf_counter() - t0
+    finally:
+        log.level = level
+    assert len(e.pois) == 20000 and ingest < 10, ingest
+    ana = e.get_or_create_poi("Ana  Kowalski", company="Kowalski Advisory")
+    assert e.get_or_create_poi("ana kowalski") is ana
+    assert e.find_similar_pois("Anna Kowalsky")[0]["poi_id"] == ana.poi_id
+    assert [p.poi_id for p in e.search_pois("firm42.com")] == \
+        [p.poi_id for p in e.pois.values() if "firm42.com" in p.email]  # Same as a scan
+    assert len(e.search_pois("@firm42.com")) == 40
+
+    hub = e.get_poi(e.find_poi(email="contact1@firm1.com.au").poi_id)
+    hub.tier = POITier.INNER_CIRCLE
+    hub.trust_account.balance = 70
+    hub.known_connections.append(NetworkConnection(name="Ana Kowalski", estimated_value=9000))
+    hub.known_connections.append(NetworkConnection(name="New Person", estimated_value=9000))
+    for i in range(2, 12):
+        e.find_poi(email=f"contact{i}@firm{i}.com.au").referrals_received.append(hub.poi_id)
+    net = NetworkIntelligence()
+    t0 = _time.perf_counter()
+    opps = net.find_opportunities(e.pois)
+    risks = net.assess_all_network_risks(e.pois)
+    portfolio = net.analyse_portfolio(e.pois)
+    assert _time.perf_counter() - t0 < 5
+    assert [o.target_name for o in opps] == ["Ana Kowalski", "New Person"]  # Ana is tier 4
+    assert risks[0].poi_id == hub.poi_id and risks[0].connected_relationships_at_risk == 10
+    assert portfolio["total_active"] == 1
+
 test("Constellation: add POI", test_constellation_add_poi)
 test("Constellation: network intelligence", test_constellation_network_intel)
+test("Constellation: indexed POI resolution at 20k contacts", test_constellation_indexed_resolution_at_scale)
 
 # ── Cartographer v2 ──
 
@@ -292,10 +461,34 @@ def test_sentinel_position_integrity():
     positions = te.get_positions()
     assert len(positions) > 0  # Seeded positions
 
+def test_sentinel_rule_scan():
+    from modules.sentinel.trust_engine import TrustEngine, scan_content
+    scan = scan_content("We ensure it. Pricing $12,500 for 6 weeks, up 20% and growing. ISO 42001.")
+    assert scan.has_word("ensure")  # whole word only
+    assert not scan_content("Ensured already.").has_word("ensure")
+    assert scan.prices == ["$12,500"] and scan.iso_refs == 1
+    assert scan.timelines[0][1] == "6 week" and scan.percent_then_trend()
+    # Overlapping tokens: each year is seen as well as the timeline / price it sits in
+    scan = scan_content("Please see our 2024 monthly report and the 2023 weekly summary, $2022 fee")
+    assert scan.years == ["2024", "2023", "2022"] and len(scan.timelines) == 2 and scan.prices == ["$2022"]
+    audit = TrustEngine().review("Please see our 2024 monthly report and the 2023 weekly summary")
+    assert audit.trust_surface.timeliness == 90 and len(audit.staleness_items) == 2
+    try:
+        scan.has("not a registered cue")
+        raise AssertionError("unregistered cue should raise")
+    except KeyError:
+        pass
+    te = TrustEngine()
+    te.track_position("Assessment fee is $12500 per engagement", "proposal_v1", "pricing")
+    assert te._check_position_integrity("Fee: $12,500.") == []  # same price, different formatting
+    conflicts = te._check_position_integrity("Fee: $9,000 then $9,000 again.")
+    assert len(conflicts) == 2 and conflicts[0].conflicts_with == "proposal_v1"
+
 test("Sentinel: clean review", test_sentinel_review_clean)
 test("Sentinel: dangerous language detection", test_sentinel_review_dangerous)
 test("Sentinel: quick scan", test_sentinel_quick_scan)
 test("Sentinel: position integrity", test_sentinel_position_integrity)
+test("Sentinel: single-pass rule scan", test_sentinel_rule_scan)
 
 # ── Chronicle v2 ──
 
@@ -483,6 +676,31 @@ def test_learning_radar_strategic_framework():
 test("Learning Radar: detect Pyramid Principle", test_learning_radar_comm_framework)
 test("Learning Radar: detect SWOT reference", test_learning_radar_strategic_framework)
 
+def test_learning_radar_matcher_equivalence():
+    from modules.learning_radar import LearningRadar, InterestSource
+    lr = LearningRadar()
+    lr.add_interest("Behavioural game design")
+    texts = [
+        "Stoic ideas from Seneca came up again",
+        "Game design is behavioural at heart",
+        "Cynefin and wardley maps for the board offsite",
+        "nothing interesting here",
+    ]
+    for text in texts:
+        low = text.lower()
+        expected = next((i for i in lr.interests.values()
+                         if sum(1 for w in i.topic.lower().split() if len(w) > 3 and w in low) >= 2
+                         or i.topic.lower() in low), None)
+        assert lr._match_existing(text) is expected
+    before = len(lr.interests)
+    results = lr.detect_interests(texts, InterestSource.CONVERSATION)
+    assert results[1].topic == "Behavioural game design"
+    assert results[2].topic == "Complexity frameworks" and results[3] is None
+    assert len(lr.interests) == before + 1
+    assert lr._match_existing("complexity frameworks workshop").topic == "Complexity frameworks"  # index rebuilt
+
+test("Learning Radar: matcher equivalence + batch", test_learning_radar_matcher_equivalence)
+
 def test_comm_auto_structure():
     from modules.communication import CommunicationEngine
     from modules.strategic import StrategicEngine
@@ -754,6 +972,27 @@ def test_gatekeeper_status():
     s = gk.status()
     assert s["items_checked"] == 1
 
+def test_gatekeeper_cache_and_batch():
+    import tempfile
+    from modules.sentinel.trust_engine import TrustEngine
+    from modules.gatekeeper import Gatekeeper, ContentChannel, ContentPriority
+    gk = Gatekeeper(sentinel=TrustEngine())
+    first = gk.check("We guarantee results.", "Draft", channel=ContentChannel.FILE)
+    again = gk.check("We guarantee results.", "Draft", channel=ContentChannel.FILE)
+    assert again.item_id != first.item_id and again.overall_score == first.overall_score
+    assert gk.status()["cache"]["hits"] == 1
+    results = gk.check_batch([{"content": f"Note {i}", "title": f"n{i}.txt"} for i in range(20)])
+    assert [r.title for r in results] == [f"n{i}.txt" for i in range(20)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(5):
+            with open(os.path.join(tmp, f"draft{i}.md"), "w") as f:
+                f.write(f"Draft {i}: we guarantee results.")
+        gk.add_watched_folder(tmp, ContentChannel.FILE, ContentPriority.STANDARD)
+        folder_results = gk.check_folder(tmp)
+        assert len(folder_results) == 5
+        assert all(r.checks[0].issues for r in folder_results)
+    assert gk.status()["items_checked"] == 27
+
 test("Gatekeeper: clean email clears", test_gatekeeper_clear)
 test("Gatekeeper: detect sensitive priority", test_gatekeeper_priority_detect_sensitive)
 test("Gatekeeper: detect critical priority", test_gatekeeper_priority_detect_critical)
@@ -766,6 +1005,137 @@ test("Gatekeeper: watched folders", test_gatekeeper_watched_folders)
 test("Gatekeeper: Outlook rules", test_gatekeeper_outlook_rules)
 test("Gatekeeper: Outlook script", test_gatekeeper_outlook_script)
 test("Gatekeeper: status", test_gatekeeper_status)
+test("Gatekeeper: cached gates + batch/folder checks", test_gatekeeper_cache_and_batch)
+
+# ── Memory ───────────────────────────────────────────────────────
+
+def test_memory_full_text_search():
+    import tempfile
+    from modules.phase5_memory.memory import MemoryEngine
+    with tempfile.TemporaryDirectory() as tmp:
+        m = MemoryEngine(db_path=os.path.join(tmp, "memory.db"))
+        m.add_message("user", "Draft the board meeting agenda")
+        m.add_message("user", "Meeting notes: the board approved the budget")
+        m.add_message("assistant", "Budget review scheduled with Acme")
+        hits = m.search_history('"board meeting"')
+        assert [h["content"] for h in hits] == ["Draft the board meeting agenda"]
+        assert "<mark>board meeting</mark>" in hits[0]["snippet"]
+        assert len(m.search_history("budg*")) == 2
+        assert m.search_history('bad "query OR') is not None  # operators are escaped
+        for cmd in ["morning briefing", "morning briefing", "show pipeline"]:
+            m.log_command(cmd)
+        assert m.get_command_suggestions("mor")[0] == {"command": "morning briefing", "frequency": 2}
+        m.clear_history()
+        assert m.search_history("budget") == []
+
+test("Memory: FTS5 search, snippets, command suggestions", test_memory_full_text_search)
+
+# ── The Current ──────────────────────────────────────────────────
+
+def test_current_concurrent_conditional_scan():
+    import tempfile
+    import threading
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    from modules.phase4_current.the_current import TheCurrentEngine, HAS_FEEDPARSER
+    if not HAS_FEEDPARSER:
+        return
+    conditional = []
+
+    class Feed(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.headers.get("If-None-Match") == '"v1"':
+                conditional.append(self.path)
+                self.send_response(304)
+                self.end_headers()
+                return
+            n = self.path.rsplit("/", 1)[-1]
+            body = (f'<rss version="2.0"><channel><title>t</title>'
+                    f'<item><title>AI governance brief {n}</title><link>http://x/{n}</link></item>'
+                    f'<item><title>AI governance roundup</title><link>http://x/shared</link></item>'
+                    f'</channel></rss>').encode()
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Feed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            tc = TheCurrentEngine(db_path=os.path.join(tmp, "the_current.db"))
+            base = f"http://127.0.0.1:{server.server_address[1]}/feed"
+            tc.interest_areas = [{"name": "AI Governance", "keywords": ["AI governance"],
+                                  "rss_feeds": [f"{base}/{i}" for i in range(8)]}]
+            first = tc.scan_rss_feeds()
+            assert len(first) == 9  # 8 unique + 1 shared story stored once
+            assert tc.scan_rss_feeds() == [] and len(conditional) == 8  # all 304s
+            assert tc.get_dashboard_data()["unread_discoveries"] == 9
+    finally:
+        server.shutdown()
+
+def test_current_validators_need_parsed_body():
+    import tempfile
+    from modules.phase4_current.feed_fetcher import FetchJob, FetchResult
+    from modules.phase4_current.the_current import TheCurrentEngine
+    area = {"name": "AI Governance", "keywords": ["AI governance"]}
+    empty = b'{"data": {"children": []}}'
+
+    def result(label, status, body=b"", truncated=False):
+        job = FetchJob(url=f"http://x/{label}", context={"kind": "reddit", "area": area, "label": label})
+        return FetchResult(job, status, body, etag=f'"{label}"', truncated=truncated)
+
+    results = [result("broken", 200, b'{"data": {"chil'), result("cut", 200, empty, truncated=True),
+               result("good", 200, empty), result("same", 304)]
+
+    class Fetcher:
+        def fetch_all(self, jobs, validators=None):
+            return iter(results)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tc = TheCurrentEngine(db_path=os.path.join(tmp, "the_current.db"))
+        tc._fetcher = Fetcher()
+        jobs = [r.job for r in results]
+        tc._run_scan(jobs)
+        # A body that failed to parse or hit the size cap must be fetched in full next time
+        assert set(tc._feed_validators(jobs)) == {"http://x/good", "http://x/same"}
+
+def test_current_incremental_trends():
+    import sqlite3
+    import tempfile
+    from modules.phase4_current.the_current import TheCurrentEngine
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "the_current.db")
+        tc = TheCurrentEngine(db_path=db)
+
+        def found(i, keywords):
+            return dict(source="rss", source_url=f"http://x/{i}", title=f"Story {i}", summary="",
+                        author="", interest_area="AI Governance", keywords_matched=keywords,
+                        content_hash=f"hash-{i}")
+
+        tc._store_scan([found(i, ["ISO 42001"]) for i in range(5)] + [found(9, ["AI Act"])], [], [])
+        assert tc.detect_trends() == {"updated": 2, "full": True}
+        trend = tc.get_trends()[0]
+        assert (trend["topic"], trend["mention_count"], trend["mentions_7d"], trend["status"]) == \
+            ("ISO 42001", 5, 5, "emerging")
+        assert tc.detect_trends()["updated"] == 0  # Nothing new, same hour: no work
+        tc._store_scan([found(i, ["ISO 42001"]) for i in range(10, 14)], [], [])
+        assert tc.detect_trends() == {"updated": 1, "full": False}
+        assert tc.get_trends()[0]["status"] == "accelerating"  # 9 mentions in 7 days
+        conn = sqlite3.connect(db)
+        conn.execute("UPDATE trend_buckets SET hour = strftime('%Y-%m-%d %H:00', 'now', '-240 hours')")
+        conn.commit()
+        conn.close()
+        tc._trend_hour = None
+        tc.detect_trends()
+        assert tc.get_trends()[0]["status"] == "fading"  # Out of the 7-day window
+
+test("The Current: concurrent scan, conditional GET, bulk store", test_current_concurrent_conditional_scan)
+test("The Current: validators kept only for parsed bodies", test_current_validators_need_parsed_body)
+test("The Current: incremental windowed trends", test_current_incremental_trends)
 
 
 # ══════════════════════════════════════════════════════════════════
@@ -926,6 +1296,251 @@ test("Integration: thinking frameworks", test_orchestrator_thinking_integration)
 test("Integration: FULL CHAIN (meeting → gravity → sentinel → thinking)", test_full_chain)
 
 
+# ── Morning Briefing ─────────────────────────────────────────────
+
+class _FakeIMAP:
+    """Local IMAP stand-in: answers UID SEARCH / UID FETCH like imaplib does."""
+
+    def __init__(self, messages):
+        self.messages = messages          # uid → (header bytes, body bytes)
+        self.fetched = []
+
+    def login(self, user, password):
+        return "OK", [b"Logged in"]
+
+    def logout(self):
+        return "BYE", [b""]
+
+    def select(self, folder, readonly=False):
+        return "OK", [str(len(self.messages)).encode()]
+
+    def response(self, code):
+        return code, [b"7"]
+
+    def uid(self, command, *args):
+        if command == "SEARCH":
+            low = int(args[-1].split()[1].split(":")[0])
+            return "OK", [" ".join(str(u) for u in sorted(self.messages) if u >= low).encode()]
+        uids = [int(u) for u in args[0].split(",")]
+        self.fetched.extend(uids)
+        assert "BODY.PEEK[TEXT]<0.2048>" in args[1] and "RFC822" not in args[1]
+        data = []
+        for seq, u in enumerate(uids, 1):
+            header, body = self.messages[u]
+            data.append((f"{seq} (UID {u} BODY[HEADER.FIELDS (FROM SUBJECT)] {{{len(header)}}}".encode(), header))
+            data.append((f" BODY[TEXT]<0> {{{len(body[:2048])}}}".encode(), body[:2048]))
+            data.append(b")")
+        return "OK", data
+
+def _fake_mail(uid, subject, sender="Ana <ana@client.com.au>"):
+    header = (f"From: {sender}\r\nSubject: {subject}\r\nMessage-ID: <{uid}@x>\r\n"
+              f"Date: {datetime.now().strftime('%a, %d %b %Y %H:%M:%S')} +0000\r\n").encode()
+    return header, f"Body of {subject}. ".encode() * 200
+
+def test_briefing_incremental_imap_sync():
+    import tempfile
+    from modules.phase5_briefing.morning_briefing import MorningBriefingEngine
+    with tempfile.TemporaryDirectory() as tmp:
+        mbe = MorningBriefingEngine(config_path=os.path.join(tmp, "cfg.json"),
+                                    db_path=os.path.join(tmp, "briefing.db"))
+        mbe.config["email"].update(enabled=True, imap_server="127.0.0.1",
+                                   username="u", password="p", hours_lookback=48)
+        imap = _FakeIMAP({101: _fake_mail(101, "Proposal review"),
+                          102: _fake_mail(102, "URGENT: contract deadline")})
+        mbe._imap_connect = lambda: imap
+        first = mbe._get_important_emails()
+        assert first["source"] == "imap" and first["fetched"] == 2
+        assert first["items"][0]["subject"] == "URGENT: contract deadline"
+        assert first["items"][0]["snippet"].startswith("Body of URGENT")
+        again = mbe._get_important_emails()
+        assert again["fetched"] == 0 and len(again["items"]) == 2  # Served from cache
+        imap.messages[103] = _fake_mail(103, "Invoice")
+        assert mbe._get_important_emails()["fetched"] == 1
+        assert imap.fetched == [101, 102, 103]  # Nothing downloaded twice
+
+def test_briefing_sections_run_concurrently_with_timeouts():
+    import tempfile
+    import time as _time
+    from modules.phase5_briefing import morning_briefing as mb
+    with tempfile.TemporaryDirectory() as tmp:
+        mbe = mb.MorningBriefingEngine(config_path=os.path.join(tmp, "cfg.json"),
+                                       db_path=os.path.join(tmp, "briefing.db"))
+        mbe.config["email"].update(enabled=True, imap_server="127.0.0.1",
+                                   username="u", password="p")
+        mbe._imap_connect = lambda: _FakeIMAP({i: _fake_mail(i, f"Mail {i}") for i in range(1, 41)})
+        slow = lambda: _time.sleep(0.6) or {"title": "x", "items": [{"title": "ok"}]}
+        mbe._get_linkedin_relevant = slow
+        mbe._get_deadlines = slow
+        mbe._get_relevant_news = lambda: _time.sleep(5) or {"title": "x", "items": []}
+        saved = dict(mb.SECTION_TIMEOUTS)
+        mb.SECTION_TIMEOUTS["news"] = 1.0
+        try:
+            t0 = _time.monotonic()
+            b = mbe.generate_briefing()
+            elapsed = _time.monotonic() - t0
+        finally:
+            mb.SECTION_TIMEOUTS.clear()
+            mb.SECTION_TIMEOUTS.update(saved)
+        assert elapsed < 2.0, elapsed
+        assert b["timed_out"] == ["news"] and b["health"]["news"] == "timeout"
+        assert len(b["sections"]["linkedin"]["items"]) == 1  # Slow sections overlapped
+        assert len(b["sections"]["emails"]["items"]) == 15
+        assert list(b["sections"])[:3] == ["meetings", "emails", "prep_questions"]
+
+test("Briefing: header-only incremental IMAP sync", test_briefing_incremental_imap_sync)
+test("Briefing: concurrent sections with per-section timeouts", test_briefing_sections_run_concurrently_with_timeouts)
+
+
+# ── Engine Persistence ──
+
+def test_journal_replay_and_compaction():
+    import tempfile
+    from modules.persistence import RecordJournal
+    with tempfile.TemporaryDirectory() as d:
+        j = RecordJournal(d, "things", compact_every=3)
+        records = j.load()
+        j.bind(records)
+        for k in ("a", "b"):
+            records[k] = {"v": k}
+            j.put(k, records[k])
+        records.pop("a")
+        j.delete("a")  # third entry → compaction
+        assert j.journal_path.stat().st_size == 0 and j.snapshot_path.exists()
+        records["c"] = {"v": "c"}
+        j.put("c", records["c"])
+        with open(j.journal_path, "ab") as f:
+            f.write(b"\x00\x00\x01\x00torn")  # crash mid-append
+        assert RecordJournal(d, "things").load() == {"b": {"v": "b"}, "c": {"v": "c"}}
+
+def test_archive_index_and_compaction():
+    import tempfile
+    from modules.persistence import RecordArchive
+    with tempfile.TemporaryDirectory() as d:
+        a = RecordArchive(d, "old", compact_every=4)
+        for i in range(3):
+            a.put(f"k{i}", {"v": i})
+        a.put("k0", {"v": "again"})
+        a.delete("k1")
+        assert a.get("k0") == {"v": "again"} and a.get("k1") is None and len(a) == 2
+        size = a.path.stat().st_size
+        a.put("k2", {"v": "last"})  # 4 dead frames > 2 live → compaction
+        assert a.path.stat().st_size < size
+        with open(a.path, "ab") as f:
+            f.write(b"\x00\x00\x01\x00torn")  # crash mid-append
+        b = RecordArchive(d, "old")
+        assert (b.get("k0"), b.get("k2"), "k1" in b) == ({"v": "again"}, {"v": "last"}, False)
+        a.close()
+        b.close()
+
+def test_gravity_warm_restart_and_archive():
+    import tempfile
+    from modules.persistence import EngineStore
+    from modules.gravity_v2.gravity_field import GravityField
+    from modules.gravity_v2.models import GravityItem
+    with tempfile.TemporaryDirectory() as d:
+        store = EngineStore(d)
+        g = GravityField(journal=store.journal("gravity"), archive=store.archive("archive"))
+        keep = g.add_item(GravityItem(title="Proposal", mass=70))
+        old = g.add_item(GravityItem(title="Invoice", mass=40))
+        g.complete_item(old.id)
+        g.items[old.id].completed_at = datetime.now() - timedelta(days=30)
+        g.mark_dirty(old.id)
+        g.update_item(keep.id, mass=90)
+
+        store2 = EngineStore(d)
+        g2 = GravityField(journal=store2.journal("gravity"), archive=store2.archive("archive"))
+        assert list(g2.items) == [keep.id] and g2.items[keep.id].mass == 90
+        assert g2.get_archived_item(old.id).title == "Invoice"
+        assert g2.active_item_count() == 1
+
+def test_engines_restore_without_reseeding():
+    import tempfile
+    from modules.persistence import EngineStore
+    from modules.learning_radar import LearningRadar, InterestSource
+    from modules.chronicle.meeting_engine import MeetingEngine
+    from modules.chronicle.models import MeetingTemplate
+    with tempfile.TemporaryDirectory() as d:
+        store = EngineStore(d)
+        radar = LearningRadar(journal=store.journal("interests"))
+        seeded = len(radar.interests)
+        radar.add_interest("Cybernetics", "science")
+        meetings = MeetingEngine(journal=store.journal("meetings"))
+        m = meetings.create_meeting("Kickoff", list(MeetingTemplate)[0], [{"name": "Sam"}])
+        meetings.extract_commitments(m.meeting_id, "I'll send the proposal by Friday.")
+
+        store2 = EngineStore(d)
+        radar2 = LearningRadar(journal=store2.journal("interests"))
+        assert len(radar2.interests) == seeded + 1
+        assert radar2.connections  # seed connections re-resolved by topic
+        assert radar2.detect_interest("Reading about cybernetics", InterestSource.MANUAL)
+        meetings2 = MeetingEngine(journal=store2.journal("meetings"))
+        assert meetings2.get_meeting(m.meeting_id).commitments
+
+def test_sqlite_pool_reuse_and_wal():
+    import sqlite3
+    import tempfile
+    import threading
+    from modules.sqlite_pool import SQLitePool
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = SQLitePool(os.path.join(tmp, "t.db"))
+        with pool.connect() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+        conn = pool.connect()
+        conn.row_factory = sqlite3.Row
+        conn.execute("INSERT INTO t (v) VALUES ('uncommitted')")
+        conn.close()  # Rolled back and reset, like closing a plain connection
+        conn = pool.connect()
+        assert conn.row_factory is None
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        conn.close()
+        assert pool.write_many("INSERT INTO t (v) VALUES (?)", [(str(i),) for i in range(100)]) == 100
+
+        def writer(n):
+            for i in range(50):
+                c = pool.connect()
+                c.execute("INSERT INTO t (v) VALUES (?)", (f"{n}-{i}",))
+                c.commit()
+                c.close()
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        with pool.connect() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 400
+        assert pool.opened + pool.reused == 305 and pool.opened <= 7  # one connection per concurrent user
+        pool.close()
+
+test("Persistence: journal replay + compaction", test_journal_replay_and_compaction)
+test("Persistence: archive offset index + compaction", test_archive_index_and_compaction)
+test("Persistence: gravity warm restart + archive", test_gravity_warm_restart_and_archive)
+test("Persistence: engines restore without reseeding", test_engines_restore_without_reseeding)
+test("Persistence: pooled SQLite connections (WAL, reuse)", test_sqlite_pool_reuse_and_wal)
+
+def test_template_registry_precompile_reload():
+    import tempfile
+    from pathlib import Path
+    from modules.template_registry import TemplateRegistry
+    with tempfile.TemporaryDirectory() as tmp:
+        tpl = Path(tmp) / "tpl"
+        tpl.mkdir()
+        (tpl / "hello.j2").write_text("Hello {{ name }}")
+        (tpl / "bye.j2").write_text("Bye {{ name }}")
+        reg = TemplateRegistry(tpl, auto_reload=True, bytecode_dir=os.path.join(tmp, "bc"))
+        assert reg.precompile() == 2
+        assert any(Path(tmp, "bc").iterdir())  # Bytecode written to disk
+        assert reg.render("hello.j2", name="Mani") == "Hello Mani"
+        assert reg.env.get_template("hello.j2") is reg.env.get_template("hello.j2")  # Compiled once
+        (tpl / "hello.j2").write_text("Hi {{ name }}")
+        os.utime(tpl / "hello.j2", (2e9, 2e9))
+        assert reg.render("hello.j2", name="Mani") == "Hi Mani"  # Edited file picked up
+        stats = reg.stats()
+        assert stats["precompiled"] == 2 and stats["templates"]["hello.j2"]["renders"] == 2
+
+test("Templates: precompiled registry, bytecode cache, dev reload", test_template_registry_precompile_reload)
+
+
 # ══════════════════════════════════════════════════════════════════
 # 4. API SMOKE TESTS
 # ══════════════════════════════════════════════════════════════════
@@ -940,13 +1555,20 @@ def test_flask_app_creates():
     assert app is not None
 
 
-# Create app once for all API tests
+# Create app once for all API tests, journalling engines into a throwaway
+# directory rather than the real ~/.elaine/engines, and compiling templates
+# in memory only
 _test_app = None
 def _get_test_app():
     global _test_app
     if _test_app is None:
+        import atexit
+        import shutil
+        import tempfile
         from app import create_app
-        _test_app = create_app()
+        state_dir = tempfile.mkdtemp(prefix="elaine_test_engines_")
+        atexit.register(shutil.rmtree, state_dir, True)  # runs after the app's own atexit close
+        _test_app = create_app(engine_state_dir=state_dir, template_bytecode_dir=None)
     return _test_app
 
 
@@ -958,6 +1580,7 @@ def test_api_endpoints():
         ("GET", "/"),
         ("GET", "/api/status"),
         ("GET", "/api/system/config"),
+        ("GET", "/api/system/templates"),
         ("GET", "/api/morning-briefing"),
         ("GET", "/api/morning-briefing/voice"),
         ("GET", "/api/gravity/field"),
@@ -1033,6 +1656,11 @@ def test_api_post_endpoints():
     })
     assert resp.status_code == 200
 
+    # Gravity plan rejects hours it can't plan for
+    assert client.get("/api/gravity/plan?hours=4").status_code == 200
+    for bad in ("nan", "inf", "-1"):
+        assert client.get(f"/api/gravity/plan?hours={bad}").status_code == 400
+
 
 test("Flask: app creates", test_flask_app_creates)
 test("API: all GET endpoints return 200", test_api_endpoints)
@@ -18,7 +18,7 @@ def browser_context_args(browser_context_args):
 def app():
     """Create Flask app once for the entire test session."""
     from app import create_app
-    application = create_app()
+    application = create_app(engine_state_dir=None, template_bytecode_dir=None)  # nothing written under ~/.elaine
     application.config["TESTING"] = True
     return application
 